@@ -31,6 +31,7 @@ from jira_as import RateLimitError
 from jira_as import ServerError
 from jira_as import ValidationError
 from jira_as import get_jira_client
+from jira_as import json_utils
 from jira_as import print_error
 
 if TYPE_CHECKING:
@@ -189,7 +190,7 @@ def format_json_output(data: Any) -> str:
     Returns:
         JSON string with 2-space indentation
     """
-    return json.dumps(data, indent=2, default=str)
+    return json_utils.dumps(data, indent=True)
 
 
 # Alias for convenience
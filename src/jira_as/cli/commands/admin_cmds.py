@@ -13,6 +13,7 @@ Provides CLI commands for JIRA administration including:
 
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -40,21 +41,26 @@ from ..cli_utils import handle_jira_errors
 # =============================================================================
 
 
+_COMMA_RE = re.compile(r"\s*,\s*")
+
+
 def _parse_comma_list(value: str | None) -> list[str] | None:
     """Parse comma-separated values into a list."""
     if not value:
         return None
-    return [v.strip() for v in value.split(",") if v.strip()]
+    return [v for v in _COMMA_RE.split(value.strip()) if v]
 
 
 # Known system groups for highlighting
-SYSTEM_GROUPS = [
-    "jira-administrators",
-    "jira-users",
-    "jira-software-users",
-    "site-admins",
-    "atlassian-addons-admin",
-]
+SYSTEM_GROUPS: frozenset[str] = frozenset(
+    {
+        "jira-administrators",
+        "jira-users",
+        "jira-software-users",
+        "site-admins",
+        "atlassian-addons-admin",
+    }
+)
 
 
 def _is_system_group(group_name: str) -> bool:
@@ -1496,10 +1502,14 @@ def _get_workflow_for_issue_impl(
 
     def _do_work(c: "JiraClient") -> dict[str, Any]:
         issue = c.get_issue(issue_key, fields="project,issuetype,status")
-        project_key = issue["fields"]["project"]["key"]
+        project_id = issue["fields"]["project"]["id"]
         issue_type_id = issue["fields"]["issuetype"]["id"]
 
-        workflow_scheme = c.get_project_workflow_scheme(project_key)
+        # The endpoint takes a numeric project ID and returns one entry per
+        # matching scheme: {"values": [{"projectIds": [...], "workflowScheme": {}}]}
+        response = c.get_workflow_scheme_for_project(project_id)
+        values = response.get("values", [])
+        workflow_scheme = values[0].get("workflowScheme", {}) if values else {}
         workflow_name = None
 
         mappings = workflow_scheme.get("issueTypeMappings", {})
@@ -1593,7 +1603,7 @@ def _list_statuses_impl(
     """List all statuses."""
 
     def _do_work(c: "JiraClient") -> list[dict[str, Any]]:
-        return c.get_statuses()
+        return c.get_all_statuses()
 
     if client is not None:
         return _do_work(client)
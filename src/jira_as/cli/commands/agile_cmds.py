@@ -27,8 +27,9 @@ from __future__ import annotations
 
 import json
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from statistics import mean
+from statistics import fmean
 from statistics import stdev
 from typing import TYPE_CHECKING
 from typing import Any
@@ -74,6 +75,20 @@ VALID_EPIC_COLORS = [
 ]
 
 FIBONACCI_SEQUENCE = [0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89]
+_FIBONACCI_POINTS = frozenset(FIBONACCI_SEQUENCE)
+
+# Substrings that mark a description as Markdown ("*" also covers "**")
+MARKDOWN_MARKERS = ("*", "#", "`", "[")
+
+# Upper bound on concurrent per-sprint searches when calculating velocity
+VELOCITY_MAX_WORKERS = 8
+
+# Upper bound on concurrent story-point writes when estimating many issues
+ESTIMATE_MAX_WORKERS = 5
+
+# Page size for the point-summing searches in estimates and velocity; they
+# fetch only a few fields, so large pages mean fewer round trips
+POINTS_SEARCH_MAX_RESULTS = 500
 
 
 # =============================================================================
@@ -113,6 +128,49 @@ def _get_board_id_for_project(
     return board["id"]
 
 
+def _search_all_issues(
+    c: "JiraClient", jql: str, fields: list[str]
+) -> list[dict[str, Any]]:
+    """Collect every page of a JQL search, following nextPageToken."""
+    issues: list[dict[str, Any]] = []
+    next_token = None
+
+    while True:
+        result = c.search_issues(
+            jql,
+            fields=fields,
+            max_results=POINTS_SEARCH_MAX_RESULTS,
+            next_page_token=next_token,
+        )
+        issues.extend(result.get("issues", []))
+
+        next_token = result.get("nextPageToken")
+        if not next_token or result.get("isLast"):
+            return issues
+
+
+def _get_all_sprint_issues(
+    c: "JiraClient", sprint_id: int, fields: list[str]
+) -> list[dict[str, Any]]:
+    """Collect every page of a sprint's issues, following startAt/total."""
+    issues: list[dict[str, Any]] = []
+    start_at = 0
+
+    while True:
+        result = c.get_sprint_issues(
+            sprint_id,
+            fields=fields,
+            max_results=POINTS_SEARCH_MAX_RESULTS,
+            start_at=start_at,
+        )
+        page_issues = result.get("issues", [])
+        issues.extend(page_issues)
+
+        start_at += len(page_issues)
+        if not page_issues or start_at >= result.get("total", 0):
+            return issues
+
+
 def _parse_date_safe(date_str: str | None) -> str | None:
     """Parse date string into ISO format, converting ValueError to ValidationError."""
     if not date_str:
@@ -127,9 +185,7 @@ def _convert_description_to_adf(description: str) -> dict:
     """Convert description to ADF format."""
     if description.strip().startswith("{"):
         return json.loads(description)
-    elif "\n" in description or any(
-        md in description for md in ["**", "*", "#", "`", "["]
-    ):
+    elif "\n" in description or any(md in description for md in MARKDOWN_MARKERS):
         return markdown_to_adf(description)
     else:
         return text_to_adf(description)
@@ -807,7 +863,7 @@ def _estimate_issue_impl(
     if points is None:
         raise ValidationError("Story points value is required")
 
-    if validate_fibonacci and points not in FIBONACCI_SEQUENCE:
+    if validate_fibonacci and points not in _FIBONACCI_POINTS:
         raise ValidationError(
             f"Points {points} is not a valid Fibonacci value. Valid values: {FIBONACCI_SEQUENCE}"
         )
@@ -815,7 +871,7 @@ def _estimate_issue_impl(
     def _do_work(c: "JiraClient") -> dict[str, Any]:
         keys_to_update = issue_keys
         if jql and not keys_to_update:
-            search_result = c.search_issues(jql)
+            search_result = c.search_issues(jql, fields=["key"])
             keys_to_update = [issue["key"] for issue in search_result.get("issues", [])]
 
         if not keys_to_update:
@@ -825,12 +881,21 @@ def _estimate_issue_impl(
         story_points_field = get_agile_field("story_points")
         points_value = None if points == 0 else points
 
-        updated = 0
-        for key in validated_keys:
-            c.update_issue(key, {story_points_field: points_value})
-            updated += 1
+        # Each issue needs its own PUT; overlap the round trips
+        workers = min(ESTIMATE_MAX_WORKERS, len(validated_keys))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(
+                pool.map(
+                    lambda key: c.update_issue(key, {story_points_field: points_value}),
+                    validated_keys,
+                )
+            )
 
-        return {"updated": updated, "issues": validated_keys, "points": points}
+        return {
+            "updated": len(validated_keys),
+            "issues": validated_keys,
+            "points": points,
+        }
 
     if client is not None:
         return _do_work(client)
@@ -877,19 +942,17 @@ def _get_estimates_impl(
 
         agile_fields = get_agile_fields()
         story_points_field = agile_fields["story_points"]
+        # Only what the totals below read; avoids fetching every field
+        estimate_fields = ["status", "assignee", story_points_field]
 
         if sprint_id:
-            result = c.get_sprint_issues(sprint_id)
-            issues = result.get("issues", [])
+            issues = _get_all_sprint_issues(c, sprint_id, estimate_fields)
         else:
             # epic_key must be set since we checked above
             assert epic_key is not None
             epic_key = validate_issue_key(epic_key)
             jql = f'"Epic Link" = {epic_key}'
-            result = c.search_issues(
-                jql, fields=["summary", "status", "assignee", story_points_field]
-            )
-            issues = result.get("issues", [])
+            issues = _search_all_issues(c, jql, estimate_fields)
 
         total_points = 0
         by_status: dict[str, float] = defaultdict(float)
@@ -976,17 +1039,22 @@ def _get_velocity_impl(
         agile_fields = get_agile_fields()
         story_points_field = agile_fields["story_points"]
 
+        def _completed_issues(sprint: dict[str, Any]) -> list[dict[str, Any]]:
+            jql = f"sprint = {sprint['id']} AND status = Done"
+            return _search_all_issues(c, jql, [story_points_field])
+
+        # One search per sprint; they are independent, so overlap the round trips
+        sprint_issues: list[list[dict[str, Any]]] = []
+        if sorted_sprints:
+            workers = min(VELOCITY_MAX_WORKERS, len(sorted_sprints))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                sprint_issues = list(pool.map(_completed_issues, sorted_sprints))
+
         sprint_data = []
-        for sprint in sorted_sprints:
+        for sprint, issues in zip(sorted_sprints, sprint_issues):
             sp_id = sprint["id"]
             sprint_name_val = sprint.get("name", f"Sprint {sp_id}")
 
-            jql = f"sprint = {sp_id} AND status = Done"
-            search_result = c.search_issues(
-                jql, fields=["summary", "status", story_points_field], max_results=200
-            )
-            issues = search_result.get("issues", [])
-
             completed_points = 0
             completed_count = 0
             for issue in issues:
@@ -1015,11 +1083,14 @@ def _get_velocity_impl(
             )
 
         velocities = [s["completed_points"] for s in sprint_data]
-        avg_velocity = mean(velocities) if velocities else 0
+        total_pts = sum(velocities)
+        avg_velocity: float = fmean(velocities) if velocities else 0
+        # Like mean(), report a whole average of integer points as an int
+        if isinstance(total_pts, int) and float(avg_velocity).is_integer():
+            avg_velocity = int(avg_velocity)
         velocity_stdev = stdev(velocities) if len(velocities) > 1 else 0
         min_velocity = min(velocities) if velocities else 0
         max_velocity = max(velocities) if velocities else 0
-        total_pts = sum(velocities)
 
         return {
             "project_key": project_key,
@@ -1061,7 +1132,7 @@ def _create_subtask_impl(
     validated_parent_key = validate_issue_key(parent_key)
 
     def _do_work(c: "JiraClient") -> dict[str, Any]:
-        parent = c.get_issue(validated_parent_key)
+        parent = c.get_issue(validated_parent_key, fields=["issuetype", "project"])
 
         if parent["fields"]["issuetype"].get("subtask", False):
             raise ValidationError(
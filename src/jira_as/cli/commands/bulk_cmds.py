@@ -12,6 +12,8 @@ Commands:
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -51,6 +53,9 @@ STANDARD_PRIORITIES = [
     "Trivial",
 ]
 
+# Case-insensitive lookup for _validate_priority
+_PRIORITY_BY_LOWER = {p.lower(): p for p in STANDARD_PRIORITIES}
+
 # Fields to copy when cloning
 CLONE_FIELDS = [
     "summary",
@@ -64,6 +69,9 @@ CLONE_FIELDS = [
     "environment",
 ]
 
+# Upper bound for --concurrency; JIRA rate-limits aggressive clients
+MAX_BULK_CONCURRENCY = 10
+
 
 # =============================================================================
 # Helper Functions
@@ -132,6 +140,23 @@ def _find_transition(transitions: list[dict], target_status: str) -> dict | None
     return None
 
 
+def _workflow_step(issue: dict[str, Any]) -> tuple[str, str, str] | None:
+    """
+    Identify the workflow step an issue is at.
+
+    Issues in the same project, of the same type and in the same status are
+    offered the same transitions. Returns None when the issue was fetched
+    without those fields.
+    """
+    fields = issue.get("fields", {})
+    project_key = fields.get("project", {}).get("key")
+    issuetype_id = fields.get("issuetype", {}).get("id")
+    status_id = fields.get("status", {}).get("id")
+    if project_key and issuetype_id and status_id:
+        return (project_key, issuetype_id, status_id)
+    return None
+
+
 def _resolve_user_id(client, user_identifier: str) -> str | None:
     """Resolve a user identifier to an account ID."""
     if user_identifier is None:
@@ -161,9 +186,9 @@ def _resolve_user_id(client, user_identifier: str) -> str | None:
 
 def _validate_priority(priority: str) -> str:
     """Validate and normalize priority name."""
-    for std in STANDARD_PRIORITIES:
-        if std.lower() == priority.lower():
-            return std
+    normalized = _PRIORITY_BY_LOWER.get(priority.lower())
+    if normalized is not None:
+        return normalized
 
     raise ValidationError(
         f"Invalid priority: '{priority}'. "
@@ -171,6 +196,64 @@ def _validate_priority(priority: str) -> str:
     )
 
 
+def _run_in_pool(
+    issues: list[dict[str, Any]],
+    op: Callable[[str], None],
+    max_workers: int = 1,
+    delay: float = 0.1,
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Apply an operation to each issue, capturing failures per issue.
+
+    With a single worker the issues are processed sequentially with ``delay``
+    seconds between calls. With more workers the calls run in a thread pool
+    and each worker pauses ``delay`` seconds after its own calls.
+
+    Args:
+        issues: Issue dictionaries with a ``key`` entry
+        op: Callable invoked with each issue key
+        max_workers: Number of issues to process concurrently
+        delay: Seconds to pause between calls
+
+    Returns:
+        Tuple of (processed issue keys in input order, errors by issue key)
+    """
+    keys = [issue.get("key") for issue in issues]
+
+    def _apply(key: str) -> str | None:
+        try:
+            op(key)
+        except Exception as e:
+            return str(e)
+        return None
+
+    if max_workers <= 1 or len(keys) <= 1:
+        outcomes = []
+        for i, key in enumerate(keys, 1):
+            outcomes.append(_apply(key))
+            if i < len(keys) and delay > 0:
+                time.sleep(delay)
+    else:
+
+        def _apply_throttled(key: str) -> str | None:
+            outcome = _apply(key)
+            if delay > 0:
+                time.sleep(delay)
+            return outcome
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as pool:
+            outcomes = list(pool.map(_apply_throttled, keys))
+
+    processed: list[str] = []
+    errors: dict[str, str] = {}
+    for key, error in zip(keys, outcomes):
+        if error is None:
+            processed.append(key)
+        else:
+            errors[key] = error
+    return processed, errors
+
+
 # =============================================================================
 # Implementation Functions
 # =============================================================================
@@ -185,6 +268,7 @@ def _bulk_transition_impl(
     dry_run: bool = False,
     max_issues: int = 100,
     delay: float = 0.1,
+    concurrency: int = 1,
     client: JiraClient | None = None,
 ) -> dict[str, Any]:
     """Transition multiple issues to a new status."""
@@ -197,7 +281,7 @@ def _bulk_transition_impl(
             issue_keys=issue_keys,
             jql=jql,
             max_issues=max_issues,
-            fields=["key", "summary", "status"],
+            fields=["key", "summary", "status", "issuetype", "project"],
         )
 
         total = len(issues)
@@ -237,49 +321,52 @@ def _bulk_transition_impl(
                 "processed": [],
             }
 
-        success = 0
-        failed = 0
-        errors: dict[str, str] = {}
-        processed: list[str] = []
+        # Fetch the available transitions once per workflow step rather than
+        # once per issue; issues without step fields are looked up individually
+        step_by_key = {issue.get("key"): _workflow_step(issue) for issue in issues}
+        transitions_by_step: dict[tuple[str, str, str], list[dict]] = {}
 
-        for i, issue in enumerate(issues, 1):
-            issue_key = issue.get("key")
+        def _transition_one(issue_key: str) -> None:
+            step = step_by_key.get(issue_key)
+            transitions = transitions_by_step.get(step) if step else None
+            cached = transitions is not None
+            if transitions is None:
+                transitions = c.get_transitions(issue_key)
+                if step:
+                    transitions_by_step[step] = transitions
+            transition = _find_transition(transitions, target_status)
 
-            try:
+            # Jira only lists transitions whose conditions pass for that issue,
+            # so a miss on another issue's list must be confirmed for this one
+            if not transition and cached:
                 transitions = c.get_transitions(issue_key)
                 transition = _find_transition(transitions, target_status)
 
-                if not transition:
-                    available = [t["name"] for t in transitions]
-                    raise ValidationError(
-                        f"Transition to '{target_status}' not available. "
-                        f"Available: {', '.join(available)}"
-                    )
-
-                fields: dict[str, Any] = {}
-                if resolution:
-                    fields["resolution"] = {"name": resolution}
-
-                c.transition_issue(
-                    issue_key, transition["id"], fields=fields if fields else None
+            if not transition:
+                available = [t["name"] for t in transitions]
+                raise ValidationError(
+                    f"Transition to '{target_status}' not available. "
+                    f"Available: {', '.join(available)}"
                 )
 
-                if comment:
-                    c.add_comment(issue_key, text_to_adf(comment))
+            fields: dict[str, Any] = {}
+            if resolution:
+                fields["resolution"] = {"name": resolution}
 
-                success += 1
-                processed.append(issue_key)
+            c.transition_issue(
+                issue_key, transition["id"], fields=fields if fields else None
+            )
 
-            except Exception as e:
-                failed += 1
-                errors[issue_key] = str(e)
+            if comment:
+                c.add_comment(issue_key, text_to_adf(comment))
 
-            if i < total and delay > 0:
-                time.sleep(delay)
+        processed, errors = _run_in_pool(
+            issues, _transition_one, max_workers=concurrency, delay=delay
+        )
 
         return {
-            "success": success,
-            "failed": failed,
+            "success": len(processed),
+            "failed": len(errors),
             "total": total,
             "errors": errors,
             "processed": processed,
@@ -300,6 +387,7 @@ def _bulk_assign_impl(
     dry_run: bool = False,
     max_issues: int = 100,
     delay: float = 0.1,
+    concurrency: int = 1,
     client: JiraClient | None = None,
 ) -> dict[str, Any]:
     """Assign or unassign multiple issues."""
@@ -365,29 +453,16 @@ def _bulk_assign_impl(
                 "processed": [],
             }
 
-        success = 0
-        failed = 0
-        errors: dict[str, str] = {}
-        processed: list[str] = []
-
-        for i, issue in enumerate(issues, 1):
-            issue_key = issue.get("key")
-
-            try:
-                c.assign_issue(issue_key, account_id)
-                success += 1
-                processed.append(issue_key)
-
-            except Exception as e:
-                failed += 1
-                errors[issue_key] = str(e)
-
-            if i < total and delay > 0:
-                time.sleep(delay)
+        processed, errors = _run_in_pool(
+            issues,
+            lambda issue_key: c.assign_issue(issue_key, account_id),
+            max_workers=concurrency,
+            delay=delay,
+        )
 
         return {
-            "success": success,
-            "failed": failed,
+            "success": len(processed),
+            "failed": len(errors),
             "total": total,
             "errors": errors,
             "processed": processed,
@@ -408,6 +483,7 @@ def _bulk_set_priority_impl(
     dry_run: bool = False,
     max_issues: int = 100,
     delay: float = 0.1,
+    concurrency: int = 1,
     client: JiraClient | None = None,
 ) -> dict[str, Any]:
     """Set priority on multiple issues."""
@@ -461,33 +537,20 @@ def _bulk_set_priority_impl(
                 "processed": [],
             }
 
-        success = 0
-        failed = 0
-        errors: dict[str, str] = {}
-        processed: list[str] = []
-
-        for i, issue in enumerate(issues, 1):
-            issue_key = issue.get("key")
-
-            try:
-                c.update_issue(
-                    issue_key,
-                    fields={"priority": {"name": priority}},
-                    notify_users=False,
-                )
-                success += 1
-                processed.append(issue_key)
-
-            except Exception as e:
-                failed += 1
-                errors[issue_key] = str(e)
-
-            if i < total and delay > 0:
-                time.sleep(delay)
+        processed, errors = _run_in_pool(
+            issues,
+            lambda issue_key: c.update_issue(
+                issue_key,
+                fields={"priority": {"name": priority}},
+                notify_users=False,
+            ),
+            max_workers=concurrency,
+            delay=delay,
+        )
 
         return {
-            "success": success,
-            "failed": failed,
+            "success": len(processed),
+            "failed": len(errors),
             "total": total,
             "errors": errors,
             "processed": processed,
@@ -785,6 +848,7 @@ def _bulk_delete_impl(
     max_issues: int = 100,
     delete_subtasks: bool = True,
     delay: float = 0.1,
+    concurrency: int = 1,
     client: JiraClient | None = None,
 ) -> dict[str, Any]:
     """Delete multiple issues permanently."""
@@ -847,29 +911,18 @@ def _bulk_delete_impl(
                 "processed": [],
             }
 
-        success = 0
-        failed = 0
-        errors: dict[str, str] = {}
-        processed: list[str] = []
-
-        for i, issue in enumerate(issues, 1):
-            issue_key = issue.get("key")
-
-            try:
-                c.delete_issue(issue_key, delete_subtasks=delete_subtasks)
-                success += 1
-                processed.append(issue_key)
-
-            except Exception as e:
-                failed += 1
-                errors[issue_key] = str(e)
-
-            if i < total and delay > 0:
-                time.sleep(delay)
+        processed, errors = _run_in_pool(
+            issues,
+            lambda issue_key: c.delete_issue(
+                issue_key, delete_subtasks=delete_subtasks
+            ),
+            max_workers=concurrency,
+            delay=delay,
+        )
 
         return {
-            "success": success,
-            "failed": failed,
+            "success": len(processed),
+            "failed": len(errors),
             "total": total,
             "errors": errors,
             "processed": processed,
@@ -957,9 +1010,17 @@ def _format_bulk_result(result: dict, operation: str) -> str:
 
 
 @click.group()
-def bulk():
+@click.option(
+    "--concurrency",
+    type=click.IntRange(1, MAX_BULK_CONCURRENCY),
+    default=1,
+    help="Issues to process in parallel (clone always runs sequentially)",
+)
+@click.pass_context
+def bulk(ctx: click.Context, concurrency):
     """Commands for bulk operations on multiple issues."""
-    pass
+    ctx.ensure_object(dict)
+    ctx.obj["CONCURRENCY"] = concurrency
 
 
 @bulk.command(name="transition")
@@ -1018,6 +1079,7 @@ def bulk_transition(
         comment=comment,
         dry_run=dry_run or not yes,
         max_issues=max_issues,
+        concurrency=ctx.obj["CONCURRENCY"],
         client=client,
     )
 
@@ -1089,6 +1151,7 @@ def bulk_assign(
         unassign=unassign,
         dry_run=dry_run or not yes,
         max_issues=max_issues,
+        concurrency=ctx.obj["CONCURRENCY"],
         client=client,
     )
 
@@ -1151,6 +1214,7 @@ def bulk_set_priority(
         priority=priority,
         dry_run=dry_run or not yes,
         max_issues=max_issues,
+        concurrency=ctx.obj["CONCURRENCY"],
         client=client,
     )
 
@@ -1287,6 +1351,7 @@ def bulk_delete(
         dry_run=dry_run or not yes,
         max_issues=max_issues,
         delete_subtasks=not no_subtasks,
+        concurrency=ctx.obj["CONCURRENCY"],
         client=client,
     )
 
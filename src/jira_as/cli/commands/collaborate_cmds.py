@@ -1075,7 +1075,7 @@ def attachment_list(ctx, issue_key: str, output: str):
     attachments = _list_attachments_impl(issue_key, client=client)
 
     if output == "json":
-        click.echo(json.dumps(attachments, indent=2))
+        click.echo(format_json(attachments))
     else:
         click.echo(f"Attachments for {issue_key}:\n")
         click.echo(_format_attachment_list(attachments))
@@ -1204,7 +1204,7 @@ def collaborate_activity(
     )
 
     if output == "json":
-        click.echo(json.dumps(changes, indent=2))
+        click.echo(format_json(changes))
     else:
         filter_desc = ""
         if field:
@@ -634,7 +634,7 @@ def create_issue(
             output if output else (ctx.obj.get("OUTPUT", "text") if ctx.obj else "text")
         )
         if output_format == "json":
-            click.echo(json.dumps(result, indent=2))
+            click.echo(format_json(result))
         else:
             print_success(f"Created issue: {issue_key}")
             base_url = result.get("self", "").split("/rest/api/")[0]
@@ -1844,7 +1844,7 @@ def request_type_fields(ctx, service_desk_id: str, request_type_id: str, output:
     result = _get_request_type_fields_impl(service_desk_id, request_type_id)
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     else:
         click.echo(_format_request_type_fields(result))
 
@@ -1891,7 +1891,7 @@ def request_list(
     total = result.get("total", 0)
 
     if output == "json":
-        click.echo(json.dumps(issues, indent=2))
+        click.echo(format_json(issues))
     else:
         click.echo(_format_requests(issues))
         click.echo(f"\nTotal: {total} requests")
@@ -2104,7 +2104,7 @@ def request_comments(
     )
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     else:
         if not result:
             click.echo(f"No comments found for {issue_key}.")
@@ -2131,7 +2131,7 @@ def request_participants(ctx, issue_key: str, output: str):
     result = _get_participants_impl(issue_key)
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     else:
         click.echo(_format_participants(result))
 
@@ -2211,7 +2211,7 @@ def customer_list(
         return
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     else:
         click.echo(_format_customers(result))
 
@@ -2333,7 +2333,7 @@ def organization_list(ctx, start: int, limit: int, count: bool, output: str):
         return
 
     if output == "json":
-        click.echo(json.dumps(organizations, indent=2))
+        click.echo(format_json(organizations))
     elif output == "csv":
         click.echo("ID,Name")
         for org in organizations:
@@ -2527,7 +2527,7 @@ def queue_issues(
     issues = result.get("values", [])
 
     if output == "json":
-        click.echo(json.dumps(issues, indent=2))
+        click.echo(format_json(issues))
     else:
         click.echo(_format_requests(issues))
         click.echo(f"\nTotal: {len(issues)} issue(s)")
@@ -2569,7 +2569,7 @@ def sla_check_breach(ctx, issue_key: str, output: str):
     result = _check_sla_breach_impl(issue_key)
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     else:
         click.echo(_format_sla_breach_check(result))
 
@@ -2608,7 +2608,7 @@ def sla_report(
     )
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     elif output == "csv":
         click.echo(_format_sla_report_csv(result))
     else:
@@ -2636,7 +2636,7 @@ def approval_list(ctx, issue_key: str, output: str):
     result = _get_approvals_impl(issue_key)
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     else:
         click.echo(_format_approvals(result, issue_key))
 
@@ -2651,7 +2651,7 @@ def approval_pending(ctx, service_desk_id: int, output: str):
     result = _list_pending_approvals_impl(service_desk_id=service_desk_id)
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     else:
         click.echo(_format_pending_approvals(result))
 
@@ -2768,7 +2768,7 @@ def kb_search(ctx, service_desk: int, query: str, max_results: int, output: str)
     result = _search_kb_impl(service_desk, query, max_results)
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     else:
         click.echo(_format_kb_search_results(result))
 
@@ -2799,7 +2799,7 @@ def kb_suggest(ctx, issue_key: str, max_results: int, output: str):
     result = _suggest_kb_impl(issue_key, max_results)
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     else:
         click.echo(_format_kb_search_results(result))
 
@@ -2827,7 +2827,7 @@ def asset_list(ctx, object_type: str, iql: str, max_results: int, output: str):
     result = _list_assets_impl(object_type, iql, max_results)
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     else:
         click.echo(_format_assets(result))
 
@@ -2937,7 +2937,7 @@ def asset_find_affected(ctx, issue_key: str, output: str):
     result = _find_affected_assets_impl(issue_key)
 
     if output == "json":
-        click.echo(json.dumps(result, indent=2))
+        click.echo(format_json(result))
     else:
         if not result:
             click.echo(f"No assets found affected by {issue_key}")
@@ -13,7 +13,6 @@ Commands for issue workflow and lifecycle management:
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING
 from typing import Any
@@ -1053,7 +1052,7 @@ def version_list(ctx, project_key: str, unreleased: bool, archived: bool, output
     )
 
     if output == "json":
-        click.echo(json.dumps(versions, indent=2))
+        click.echo(format_json(versions))
     else:
         click.echo(f"Versions for project {project_key}:\n")
 
@@ -1211,7 +1210,7 @@ def component_list(ctx, project_key: str, output: str):
     components = _get_components_impl(project_key, client=client)
 
     if output == "json":
-        click.echo(json.dumps(components, indent=2))
+        click.echo(format_json(components))
     else:
         click.echo(f"Components for project {project_key}:\n")
 
@@ -7,7 +7,6 @@ All implementation functions are inlined for direct CLI usage.
 
 from __future__ import annotations
 
-import json
 from collections import defaultdict
 from typing import TYPE_CHECKING
 from typing import Any
@@ -1181,7 +1180,7 @@ def _format_blockers(result: dict[str, Any]) -> str:
 def _format_dependencies(result: dict[str, Any], output_format: str = "text") -> str:
     """Format dependencies for output."""
     if output_format == "json":
-        return json.dumps(result, indent=2)
+        return format_json(result)
 
     issue_key = result["issue_key"]
     dependencies = result.get("dependencies", [])
@@ -607,10 +607,12 @@ def _export_timesheets_impl(
                 comment_text = ""
                 comment = worklog.get("comment")
                 if comment and isinstance(comment, dict):
-                    for content in comment.get("content", []):
-                        for child in content.get("content", []):
-                            if child.get("type") == "text":
-                                comment_text += child.get("text", "")
+                    comment_text = "".join(
+                        child.get("text", "")
+                        for content in comment.get("content", [])
+                        for child in content.get("content", [])
+                        if child.get("type") == "text"
+                    )
 
                 entries.append(
                     {
@@ -14,6 +14,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from .error_handler import handle_jira_error
+from .json_utils import loads as json_loads
 
 
 class JiraClient:
@@ -123,7 +124,7 @@ class JiraClient:
             url, params=params, timeout=self.timeout, headers=headers
         )
         handle_jira_error(response, operation)
-        return response.json()
+        return json_loads(response.content)
 
     def post(
         self,
@@ -166,7 +167,7 @@ class JiraClient:
             return {}
 
         try:
-            return response.json()
+            return json_loads(response.content)
         except ValueError:
             return {}
 
@@ -198,7 +199,7 @@ class JiraClient:
             return {}
 
         try:
-            return response.json()
+            return json_loads(response.content)
         except ValueError:
             return {}
 
@@ -224,7 +225,7 @@ class JiraClient:
             return {}
 
         try:
-            return response.json()
+            return json_loads(response.content)
         except ValueError:
             return {}
 
@@ -257,26 +258,23 @@ class JiraClient:
 
         url = f"{self.base_url}{endpoint}"
 
-        # For file uploads, we need to NOT include the session's default
-        # Content-Type header (application/json). The requests library will
-        # automatically set the proper multipart/form-data Content-Type.
-        # We make a direct request instead of using the session to avoid
-        # the default Content-Type header interfering.
+        # Go through the session so the upload reuses its pooled connection.
+        # Setting Content-Type to None drops the session's application/json
+        # default, letting requests set the multipart/form-data boundary.
         with open(file_path, "rb") as f:
             files = {"file": (file_name, f)}
-            response = requests.post(
+            response = self.session.post(
                 url,
                 files=files,
-                auth=(self.email, self.api_token),
                 headers={
                     "X-Atlassian-Token": "no-check",
-                    "Accept": "application/json",
+                    "Content-Type": None,
                 },
                 timeout=self.timeout,
             )
 
         handle_jira_error(response, operation)
-        return response.json()
+        return json_loads(response.content)
 
     def download_file(
         self, url: str, output_path: str, operation: str = "download file"
@@ -782,6 +780,22 @@ class JiraClient:
             operation=f"move issues to sprint {sprint_id}",
         )
 
+    def move_issues_to_backlog(self, issue_keys: list) -> None:
+        """
+        Move issues to the backlog, removing them from any sprint.
+
+        Args:
+            issue_keys: List of issue keys to move
+
+        Raises:
+            JiraError or subclass on failure
+        """
+        self.post(
+            "/rest/agile/1.0/backlog/issue",
+            data={"issues": issue_keys},
+            operation="move issues to backlog",
+        )
+
     def get_board_backlog(
         self,
         board_id: int,
@@ -1407,7 +1421,7 @@ class JiraClient:
             url, json=payload, params=params, timeout=self.timeout
         )
         handle_jira_error(response, f"add worklog to {issue_key}")
-        return response.json()
+        return json_loads(response.content)
 
     def get_worklogs(
         self, issue_key: str, start_at: int = 0, max_results: int = 5000
@@ -1508,7 +1522,7 @@ class JiraClient:
             url, json=payload, params=params, timeout=self.timeout
         )
         handle_jira_error(response, f"update worklog {worklog_id}")
-        return response.json()
+        return json_loads(response.content)
 
     def delete_worklog(
         self,
@@ -3305,7 +3319,7 @@ class JiraClient:
         url = f"{self.base_url}{endpoint}"
         response = self.session.delete(url, json=payload, timeout=self.timeout)
         handle_jira_error(response, f"remove participants from request {issue_key}")
-        return response.json() if response.text else {}
+        return json_loads(response.content) if response.text else {}
 
     # ========== JSM Comments & Approvals (Phase 5) ==========
 
@@ -4433,7 +4447,7 @@ class JiraClient:
             url, json=payload, params=params if params else None, timeout=self.timeout
         )
         handle_jira_error(response, "bulk get workflows")
-        return response.json()
+        return json_loads(response.content)
 
     def get_workflow_schemes_for_workflow(
         self, workflow_id: str, start_at: int = 0, max_results: int = 50
@@ -4524,10 +4538,10 @@ class JiraClient:
         Get the workflow scheme assigned to a project.
 
         Args:
-            project_key_or_id: Project key or ID
+            project_key_or_id: Numeric project ID (the endpoint rejects keys)
 
         Returns:
-            Dict with 'workflowScheme' object for the project
+            Dict with a 'values' list of {'projectIds', 'workflowScheme'} entries
 
         Raises:
             JiraError or subclass on failure
@@ -5297,7 +5311,7 @@ class JiraClient:
             url, json={"accountId": account_id}, params=params, timeout=self.timeout
         )
         handle_jira_error(response, "add user to group")
-        return response.json()
+        return json_loads(response.content)
 
     def remove_user_from_group(
         self,
@@ -5721,7 +5735,7 @@ class JiraClient:
             )
 
         handle_jira_error(response, f"upload avatar for project {project_key}")
-        return response.json()
+        return json_loads(response.content)
 
     def delete_project_avatar(self, project_key: str, avatar_id: str) -> None:
         """
@@ -0,0 +1,74 @@
+"""
+JSON encoding and decoding helpers.
+
+Uses orjson when it is installed (``pip install jira-as[orjson]``) and falls
+back to the standard library otherwise. The two backends agree on layout,
+strings, integers and datetimes; see dumps() for where their output differs.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(data: Any, indent: bool = False, ensure_ascii: bool = False) -> str:
+    """
+    Serialize data to a JSON string.
+
+    Values that are not natively serializable, including datetimes, are
+    converted with ``str()``. Non-ASCII text is written as UTF-8, matching
+    ``jira_as.format_json``. Compact output has no spaces after separators.
+
+    With orjson, floats use the shortest form (``1e-7`` rather than
+    ``1e-07``), NaN and Infinity become ``null``, and Enum members are
+    written as their value rather than ``str()``.
+
+    Args:
+        data: Data to serialize
+        indent: Pretty-print with 2-space indentation
+        ensure_ascii: Escape non-ASCII as ``\\uXXXX`` (always uses the stdlib)
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE and not ensure_ascii:
+        # Route datetimes to default=str, matching the stdlib's "2024-01-15 10:30:00"
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=str, option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the stdlib handles
+            pass
+    if indent:
+        return json.dumps(data, indent=2, default=str, ensure_ascii=ensure_ascii)
+    return json.dumps(
+        data, separators=(",", ":"), default=str, ensure_ascii=ensure_ascii
+    )
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
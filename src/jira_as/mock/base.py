@@ -4,20 +4,36 @@ Contains MockJiraClientBase with essential issue, user, project, and transition
 operations that other mixins build upon.
 """
 
+import functools
 import os
+from bisect import bisect_left
 from typing import Any
 from typing import ClassVar
 
 
+@functools.lru_cache(maxsize=1)
 def is_mock_mode() -> bool:
     """Check if JIRA mock mode is enabled.
 
+    The result is cached for the lifetime of the process. Tests that toggle
+    JIRA_MOCK_MODE (e.g. via ``monkeypatch.setenv``) must call
+    ``is_mock_mode.cache_clear()`` afterwards.
+
     Returns:
         True if JIRA_MOCK_MODE environment variable is set to 'true'.
     """
     return os.environ.get("JIRA_MOCK_MODE", "").lower() == "true"
 
 
+# Key prefix of the JSM service desk issues served by the queue buckets
+_DEMOSD_PREFIX = "DEMOSD-"
+
+
+def _demosd_number(issue: dict[str, Any]) -> int:
+    """Return the numeric part of a DEMOSD issue key (its creation order)."""
+    return int(issue["key"][len(_DEMOSD_PREFIX) :])
+
+
 class MockJiraClientBase:
     """Base mock client with core JIRA operations.
 
@@ -25,8 +41,32 @@ class MockJiraClientBase:
     methods for issue CRUD, transitions, comments, worklogs, users, and projects.
 
     Mixins extend this class to add specialized functionality.
+
+    Instances use ``__slots__`` rather than a per-instance ``__dict__``. Every
+    attribute assigned by the base class or any mixin must be listed here;
+    mixins and composed clients declare empty ``__slots__``.
     """
 
+    __slots__ = (
+        "base_url",
+        "email",
+        "api_token",
+        "timeout",
+        "max_retries",
+        "retry_backoff",
+        "_next_issue_id",
+        "_issues",
+        "_comments",
+        "_worklogs",
+        "_demosd_issues",
+        "_demosd_unassigned",
+        "_demosd_assigned_to_me",
+        # Lazily created by mixins
+        "_watchers",
+        "_attachments",
+        "_issue_links",
+    )
+
     # =========================================================================
     # Class Constants - Users
     # =========================================================================
@@ -117,6 +157,13 @@ class MockJiraClientBase:
         self._comments: dict[str, list[dict]] = {}
         self._worklogs: dict[str, list[dict]] = {}
 
+        # DEMOSD queue buckets, kept in sync by _on_issue_change()
+        self._demosd_issues: list[dict] = []
+        self._demosd_unassigned: list[dict] = []
+        self._demosd_assigned_to_me: list[dict] = []
+        for issue_key in self._issues:
+            self._on_issue_change(issue_key)
+
     # =========================================================================
     # Verification Helpers
     # =========================================================================
@@ -158,6 +205,58 @@ class MockJiraClientBase:
 
         raise NotFoundError(f"Project {project_key} not found")
 
+    # =========================================================================
+    # Index Maintenance
+    # =========================================================================
+
+    def _on_issue_change(self, issue_key: str) -> None:
+        """Keep the DEMOSD queue buckets in sync after an issue mutation.
+
+        Must be called after an issue is created, deleted, or reassigned so
+        that JSM queue lookups can slice the buckets instead of scanning
+        every issue.
+
+        Args:
+            issue_key: The key of the created, updated, or deleted issue.
+        """
+        if not issue_key.startswith(_DEMOSD_PREFIX):
+            return
+        issue = self._issues.get(issue_key)
+        assignee = issue["fields"].get("assignee") if issue else None
+        number = int(issue_key[len(_DEMOSD_PREFIX) :])
+        self._sync_bucket(self._demosd_issues, issue, number, issue is not None)
+        self._sync_bucket(
+            self._demosd_unassigned,
+            issue,
+            number,
+            issue is not None and assignee is None,
+        )
+        self._sync_bucket(
+            self._demosd_assigned_to_me,
+            issue,
+            number,
+            (assignee or {}).get("accountId") == "abc123",
+        )
+
+    @staticmethod
+    def _sync_bucket(
+        bucket: list[dict],
+        issue: dict[str, Any] | None,
+        number: int,
+        member: bool,
+    ) -> None:
+        """Add or remove an issue, keeping the bucket in issue order.
+
+        Buckets are sorted by key number, which follows creation order, so
+        a reassigned issue goes back to its original position.
+        """
+        index = bisect_left(bucket, number, key=_demosd_number)
+        present = index < len(bucket) and _demosd_number(bucket[index]) == number
+        if member and issue is not None and not present:
+            bucket.insert(index, issue)
+        elif not member and present:
+            del bucket[index]
+
     # =========================================================================
     # Issue Factory Methods
     # =========================================================================
@@ -611,6 +710,7 @@ class MockJiraClientBase:
         }
 
         self._issues[issue_key] = new_issue
+        self._on_issue_change(issue_key)
         return {"key": issue_key, "id": issue_id, "self": new_issue["self"]}
 
     def create_issues_bulk(self, issue_updates: list[dict[str, Any]]) -> dict[str, Any]:
@@ -786,6 +886,8 @@ class MockJiraClientBase:
         self._verify_issue_exists(issue_key)
         if fields:
             self._issues[issue_key]["fields"].update(fields)
+            if "assignee" in fields:
+                self._on_issue_change(issue_key)
         return {}
 
     def delete_issue(self, issue_key: str, delete_subtasks: bool = True) -> None:
@@ -800,6 +902,7 @@ class MockJiraClientBase:
         """
         self._verify_issue_exists(issue_key)
         del self._issues[issue_key]
+        self._on_issue_change(issue_key)
 
     def assign_issue(self, issue_key: str, account_id: str | None = None) -> None:
         """Assign an issue to a user.
@@ -823,6 +926,7 @@ class MockJiraClientBase:
                 "accountId": account_id,
                 "displayName": "Unknown User",
             }
+        self._on_issue_change(issue_key)
 
     # =========================================================================
     # Transition Operations
@@ -48,7 +48,7 @@ class MockJiraClient(
     - Advanced JQL search and filters
     """
 
-    pass
+    __slots__ = ()
 
 
 # =============================================================================
@@ -66,7 +66,7 @@ class MockAgileClient(MockJiraClientBase, AgileMixin):
     - Epic operations
     """
 
-    pass
+    __slots__ = ()
 
 
 class MockJSMClient(MockJiraClientBase, JSMMixin):
@@ -80,7 +80,7 @@ class MockJSMClient(MockJiraClientBase, JSMMixin):
     - Customer management
     """
 
-    pass
+    __slots__ = ()
 
 
 class MockAdminClient(MockJiraClientBase, AdminMixin):
@@ -95,7 +95,7 @@ class MockAdminClient(MockJiraClientBase, AdminMixin):
     - Workflows
     """
 
-    pass
+    __slots__ = ()
 
 
 class MockSearchClient(MockJiraClientBase, SearchMixin):
@@ -108,7 +108,7 @@ class MockSearchClient(MockJiraClientBase, SearchMixin):
     - Export capabilities
     """
 
-    pass
+    __slots__ = ()
 
 
 class MockCollaborateClient(MockJiraClientBase, CollaborateMixin):
@@ -122,7 +122,7 @@ class MockCollaborateClient(MockJiraClientBase, CollaborateMixin):
     - Votes
     """
 
-    pass
+    __slots__ = ()
 
 
 class MockTimeClient(MockJiraClientBase, TimeTrackingMixin):
@@ -134,7 +134,7 @@ class MockTimeClient(MockJiraClientBase, TimeTrackingMixin):
     - Time reports
     """
 
-    pass
+    __slots__ = ()
 
 
 class MockRelationshipsClient(MockJiraClientBase, RelationshipsMixin):
@@ -147,7 +147,7 @@ class MockRelationshipsClient(MockJiraClientBase, RelationshipsMixin):
     - Dependency analysis
     """
 
-    pass
+    __slots__ = ()
 
 
 class MockDevClient(MockJiraClientBase, DevMixin):
@@ -160,7 +160,7 @@ class MockDevClient(MockJiraClientBase, DevMixin):
     - PR descriptions
     """
 
-    pass
+    __slots__ = ()
 
 
 class MockFieldsClient(MockJiraClientBase, FieldsMixin):
@@ -173,7 +173,7 @@ class MockFieldsClient(MockJiraClientBase, FieldsMixin):
     - Field configurations
     """
 
-    pass
+    __slots__ = ()
 
 
 # =============================================================================
@@ -187,7 +187,7 @@ class MockAgileSearchClient(MockJiraClientBase, AgileMixin, SearchMixin):
     Combines agile board/sprint operations with advanced search capabilities.
     """
 
-    pass
+    __slots__ = ()
 
 
 class MockJSMCollaborateClient(MockJiraClientBase, JSMMixin, CollaborateMixin):
@@ -197,7 +197,7 @@ class MockJSMCollaborateClient(MockJiraClientBase, JSMMixin, CollaborateMixin):
     watchers and notifications.
     """
 
-    pass
+    __slots__ = ()
 
 
 class MockFullDevClient(MockJiraClientBase, DevMixin, RelationshipsMixin, SearchMixin):
@@ -207,4 +207,4 @@ class MockFullDevClient(MockJiraClientBase, DevMixin, RelationshipsMixin, Search
     and search (for finding issues).
     """
 
-    pass
+    __slots__ = ()
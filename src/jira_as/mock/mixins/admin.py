@@ -24,6 +24,8 @@ class AdminMixin(_Base):
         - self.PROJECTS: List[Dict]
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Class Constants - Roles
     # =========================================================================
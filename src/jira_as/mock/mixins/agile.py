@@ -24,6 +24,8 @@ class AgileMixin(_Base):
         - self.USERS: Dict[str, Dict]
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Class Constants - Boards
     # =========================================================================
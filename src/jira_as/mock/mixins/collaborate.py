@@ -23,14 +23,20 @@ class CollaborateMixin(_Base):
         - self.USERS: Dict[str, Dict]
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Instance State
     # =========================================================================
 
     def _ensure_watchers_state(self):
-        """Ensure _watchers dict exists."""
+        """Ensure _watchers dict exists.
+
+        Watchers are stored per issue as an insertion-ordered mapping of
+        account ID to user dict, giving O(1) add/remove/membership.
+        """
         if not hasattr(self, "_watchers"):
-            self._watchers: dict[str, list[dict]] = {}
+            self._watchers: dict[str, dict[str, dict]] = {}
 
     def _ensure_attachments_state(self):
         """Ensure _attachments dict exists."""
@@ -57,7 +63,7 @@ class CollaborateMixin(_Base):
 
         self._verify_issue_exists(issue_key)
 
-        watchers = self._watchers.get(issue_key, [])
+        watchers = list(self._watchers.get(issue_key, {}).values())
 
         # Include reporter by default as a watcher
         if not watchers:
@@ -86,21 +92,17 @@ class CollaborateMixin(_Base):
 
         self._verify_issue_exists(issue_key)
 
-        if issue_key not in self._watchers:
-            self._watchers[issue_key] = []
-
-        # Get user info
-        user = self.USERS.get(
-            account_id,
-            {
-                "accountId": account_id,
-                "displayName": "Unknown User",
-            },
-        )
+        watchers = self._watchers.setdefault(issue_key, {})
 
         # Avoid duplicates
-        if not any(w.get("accountId") == account_id for w in self._watchers[issue_key]):
-            self._watchers[issue_key].append(user)
+        if account_id not in watchers:
+            watchers[account_id] = self.USERS.get(
+                account_id,
+                {
+                    "accountId": account_id,
+                    "displayName": "Unknown User",
+                },
+            )
 
     def remove_watcher(self, issue_key: str, account_id: str) -> None:
         """Remove a watcher from an issue.
@@ -117,9 +119,7 @@ class CollaborateMixin(_Base):
         self._verify_issue_exists(issue_key)
 
         if issue_key in self._watchers:
-            self._watchers[issue_key] = [
-                w for w in self._watchers[issue_key] if w.get("accountId") != account_id
-            ]
+            self._watchers[issue_key].pop(account_id, None)
 
     # =========================================================================
     # Changelog Operations
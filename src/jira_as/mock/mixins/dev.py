@@ -23,6 +23,8 @@ class DevMixin(_Base):
         - self.base_url: str
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Development Info Operations
     # =========================================================================
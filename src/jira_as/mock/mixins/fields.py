@@ -3,6 +3,7 @@
 Provides mock implementations for field metadata, screens, and custom fields.
 """
 
+import re
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
@@ -15,6 +16,11 @@ else:
     _Base = object
 
 
+# Route pattern for low-level GET dispatch (one match, no split() allocations).
+# Captures the last path segment, as endpoint.split("/")[-1] did.
+_RE_FIELD = re.compile(r"^/rest/api/3/field/(?:.*/)?([^/]*)$")
+
+
 class FieldsMixin(_Base):
     """Mixin providing field metadata functionality.
 
@@ -23,6 +29,8 @@ class FieldsMixin(_Base):
         - self.PROJECTS: List[Dict]
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # HTTP Endpoint Routing
     # =========================================================================
@@ -56,9 +64,9 @@ class FieldsMixin(_Base):
             return self.get_screens(start_at, max_results)
 
         # Route /rest/api/3/field/{fieldId} to get_field()
-        if endpoint.startswith("/rest/api/3/field/"):
-            field_id = endpoint.split("/")[-1]
-            return self.get_field(field_id)
+        match = _RE_FIELD.match(endpoint)
+        if match:
+            return self.get_field(match.group(1))
 
         # Delegate to parent class for other endpoints
         return super().get(endpoint, params, operation, headers)  # type: ignore[safe-super]
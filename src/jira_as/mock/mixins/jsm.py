@@ -3,6 +3,7 @@
 Provides mock implementations for service desk, request, SLA, and queue operations.
 """
 
+import sys
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
@@ -15,6 +16,30 @@ else:
     _Base = object
 
 
+def _intern_all(obj: Any) -> Any:
+    """Recursively intern string values in seed data, in place.
+
+    Args:
+        obj: A dict, list, or scalar from the class-level seed data.
+
+    Returns:
+        The same object, with every string value interned.
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            obj[key] = _intern_all(value)
+    elif isinstance(obj, list):
+        obj[:] = [_intern_all(item) for item in obj]
+    return obj
+
+
+def _intern_key(value: Any) -> Any:
+    """Intern an ID argument used for seed data lookups if it is a string."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class JSMMixin(_Base):
     """Mixin providing JSM service desk functionality.
 
@@ -25,6 +50,8 @@ class JSMMixin(_Base):
         - self.USERS: Dict[str, Dict]
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Class Constants - Service Desks
     # =========================================================================
@@ -282,25 +309,16 @@ class JSMMixin(_Base):
         Returns:
             A paginated list of issues in the queue.
         """
-        # Get all DEMOSD issues
-        demosd_issues = [
-            i for i in self._issues.values() if i["key"].startswith("DEMOSD-")
-        ]
-
-        # Filter based on queue type
+        # Pick the precomputed bucket for the queue type
         queue = self.get_queue(service_desk_id, queue_id)
         queue_name = queue.get("name", "").lower()
 
         if "unassigned" in queue_name:
-            demosd_issues = [
-                i for i in demosd_issues if i["fields"].get("assignee") is None
-            ]
+            demosd_issues = self._demosd_unassigned
         elif "assigned to me" in queue_name:
-            demosd_issues = [
-                i
-                for i in demosd_issues
-                if i["fields"].get("assignee", {}).get("accountId") == "abc123"
-            ]
+            demosd_issues = self._demosd_assigned_to_me
+        else:
+            demosd_issues = self._demosd_issues
 
         from ..factories import ResponseFactory
 
@@ -326,7 +344,7 @@ class JSMMixin(_Base):
         Returns:
             A paginated list of request types.
         """
-        types = self.REQUEST_TYPES.get(service_desk_id, [])
+        types = self.REQUEST_TYPES.get(_intern_key(service_desk_id), [])
 
         from ..factories import ResponseFactory
 
@@ -347,7 +365,7 @@ class JSMMixin(_Base):
         Raises:
             NotFoundError: If the request type is not found.
         """
-        types = self.REQUEST_TYPES.get(service_desk_id, [])
+        types = self.REQUEST_TYPES.get(_intern_key(service_desk_id), [])
         for rt in types:
             if rt["id"] == request_type_id:
                 return rt
@@ -481,6 +499,7 @@ class JSMMixin(_Base):
         issue_id = str(20000 + self._next_issue_id)
 
         # Get request type name
+        service_desk_id = _intern_key(service_desk_id)
         request_types = self.REQUEST_TYPES.get(service_desk_id, [])
         type_name = "IT help"
         for rt in request_types:
@@ -517,6 +536,7 @@ class JSMMixin(_Base):
         }
 
         self._issues[issue_key] = new_issue
+        self._on_issue_change(issue_key)
 
         return {
             "issueId": issue_id,
@@ -1070,3 +1090,14 @@ class JSMMixin(_Base):
 
         # Return mock response
         return self.get_request_participants(issue_key)
+
+
+for _seed in (
+    JSMMixin.SERVICE_DESKS,
+    JSMMixin.REQUEST_TYPES,
+    JSMMixin.QUEUES,
+    JSMMixin.SLAS,
+    JSMMixin.JSM_TRANSITIONS,
+):
+    _intern_all(_seed)
+del _seed
@@ -25,6 +25,8 @@ class RelationshipsMixin(_Base):
         - self.USERS: Dict[str, Dict]
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Class Constants - Link Types
     # =========================================================================
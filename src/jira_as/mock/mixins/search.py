@@ -25,6 +25,8 @@ class SearchMixin(_Base):
         - self.USERS: Dict[str, Dict]
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Class Constants - Saved Filters
     # =========================================================================
@@ -25,6 +25,8 @@ class TimeTrackingMixin(_Base):
         - self.USERS: Dict[str, Dict]
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Time Tracking Configuration
     # =========================================================================
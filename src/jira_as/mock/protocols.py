@@ -26,6 +26,9 @@ class MockClientProtocol(Protocol):
     _comments: dict[str, list[dict[str, Any]]]
     _worklogs: dict[str, list[dict[str, Any]]]
     _next_issue_id: int
+    _demosd_issues: list[dict[str, Any]]
+    _demosd_unassigned: list[dict[str, Any]]
+    _demosd_assigned_to_me: list[dict[str, Any]]
 
     # Verification helpers
     def _verify_issue_exists(self, issue_key: str) -> dict[str, Any]:
@@ -36,6 +39,11 @@ class MockClientProtocol(Protocol):
         """Verify project exists and return it."""
         ...
 
+    # Index maintenance
+    def _on_issue_change(self, issue_key: str) -> None:
+        """Keep derived issue indexes in sync after a mutation."""
+        ...
+
     # HTTP operations (used by mixins that route/extend requests)
     def get(
         self,
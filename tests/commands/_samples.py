@@ -0,0 +1,48 @@
+"""
+Shared sample payload loading for CLI command tests.
+
+Payloads live in fixtures/*.json rather than as literals in test modules,
+which keeps the modules pytest rewrites small. Each file is decoded once
+per session and its strings are interned. Every payload is registered so
+the conftest mutation guard can check it after each test.
+"""
+
+import functools
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _intern_strings(obj: Any) -> Any:
+    """Return obj with every dict key and string value interned.
+
+    Only strings are shared; each dict and list stays a distinct object, so
+    a deepcopy of a payload can be mutated without touching other entries.
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return {sys.intern(k): _intern_strings(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_strings(item) for item in obj]
+    return obj
+
+
+# id() of every payload handed out by a session-scoped sample_* fixture
+SHARED_SAMPLE_IDS: set[int] = set()
+
+
+def shared(value: Any) -> Any:
+    """Register a session-scoped sample payload for mutation checks."""
+    SHARED_SAMPLE_IDS.add(id(value))
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def load_sample(name: str) -> Any:
+    """Load a sample payload from fixtures/<name>, decoding it only once."""
+    data = json.loads((FIXTURES_DIR / name).read_text(encoding="utf-8"))
+    return shared(_intern_strings(data))
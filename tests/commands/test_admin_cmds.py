@@ -9,17 +9,19 @@ Tests cover:
 """
 
 import json
-from unittest.mock import MagicMock
-from unittest.mock import patch
+from copy import deepcopy
+from unittest.mock import Mock
+from unittest.mock import NonCallableMock
+from unittest.mock import call
 
 import pytest
-from click.testing import CliRunner
 
+from jira_as import AutomationClient
+from jira_as import JiraClient
 from jira_as import JiraError
 from jira_as import ValidationError
-from jira_as.cli.commands.admin_cmds import (
-    SYSTEM_GROUPS,  # Formatting functions; Automation implementation functions; Group implementation functions; Notification scheme implementation functions; Permission scheme implementation functions; Screen implementation functions; Helper functions; Click commands
-)
+from jira_as.cli.commands import admin_cmds
+from jira_as.cli.commands.admin_cmds import SYSTEM_GROUPS
 from jira_as.cli.commands.admin_cmds import _add_user_to_group_impl
 from jira_as.cli.commands.admin_cmds import _archive_project_impl
 from jira_as.cli.commands.admin_cmds import _assign_category_impl
@@ -75,229 +77,120 @@ from jira_as.cli.commands.admin_cmds import _toggle_automation_rule_impl
 from jira_as.cli.commands.admin_cmds import _update_project_impl
 from jira_as.cli.commands.admin_cmds import admin
 
+from ._samples import load_sample
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def mock_client():
-    """Create mock JIRA client with context manager support."""
-    client = MagicMock()
-    client.close = MagicMock()
+@pytest.fixture(scope="session")
+def _mock_client_template():
+    """Build the JIRA client mock once per session.
+
+    The mock is specced against JiraClient, so only real client methods
+    exist and no magic-method children are created on access. It replaces
+    the conftest template, so the shared mock_client fixture resets and
+    yields this one.
+    """
+    client = NonCallableMock(spec=JiraClient)
     # Support context manager pattern: with get_jira_client() as client:
-    client.__enter__ = MagicMock(return_value=client)
-    client.__exit__ = MagicMock(return_value=None)
+    client.__enter__ = Mock()
+    client.__exit__ = Mock()
     return client
 
 
+@pytest.fixture(scope="session")
+def _mock_automation_client_template():
+    """Build the automation client mock once per session."""
+    return NonCallableMock(spec=AutomationClient)
+
+
 @pytest.fixture
-def mock_automation_client():
-    """Create mock automation client."""
-    client = MagicMock()
-    client.close = MagicMock()
-    return client
+def mock_automation_client(_mock_automation_client_template):
+    """Mock automation client, reset for each test."""
+    _mock_automation_client_template.reset_mock(return_value=True, side_effect=True)
+    yield _mock_automation_client_template
+
+
+@pytest.fixture
+def patch_jira_client(monkeypatch, mock_client):
+    """Route admin_cmds.get_jira_client() to mock_client."""
+    monkeypatch.setattr(admin_cmds, "get_jira_client", lambda: mock_client)
 
 
 @pytest.fixture
+def patch_automation_client(monkeypatch, mock_automation_client):
+    """Route admin_cmds.get_automation_client() to mock_automation_client."""
+    monkeypatch.setattr(
+        admin_cmds, "get_automation_client", lambda: mock_automation_client
+    )
+
+
+@pytest.fixture
+def patch_client_from_context(monkeypatch, mock_client):
+    """Route admin_cmds.get_client_from_context() to mock_client."""
+    monkeypatch.setattr(admin_cmds, "get_client_from_context", lambda ctx: mock_client)
+
+
+@pytest.fixture(scope="session")
 def sample_projects():
     """Sample projects for testing."""
-    return {
-        "values": [
-            {
-                "id": "10001",
-                "key": "PROJ1",
-                "name": "Project One",
-                "projectTypeKey": "software",
-                "lead": {"displayName": "John Doe"},
-            },
-            {
-                "id": "10002",
-                "key": "PROJ2",
-                "name": "Project Two",
-                "projectTypeKey": "business",
-                "lead": {"displayName": "Jane Smith"},
-            },
-        ],
-        "isLast": True,
-        "total": 2,
-    }
+    return load_sample("admin/projects.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_project():
     """Sample project for testing."""
-    return {
-        "id": "10001",
-        "key": "TEST",
-        "name": "Test Project",
-        "projectTypeKey": "software",
-        "lead": {"displayName": "John Doe", "accountId": "user123"},
-        "description": "A test project",
-        "url": "https://jira.example.com/projects/TEST",
-    }
+    return load_sample("admin/project.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_users():
     """Sample users for testing."""
-    return [
-        {
-            "accountId": "user123",
-            "displayName": "John Doe",
-            "emailAddress": "john@example.com",
-            "active": True,
-        },
-        {
-            "accountId": "user456",
-            "displayName": "Jane Smith",
-            "emailAddress": "jane@example.com",
-            "active": True,
-        },
-        {
-            "accountId": "user789",
-            "displayName": "Inactive User",
-            "emailAddress": "inactive@example.com",
-            "active": False,
-        },
-    ]
+    return load_sample("admin/users.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_groups():
     """Sample groups for testing."""
-    return [
-        {"name": "jira-administrators", "groupId": "group1"},
-        {"name": "developers", "groupId": "group2"},
-        {"name": "jira-users", "groupId": "group3"},
-        {"name": "qa-team", "groupId": "group4"},
-    ]
+    return load_sample("admin/groups.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_automation_rules():
     """Sample automation rules for testing."""
-    return [
-        {
-            "id": "1",
-            "name": "Auto-assign bugs",
-            "state": "ENABLED",
-            "projects": [{"projectId": "10001", "projectName": "Test Project"}],
-            "trigger": {"type": "issue.created"},
-        },
-        {
-            "id": "2",
-            "name": "Close stale issues",
-            "state": "DISABLED",
-            "projects": [],
-            "trigger": {"type": "scheduled"},
-        },
-    ]
+    return load_sample("admin/automation_rules.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_permission_schemes():
     """Sample permission schemes for testing."""
-    return [
-        {
-            "id": "10000",
-            "name": "Default Permission Scheme",
-            "description": "Default permissions",
-        },
-        {
-            "id": "10001",
-            "name": "Restricted Scheme",
-            "description": "Restricted access",
-        },
-    ]
+    return load_sample("admin/permission_schemes.json")
 
 
-@pytest.fixture
-def sample_screens():
-    """Sample screens for testing."""
-    return [
-        {
-            "id": "1",
-            "name": "Default Screen",
-            "description": "Default issue screen",
-        },
-        {
-            "id": "2",
-            "name": "Bug Screen",
-            "description": "Screen for bugs",
-        },
-    ]
+@pytest.fixture(scope="session")
+def sample_admin_screens():
+    """Sample admin screens list (conftest sample_screens is the paged form)."""
+    return load_sample("admin/screens.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_issue_types():
     """Sample issue types for testing."""
-    return [
-        {
-            "id": "10001",
-            "name": "Bug",
-            "description": "A bug",
-            "subtask": False,
-            "scope": {"type": "PROJECT"},
-        },
-        {
-            "id": "10002",
-            "name": "Task",
-            "description": "A task",
-            "subtask": False,
-            "scope": {"type": "PROJECT"},
-        },
-        {
-            "id": "10003",
-            "name": "Sub-task",
-            "description": "A sub-task",
-            "subtask": True,
-            "scope": {"type": "PROJECT"},
-        },
-    ]
+    return load_sample("admin/issue_types.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_workflows():
     """Sample workflows for testing."""
-    return [
-        {
-            "name": "Default Workflow",
-            "description": "The default workflow",
-            "scope": {"type": "GLOBAL"},
-            "statuses": [
-                {"id": "1", "name": "Open"},
-                {"id": "2", "name": "In Progress"},
-                {"id": "3", "name": "Done"},
-            ],
-        },
-        {
-            "name": "Bug Workflow",
-            "description": "Workflow for bugs",
-            "scope": {"type": "PROJECT"},
-            "statuses": [
-                {"id": "1", "name": "Open"},
-                {"id": "4", "name": "Investigating"},
-                {"id": "3", "name": "Done"},
-            ],
-        },
-    ]
+    return load_sample("admin/workflows.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_statuses():
     """Sample statuses for testing."""
-    return [
-        {"id": "1", "name": "Open", "statusCategory": {"name": "To Do"}},
-        {"id": "2", "name": "In Progress", "statusCategory": {"name": "In Progress"}},
-        {"id": "3", "name": "Done", "statusCategory": {"name": "Done"}},
-    ]
-
-
-@pytest.fixture
-def cli_runner():
-    """Create CLI test runner."""
-    return CliRunner()
+    return load_sample("admin/statuses.json")
 
 
 # =============================================================================
@@ -308,42 +201,35 @@ def cli_runner():
 class TestHelperFunctions:
     """Tests for helper functions."""
 
-    def test_parse_comma_list_basic(self):
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("a,b,c", ["a", "b", "c"]),
+            (" a , b , c ", ["a", "b", "c"]),
+            ("", None),
+            (None, None),
+            ("single", ["single"]),
+        ],
+        ids=["basic", "with_spaces", "empty", "none", "single"],
+    )
+    def test_parse_comma_list(self, value, expected):
         """Test parsing comma-separated values."""
-        result = _parse_comma_list("a,b,c")
-        assert result == ["a", "b", "c"]
-
-    def test_parse_comma_list_with_spaces(self):
-        """Test parsing with spaces around values."""
-        result = _parse_comma_list(" a , b , c ")
-        assert result == ["a", "b", "c"]
-
-    def test_parse_comma_list_empty(self):
-        """Test parsing empty string returns None."""
-        result = _parse_comma_list("")
-        assert result is None
-
-    def test_parse_comma_list_none(self):
-        """Test parsing None returns None."""
-        result = _parse_comma_list(None)
-        assert result is None
-
-    def test_parse_comma_list_single(self):
-        """Test parsing single value."""
-        result = _parse_comma_list("single")
-        assert result == ["single"]
-
-    def test_is_system_group_true(self):
-        """Test system group detection - true cases."""
-        assert _is_system_group("jira-administrators") is True
-        assert _is_system_group("jira-users") is True
-        assert _is_system_group("site-admins") is True
-
-    def test_is_system_group_false(self):
-        """Test system group detection - false cases."""
-        assert _is_system_group("developers") is False
-        assert _is_system_group("qa-team") is False
-        assert _is_system_group("my-custom-group") is False
+        assert _parse_comma_list(value) == expected
+
+    @pytest.mark.parametrize(
+        "group_name,expected",
+        [
+            ("jira-administrators", True),
+            ("jira-users", True),
+            ("site-admins", True),
+            ("developers", False),
+            ("qa-team", False),
+            ("my-custom-group", False),
+        ],
+    )
+    def test_is_system_group(self, group_name, expected):
+        """Test system group detection."""
+        assert _is_system_group(group_name) is expected
 
     def test_system_groups_constant(self):
         """Test SYSTEM_GROUPS contains expected groups."""
@@ -356,25 +242,20 @@ class TestHelperFunctions:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client")
 class TestProjectImplementation:
     """Tests for project implementation functions."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_projects_impl(self, mock_get_client, mock_client, sample_projects):
+    def test_list_projects_impl(self, mock_client, sample_projects):
         """Test listing projects."""
-        mock_get_client.return_value = mock_client
         mock_client.search_projects.return_value = sample_projects
 
         result = _list_projects_impl()
 
         assert result == sample_projects
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_projects_with_query(
-        self, mock_get_client, mock_client, sample_projects
-    ):
+    def test_list_projects_with_query(self, mock_client, sample_projects):
         """Test listing projects with search query."""
-        mock_get_client.return_value = mock_client
         mock_client.search_projects.return_value = sample_projects
 
         _list_projects_impl(query="test")
@@ -383,12 +264,8 @@ class TestProjectImplementation:
         call_args = mock_client.search_projects.call_args
         assert call_args.kwargs["query"] == "test"
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_projects_include_archived(
-        self, mock_get_client, mock_client, sample_projects
-    ):
+    def test_list_projects_include_archived(self, mock_client, sample_projects):
         """Test listing projects including archived."""
-        mock_get_client.return_value = mock_client
         mock_client.search_projects.return_value = sample_projects
 
         _list_projects_impl(include_archived=True)
@@ -396,10 +273,8 @@ class TestProjectImplementation:
         call_args = mock_client.search_projects.call_args
         assert "archived" in call_args.kwargs["status"]
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_trash_projects_impl(self, mock_get_client, mock_client):
+    def test_list_trash_projects_impl(self, mock_client):
         """Test listing trashed projects."""
-        mock_get_client.return_value = mock_client
         mock_client.search_projects.return_value = {"values": [], "total": 0}
 
         _list_trash_projects_impl()
@@ -409,10 +284,8 @@ class TestProjectImplementation:
         call_args = mock_client.search_projects.call_args
         assert call_args.kwargs["status"] == ["deleted"]
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_get_project_impl(self, mock_get_client, mock_client, sample_project):
+    def test_get_project_impl(self, mock_client, sample_project):
         """Test getting a project."""
-        mock_get_client.return_value = mock_client
         mock_client.get_project.return_value = sample_project
 
         result = _get_project_impl("TEST")
@@ -420,29 +293,8 @@ class TestProjectImplementation:
         assert result == sample_project
         mock_client.get_project.assert_called_once_with("TEST", expand=None)
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    @patch("jira_as.cli.commands.admin_cmds.validate_project_key")
-    @patch("jira_as.cli.commands.admin_cmds.validate_project_name")
-    @patch("jira_as.cli.commands.admin_cmds.validate_project_type")
-    @patch("jira_as.cli.commands.admin_cmds.validate_project_template")
-    def test_create_project_impl(
-        self,
-        mock_validate_template,
-        mock_validate_type,
-        mock_validate_name,
-        mock_validate_key,
-        mock_get_client,
-        mock_client,
-        sample_project,
-    ):
+    def test_create_project_impl(self, mock_client, sample_project):
         """Test creating a project."""
-        mock_get_client.return_value = mock_client
-        mock_validate_key.return_value = "TEST"
-        mock_validate_name.return_value = "Test Project"
-        mock_validate_type.return_value = "software"
-        mock_validate_template.return_value = (
-            "com.pyxis.greenhopper.jira:gh-scrum-template"
-        )
         mock_client.create_project.return_value = sample_project
         mock_client.search_users.return_value = [{"accountId": "user123"}]
 
@@ -456,59 +308,52 @@ class TestProjectImplementation:
 
         assert result == sample_project
         mock_client.create_project.assert_called_once()
+        call_args = mock_client.create_project.call_args
+        assert call_args.kwargs["key"] == "TEST"
+        assert (
+            call_args.kwargs["template_key"]
+            == "com.pyxis.greenhopper.jira:gh-simplified-agility-scrum"
+        )
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_update_project_impl(self, mock_get_client, mock_client, sample_project):
+    def test_update_project_impl(self, mock_client, sample_project):
         """Test updating a project."""
-        mock_get_client.return_value = mock_client
         mock_client.update_project.return_value = sample_project
 
         _update_project_impl("TEST", name="New Name")
 
         mock_client.update_project.assert_called_once()
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_delete_project_impl_dry_run(
-        self, mock_get_client, mock_client, sample_project
-    ):
-        """Test deleting a project with dry run."""
-        mock_get_client.return_value = mock_client
-        mock_client.get_project.return_value = sample_project
-
-        result = _delete_project_impl("TEST", dry_run=True)
-
-        assert result["action"] == "dry_run"
-        assert result["would_delete"] is True
-        assert result["project"]["key"] == "TEST"
-        mock_client.delete_project.assert_not_called()
-
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_delete_project_impl_actual(
-        self, mock_get_client, mock_client, sample_project
+    @pytest.mark.parametrize(
+        "dry_run,expected_extra,delete_calls",
+        [
+            (True, {"action": "dry_run", "would_delete": True}, 0),
+            (False, {"action": "deleted"}, 1),
+        ],
+        ids=["dry_run", "actual"],
+    )
+    def test_delete_project_impl(
+        self, mock_client, sample_project, dry_run, expected_extra, delete_calls
     ):
-        """Test actually deleting a project."""
-        mock_get_client.return_value = mock_client
+        """Test deleting a project, with and without dry run."""
         mock_client.get_project.return_value = sample_project
         mock_client.delete_project.return_value = None
 
-        result = _delete_project_impl("TEST", dry_run=False)
+        result = _delete_project_impl("TEST", dry_run=dry_run)
 
-        assert result["action"] == "deleted"
-        mock_client.delete_project.assert_called_once_with("TEST")
+        assert result == {"project": sample_project, **expected_extra}
+        assert (
+            mock_client.delete_project.call_args_list == [call("TEST")] * delete_calls
+        )
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_archive_project_impl(self, mock_get_client, mock_client):
+    def test_archive_project_impl(self, mock_client):
         """Test archiving a project."""
-        mock_get_client.return_value = mock_client
 
         _archive_project_impl("TEST")
 
         mock_client.archive_project.assert_called_once_with("TEST")
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_restore_project_impl(self, mock_get_client, mock_client):
+    def test_restore_project_impl(self, mock_client):
         """Test restoring a project."""
-        mock_get_client.return_value = mock_client
 
         _restore_project_impl("TEST")
 
@@ -520,13 +365,12 @@ class TestProjectImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client")
 class TestCategoryImplementation:
     """Tests for category implementation functions."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_categories_impl(self, mock_get_client, mock_client):
+    def test_list_categories_impl(self, mock_client):
         """Test listing categories."""
-        mock_get_client.return_value = mock_client
         categories = [{"id": "1", "name": "Development"}]
         mock_client.get_project_categories.return_value = categories
 
@@ -535,10 +379,8 @@ class TestCategoryImplementation:
         assert result == categories
         mock_client.get_project_categories.assert_called_once()
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_create_category_impl(self, mock_get_client, mock_client):
+    def test_create_category_impl(self, mock_client):
         """Test creating a category."""
-        mock_get_client.return_value = mock_client
         new_category = {"id": "2", "name": "Testing"}
         mock_client.create_project_category.return_value = new_category
 
@@ -546,10 +388,8 @@ class TestCategoryImplementation:
 
         assert result == new_category
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_assign_category_impl(self, mock_get_client, mock_client, sample_project):
+    def test_assign_category_impl(self, mock_client, sample_project):
         """Test assigning category to project."""
-        mock_get_client.return_value = mock_client
         mock_client.update_project.return_value = sample_project
 
         _assign_category_impl("TEST", 1)
@@ -562,13 +402,12 @@ class TestCategoryImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client")
 class TestUserImplementation:
     """Tests for user implementation functions."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_search_users_impl(self, mock_get_client, mock_client, sample_users):
+    def test_search_users_impl(self, mock_client, sample_users):
         """Test searching users - default filters inactive."""
-        mock_get_client.return_value = mock_client
         mock_client.search_users.return_value = sample_users
 
         result = _search_users_impl("john")
@@ -577,12 +416,8 @@ class TestUserImplementation:
         assert len(result) == 2
         assert all(u["active"] for u in result)
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_search_users_impl_include_inactive(
-        self, mock_get_client, mock_client, sample_users
-    ):
+    def test_search_users_impl_include_inactive(self, mock_client, sample_users):
         """Test searching users including inactive."""
-        mock_get_client.return_value = mock_client
         mock_client.search_users.return_value = sample_users
 
         result = _search_users_impl("john", active_only=False)
@@ -590,25 +425,17 @@ class TestUserImplementation:
         # Should include all 3 users
         assert len(result) == 3
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_search_users_impl_with_groups(
-        self, mock_get_client, mock_client, sample_users
-    ):
+    def test_search_users_impl_with_groups(self, mock_client, sample_users):
         """Test searching users with group information."""
-        mock_get_client.return_value = mock_client
-        mock_client.search_users.return_value = sample_users[:1]
+        mock_client.search_users.return_value = deepcopy(sample_users[:1])
         mock_client.get_user_groups.return_value = [{"name": "developers"}]
 
         result = _search_users_impl("john", include_groups=True, active_only=False)
 
         assert result[0]["groups"] == ["developers"]
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_search_users_impl_assignable(
-        self, mock_get_client, mock_client, sample_users
-    ):
+    def test_search_users_impl_assignable(self, mock_client, sample_users):
         """Test searching assignable users for a project."""
-        mock_get_client.return_value = mock_client
         mock_client.find_assignable_users.return_value = sample_users[:2]
 
         result = _search_users_impl("john", project="TEST", assignable=True)
@@ -616,10 +443,8 @@ class TestUserImplementation:
         mock_client.find_assignable_users.assert_called_once()
         assert len(result) == 2
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_get_user_impl(self, mock_get_client, mock_client, sample_users):
+    def test_get_user_impl(self, mock_client, sample_users):
         """Test getting a user by account ID."""
-        mock_get_client.return_value = mock_client
         mock_client.get_user.return_value = sample_users[0]
 
         result = _get_user_impl("user123")
@@ -632,13 +457,12 @@ class TestUserImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client")
 class TestGroupImplementation:
     """Tests for group implementation functions."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_groups_impl(self, mock_get_client, mock_client, sample_groups):
+    def test_list_groups_impl(self, mock_client, sample_groups):
         """Test listing groups."""
-        mock_get_client.return_value = mock_client
         mock_client.find_groups.return_value = {"groups": sample_groups}
 
         result = _list_groups_impl()
@@ -646,12 +470,8 @@ class TestGroupImplementation:
         assert len(result) == 4
         mock_client.find_groups.assert_called_once()
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_groups_impl_with_query(
-        self, mock_get_client, mock_client, sample_groups
-    ):
+    def test_list_groups_impl_with_query(self, mock_client, sample_groups):
         """Test listing groups with query."""
-        mock_get_client.return_value = mock_client
         mock_client.find_groups.return_value = {"groups": sample_groups}
 
         _list_groups_impl(query="dev")
@@ -660,10 +480,8 @@ class TestGroupImplementation:
         call_args = mock_client.find_groups.call_args
         assert call_args.kwargs["query"] == "dev"
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_get_group_members_impl(self, mock_get_client, mock_client, sample_users):
+    def test_get_group_members_impl(self, mock_client, sample_users):
         """Test getting group members."""
-        mock_get_client.return_value = mock_client
         mock_client.get_group_members.return_value = {
             "values": sample_users,
             "isLast": True,
@@ -673,10 +491,8 @@ class TestGroupImplementation:
 
         mock_client.get_group_members.assert_called_once()
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_create_group_impl(self, mock_get_client, mock_client):
+    def test_create_group_impl(self, mock_client):
         """Test creating a group."""
-        mock_get_client.return_value = mock_client
         new_group = {"name": "new-team", "groupId": "group123"}
         mock_client.create_group.return_value = new_group
 
@@ -684,32 +500,30 @@ class TestGroupImplementation:
 
         assert result == new_group
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_delete_group_impl_dry_run(self, mock_get_client, mock_client):
-        """Test deleting a group with dry run."""
-        mock_get_client.return_value = mock_client
-
-        result = _delete_group_impl("developers", dry_run=True)
-
-        assert result["action"] == "dry_run"
-        assert result["would_delete"] is True
-        mock_client.delete_group.assert_not_called()
-
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_delete_group_impl_actual(self, mock_get_client, mock_client):
-        """Test actually deleting a group."""
-        mock_get_client.return_value = mock_client
+    @pytest.mark.parametrize(
+        "dry_run,expected_extra,delete_calls",
+        [
+            (True, {"action": "dry_run", "would_delete": True}, 0),
+            (False, {"action": "deleted"}, 1),
+        ],
+        ids=["dry_run", "actual"],
+    )
+    def test_delete_group_impl(
+        self, mock_client, dry_run, expected_extra, delete_calls
+    ):
+        """Test deleting a group, with and without dry run."""
         mock_client.delete_group.return_value = None
 
-        result = _delete_group_impl("developers", dry_run=False)
+        result = _delete_group_impl("developers", dry_run=dry_run)
 
-        assert result["action"] == "deleted"
-        mock_client.delete_group.assert_called_once()
+        assert result == {"group_name": "developers", **expected_extra}
+        assert (
+            mock_client.delete_group.call_args_list
+            == [call("developers")] * delete_calls
+        )
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_add_user_to_group_impl(self, mock_get_client, mock_client):
+    def test_add_user_to_group_impl(self, mock_client):
         """Test adding user to group."""
-        mock_get_client.return_value = mock_client
         mock_client.search_users.return_value = [{"accountId": "user123"}]
         mock_client.add_user_to_group.return_value = {"name": "developers"}
 
@@ -717,10 +531,8 @@ class TestGroupImplementation:
 
         mock_client.add_user_to_group.assert_called_once()
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_remove_user_from_group_impl(self, mock_get_client, mock_client):
+    def test_remove_user_from_group_impl(self, mock_client):
         """Test removing user from group."""
-        mock_get_client.return_value = mock_client
         mock_client.search_users.return_value = [{"accountId": "user123"}]
         mock_client.remove_user_from_group.return_value = None
 
@@ -734,15 +546,14 @@ class TestGroupImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_automation_client")
 class TestAutomationImplementation:
     """Tests for automation implementation functions."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_automation_client")
     def test_list_automation_rules_impl(
-        self, mock_get_client, mock_automation_client, sample_automation_rules
+        self, mock_automation_client, sample_automation_rules
     ):
         """Test listing automation rules."""
-        mock_get_client.return_value = mock_automation_client
         mock_automation_client.get_rules.return_value = {
             "values": sample_automation_rules,
             "hasMore": False,
@@ -753,12 +564,10 @@ class TestAutomationImplementation:
         assert len(result) == 2
         # Note: automation client doesn't call close()
 
-    @patch("jira_as.cli.commands.admin_cmds.get_automation_client")
     def test_list_automation_rules_impl_with_project(
-        self, mock_get_client, mock_automation_client, sample_automation_rules
+        self, mock_automation_client, sample_automation_rules
     ):
         """Test listing automation rules for a project."""
-        mock_get_client.return_value = mock_automation_client
         mock_automation_client.search_rules.return_value = {
             "values": sample_automation_rules,
             "hasMore": False,
@@ -769,10 +578,8 @@ class TestAutomationImplementation:
         mock_automation_client.search_rules.assert_called_once()
         assert len(result) == 2
 
-    @patch("jira_as.cli.commands.admin_cmds.get_automation_client")
-    def test_get_automation_rule_impl(self, mock_get_client, mock_automation_client):
+    def test_get_automation_rule_impl(self, mock_automation_client):
         """Test getting an automation rule."""
-        mock_get_client.return_value = mock_automation_client
         rule = {"id": "1", "name": "Test Rule"}
         mock_automation_client.get_rule.return_value = rule
 
@@ -780,10 +587,8 @@ class TestAutomationImplementation:
 
         assert result == rule
 
-    @patch("jira_as.cli.commands.admin_cmds.get_automation_client")
-    def test_enable_automation_rule_impl(self, mock_get_client, mock_automation_client):
+    def test_enable_automation_rule_impl(self, mock_automation_client):
         """Test enabling an automation rule."""
-        mock_get_client.return_value = mock_automation_client
         rule = {"id": "1", "state": "ENABLED"}
         mock_automation_client.enable_rule.return_value = rule
 
@@ -791,12 +596,8 @@ class TestAutomationImplementation:
 
         assert result == rule
 
-    @patch("jira_as.cli.commands.admin_cmds.get_automation_client")
-    def test_disable_automation_rule_impl(
-        self, mock_get_client, mock_automation_client
-    ):
+    def test_disable_automation_rule_impl(self, mock_automation_client):
         """Test disabling an automation rule."""
-        mock_get_client.return_value = mock_automation_client
         rule = {"id": "1", "state": "DISABLED"}
         mock_automation_client.disable_rule.return_value = rule
 
@@ -804,10 +605,8 @@ class TestAutomationImplementation:
 
         assert result == rule
 
-    @patch("jira_as.cli.commands.admin_cmds.get_automation_client")
-    def test_toggle_automation_rule_impl(self, mock_get_client, mock_automation_client):
+    def test_toggle_automation_rule_impl(self, mock_automation_client):
         """Test toggling an automation rule."""
-        mock_get_client.return_value = mock_automation_client
         mock_automation_client.get_rule.return_value = {"id": "1", "state": "ENABLED"}
         mock_automation_client.disable_rule.return_value = {
             "id": "1",
@@ -824,15 +623,12 @@ class TestAutomationImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client")
 class TestPermissionSchemeImplementation:
     """Tests for permission scheme implementation functions."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_permission_schemes_impl(
-        self, mock_get_client, mock_client, sample_permission_schemes
-    ):
+    def test_list_permission_schemes_impl(self, mock_client, sample_permission_schemes):
         """Test listing permission schemes."""
-        mock_get_client.return_value = mock_client
         mock_client.get_permission_schemes.return_value = {
             "permissionSchemes": sample_permission_schemes
         }
@@ -842,10 +638,8 @@ class TestPermissionSchemeImplementation:
         # Returns a list of schemes, not the whole dict
         assert len(result) == 2
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_get_permission_scheme_impl(self, mock_get_client, mock_client):
+    def test_get_permission_scheme_impl(self, mock_client):
         """Test getting a permission scheme."""
-        mock_get_client.return_value = mock_client
         scheme = {"id": "10000", "name": "Default"}
         mock_client.get_permission_scheme.return_value = scheme
 
@@ -854,10 +648,8 @@ class TestPermissionSchemeImplementation:
         # Returns {"scheme": scheme, ...}
         assert result["scheme"] == scheme
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_create_permission_scheme_impl(self, mock_get_client, mock_client):
+    def test_create_permission_scheme_impl(self, mock_client):
         """Test creating a permission scheme."""
-        mock_get_client.return_value = mock_client
         scheme = {"id": "10002", "name": "New Scheme"}
         mock_client.create_permission_scheme.return_value = scheme
 
@@ -871,13 +663,12 @@ class TestPermissionSchemeImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client")
 class TestNotificationSchemeImplementation:
     """Tests for notification scheme implementation functions."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_notification_schemes_impl(self, mock_get_client, mock_client):
+    def test_list_notification_schemes_impl(self, mock_client):
         """Test listing notification schemes."""
-        mock_get_client.return_value = mock_client
         schemes = [{"id": "1", "name": "Default Notifications"}]
         mock_client.get_notification_schemes.return_value = {"values": schemes}
 
@@ -885,10 +676,8 @@ class TestNotificationSchemeImplementation:
 
         assert len(result) == 1
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_get_notification_scheme_impl(self, mock_get_client, mock_client):
+    def test_get_notification_scheme_impl(self, mock_client):
         """Test getting a notification scheme."""
-        mock_get_client.return_value = mock_client
         scheme = {"id": "1", "name": "Default"}
         mock_client.get_notification_scheme.return_value = scheme
 
@@ -902,23 +691,20 @@ class TestNotificationSchemeImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client")
 class TestScreenImplementation:
     """Tests for screen implementation functions."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_screens_impl(self, mock_get_client, mock_client, sample_screens):
+    def test_list_screens_impl(self, mock_client, sample_admin_screens):
         """Test listing screens."""
-        mock_get_client.return_value = mock_client
-        mock_client.get_screens.return_value = {"values": sample_screens}
+        mock_client.get_screens.return_value = {"values": sample_admin_screens}
 
         result = _list_screens_impl()
 
         assert len(result) == 2
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_get_screen_impl(self, mock_get_client, mock_client):
+    def test_get_screen_impl(self, mock_client):
         """Test getting a screen."""
-        mock_get_client.return_value = mock_client
         screen = {"id": "1", "name": "Default Screen"}
         mock_client.get_screen.return_value = screen
 
@@ -926,10 +712,8 @@ class TestScreenImplementation:
 
         assert result == screen
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_screen_tabs_impl(self, mock_get_client, mock_client):
+    def test_list_screen_tabs_impl(self, mock_client):
         """Test listing screen tabs."""
-        mock_get_client.return_value = mock_client
         tabs = [{"id": "1", "name": "Field Tab"}]
         mock_client.get_screen_tabs.return_value = tabs
 
@@ -943,27 +727,20 @@ class TestScreenImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client")
 class TestIssueTypeImplementation:
     """Tests for issue type implementation functions."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_issue_types_impl(
-        self, mock_get_client, mock_client, sample_issue_types
-    ):
+    def test_list_issue_types_impl(self, mock_client, sample_issue_types):
         """Test listing issue types."""
-        mock_get_client.return_value = mock_client
         mock_client.get_issue_types.return_value = sample_issue_types
 
         result = _list_issue_types_impl()
 
         assert len(result) == 3
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_issue_types_impl_subtask_only(
-        self, mock_get_client, mock_client, sample_issue_types
-    ):
+    def test_list_issue_types_impl_subtask_only(self, mock_client, sample_issue_types):
         """Test listing only subtask issue types."""
-        mock_get_client.return_value = mock_client
         mock_client.get_issue_types.return_value = sample_issue_types
 
         result = _list_issue_types_impl(subtask_only=True)
@@ -971,10 +748,8 @@ class TestIssueTypeImplementation:
         assert len(result) == 1
         assert result[0]["name"] == "Sub-task"
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_get_issue_type_impl(self, mock_get_client, mock_client):
+    def test_get_issue_type_impl(self, mock_client):
         """Test getting an issue type."""
-        mock_get_client.return_value = mock_client
         issue_type = {"id": "10001", "name": "Bug"}
         mock_client.get_issue_type.return_value = issue_type
 
@@ -982,10 +757,8 @@ class TestIssueTypeImplementation:
 
         assert result == issue_type
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_create_issue_type_impl(self, mock_get_client, mock_client):
+    def test_create_issue_type_impl(self, mock_client):
         """Test creating an issue type."""
-        mock_get_client.return_value = mock_client
         issue_type = {"id": "10004", "name": "Feature"}
         mock_client.create_issue_type.return_value = issue_type
 
@@ -995,10 +768,8 @@ class TestIssueTypeImplementation:
 
         assert result == issue_type
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_delete_issue_type_impl(self, mock_get_client, mock_client):
+    def test_delete_issue_type_impl(self, mock_client):
         """Test deleting an issue type."""
-        mock_get_client.return_value = mock_client
         mock_client.delete_issue_type.return_value = None
 
         _delete_issue_type_impl("10004")
@@ -1011,13 +782,12 @@ class TestIssueTypeImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client")
 class TestWorkflowImplementation:
     """Tests for workflow implementation functions."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_workflows_impl(self, mock_get_client, mock_client, sample_workflows):
+    def test_list_workflows_impl(self, mock_client, sample_workflows):
         """Test listing workflows."""
-        mock_get_client.return_value = mock_client
         mock_client.get_workflows.return_value = sample_workflows
 
         result = _list_workflows_impl()
@@ -1025,10 +795,8 @@ class TestWorkflowImplementation:
         # Returns a dict with "workflows" key
         assert "workflows" in result
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_get_workflow_impl(self, mock_get_client, mock_client, sample_workflows):
+    def test_get_workflow_impl(self, mock_client, sample_workflows):
         """Test getting a workflow."""
-        mock_get_client.return_value = mock_client
         # search_workflows returns {"values": [...]}
         mock_client.search_workflows.return_value = {"values": [sample_workflows[0]]}
 
@@ -1036,35 +804,53 @@ class TestWorkflowImplementation:
 
         assert result["name"] == "Default Workflow"
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_get_workflow_for_issue_impl(
-        self, mock_get_client, mock_client, sample_workflows
-    ):
+    def test_get_workflow_for_issue_impl(self, mock_client, sample_workflows):
         """Test getting workflow for an issue."""
-        mock_get_client.return_value = mock_client
         mock_client.get_issue.return_value = {
             "key": "TEST-1",
             "fields": {
-                "project": {"key": "TEST"},
+                "project": {"id": "10000", "key": "TEST"},
                 "issuetype": {"id": "10001"},
                 "status": {"name": "Open"},
             },
         }
-        mock_client.get_project_workflow_scheme.return_value = {
-            "defaultWorkflow": "Default Workflow",
-            "issueTypeMappings": {},
+        mock_client.get_workflow_scheme_for_project.return_value = {
+            "values": [
+                {
+                    "projectIds": ["10000"],
+                    "workflowScheme": {
+                        "defaultWorkflow": "Default Workflow",
+                        "issueTypeMappings": {},
+                    },
+                }
+            ]
         }
         mock_client.search_workflows.return_value = {"values": [sample_workflows[0]]}
 
         result = _get_workflow_for_issue_impl("TEST-1")
 
         assert result["name"] == "Default Workflow"
+        mock_client.get_workflow_scheme_for_project.assert_called_once_with("10000")
+
+    def test_get_workflow_for_issue_impl_no_scheme(self, mock_client):
+        """Test an empty workflow scheme response reports no workflow."""
+        mock_client.get_issue.return_value = {
+            "key": "TEST-1",
+            "fields": {
+                "project": {"id": "10000", "key": "TEST"},
+                "issuetype": {"id": "10001"},
+                "status": {"name": "Open"},
+            },
+        }
+        mock_client.get_workflow_scheme_for_project.return_value = {"values": []}
+
+        result = _get_workflow_for_issue_impl("TEST-1")
 
-    @patch("jira_as.cli.commands.admin_cmds.get_jira_client")
-    def test_list_statuses_impl(self, mock_get_client, mock_client, sample_statuses):
+        assert result == {"issue_key": "TEST-1", "workflow": None}
+
+    def test_list_statuses_impl(self, mock_client, sample_statuses):
         """Test listing statuses."""
-        mock_get_client.return_value = mock_client
-        mock_client.get_statuses.return_value = sample_statuses
+        mock_client.get_all_statuses.return_value = sample_statuses
 
         result = _list_statuses_impl()
 
@@ -1079,26 +865,80 @@ class TestWorkflowImplementation:
 class TestFormattingFunctions:
     """Tests for formatting functions."""
 
-    def test_format_projects(self, sample_projects):
-        """Test formatting projects list."""
-        result = _format_projects(sample_projects)
+    @pytest.mark.parametrize(
+        ("formatter", "fixture", "kwargs", "expected"),
+        [
+            (_format_projects, "sample_projects", {}, ["PROJ1", "PROJ2"]),
+            (
+                _format_project,
+                "sample_project",
+                {},
+                ["TEST", "Test Project", "John Doe"],
+            ),
+            (_format_users, "sample_users", {}, ["John Doe", "Jane Smith"]),
+            (
+                _format_groups,
+                "sample_groups",
+                {},
+                ["developers", "jira-administrators"],
+            ),
+            (
+                _format_groups,
+                "sample_groups",
+                {"show_system": True},
+                ["jira-administrators", "jira-users"],
+            ),
+            (
+                _format_permission_schemes,
+                "sample_permission_schemes",
+                {},
+                ["Default Permission Scheme", "Restricted Scheme"],
+            ),
+            (
+                _format_screens,
+                "sample_admin_screens",
+                {},
+                ["Default Screen", "Bug Screen"],
+            ),
+            (
+                _format_issue_types,
+                "sample_issue_types",
+                {},
+                ["Bug", "Task", "Sub-task"],
+            ),
+            (
+                _format_workflows,
+                "sample_workflows",
+                {},
+                ["Default Workflow", "Bug Workflow"],
+            ),
+            (_format_statuses, "sample_statuses", {}, ["Open", "In Progress", "Done"]),
+        ],
+        ids=[
+            "projects",
+            "project",
+            "users",
+            "groups",
+            "groups_show_system",
+            "permission_schemes",
+            "screens",
+            "issue_types",
+            "workflows",
+            "statuses",
+        ],
+    )
+    def test_format(self, formatter, fixture, kwargs, expected, request):
+        """Test formatters render the expected names from sample data."""
+        result = formatter(request.getfixturevalue(fixture), **kwargs)
 
-        assert "PROJ1" in result
-        assert "PROJ2" in result
+        for text in expected:
+            assert text in result
 
     def test_format_projects_empty(self):
         """Test formatting empty projects list."""
         result = _format_projects({"values": [], "total": 0})
         assert "No projects found" in result
 
-    def test_format_project(self, sample_project):
-        """Test formatting single project."""
-        result = _format_project(sample_project)
-
-        assert "TEST" in result
-        assert "Test Project" in result
-        assert "John Doe" in result
-
     def test_format_categories(self):
         """Test formatting categories."""
         categories = [
@@ -1110,78 +950,20 @@ class TestFormattingFunctions:
         assert "Development" in result
         assert "Support" in result
 
-    def test_format_users(self, sample_users):
-        """Test formatting users."""
-        result = _format_users(sample_users)
-
-        assert "John Doe" in result
-        assert "Jane Smith" in result
-
     def test_format_users_with_groups(self, sample_users):
         """Test formatting users with groups."""
-        sample_users[0]["groups"] = ["developers", "qa-team"]
-        result = _format_users(sample_users, show_groups=True)
-
-        assert "developers" in result
-
-    def test_format_groups(self, sample_groups):
-        """Test formatting groups."""
-        result = _format_groups(sample_groups)
+        users = deepcopy(sample_users)
+        users[0]["groups"] = ["developers", "qa-team"]
+        result = _format_users(users, show_groups=True)
 
         assert "developers" in result
-        assert "jira-administrators" in result
-
-    def test_format_groups_show_system(self, sample_groups):
-        """Test formatting groups with system flag."""
-        result = _format_groups(sample_groups, show_system=True)
-
-        # System groups should be shown
-        assert "jira-administrators" in result
-        assert "jira-users" in result
 
     def test_format_automation_rules(self, sample_automation_rules):
         """Test formatting automation rules."""
         result = _format_automation_rules(sample_automation_rules)
 
         assert "Auto-assign bugs" in result
-        assert "ENABLED" in result or "enabled" in result.lower()
-
-    def test_format_permission_schemes(self, sample_permission_schemes):
-        """Test formatting permission schemes."""
-        result = _format_permission_schemes(sample_permission_schemes)
-
-        assert "Default Permission Scheme" in result
-        assert "Restricted Scheme" in result
-
-    def test_format_screens(self, sample_screens):
-        """Test formatting screens."""
-        result = _format_screens(sample_screens)
-
-        assert "Default Screen" in result
-        assert "Bug Screen" in result
-
-    def test_format_issue_types(self, sample_issue_types):
-        """Test formatting issue types."""
-        result = _format_issue_types(sample_issue_types)
-
-        assert "Bug" in result
-        assert "Task" in result
-        assert "Sub-task" in result
-
-    def test_format_workflows(self, sample_workflows):
-        """Test formatting workflows."""
-        result = _format_workflows(sample_workflows)
-
-        assert "Default Workflow" in result
-        assert "Bug Workflow" in result
-
-    def test_format_statuses(self, sample_statuses):
-        """Test formatting statuses."""
-        result = _format_statuses(sample_statuses)
-
-        assert "Open" in result
-        assert "In Progress" in result
-        assert "Done" in result
+        assert "enabled" in result.lower()
 
 
 # =============================================================================
@@ -1189,15 +971,12 @@ class TestFormattingFunctions:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_client_from_context")
 class TestProjectCLI:
     """Tests for project CLI commands."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_project_list_command(
-        self, mock_get_client, mock_client, sample_projects, cli_runner
-    ):
+    def test_project_list_command(self, mock_client, sample_projects, cli_runner):
         """Test project list command."""
-        mock_get_client.return_value = mock_client
         mock_client.search_projects.return_value = sample_projects
 
         result = cli_runner.invoke(admin, ["project", "list"])
@@ -1205,12 +984,8 @@ class TestProjectCLI:
         assert result.exit_code == 0
         assert "PROJ1" in result.output
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_project_list_json_output(
-        self, mock_get_client, mock_client, sample_projects, cli_runner
-    ):
+    def test_project_list_json_output(self, mock_client, sample_projects, cli_runner):
         """Test project list with JSON output."""
-        mock_get_client.return_value = mock_client
         mock_client.search_projects.return_value = sample_projects
 
         result = cli_runner.invoke(admin, ["project", "list", "--output", "json"])
@@ -1219,12 +994,8 @@ class TestProjectCLI:
         data = json.loads(result.output)
         assert "values" in data
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_project_get_command(
-        self, mock_get_client, mock_client, sample_project, cli_runner
-    ):
+    def test_project_get_command(self, mock_client, sample_project, cli_runner):
         """Test project get command."""
-        mock_get_client.return_value = mock_client
         mock_client.get_project.return_value = sample_project
 
         result = cli_runner.invoke(admin, ["project", "get", "TEST"])
@@ -1238,15 +1009,12 @@ class TestProjectCLI:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_client_from_context")
 class TestUserCLI:
     """Tests for user CLI commands."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_user_search_command(
-        self, mock_get_client, mock_client, sample_users, cli_runner
-    ):
+    def test_user_search_command(self, mock_client, sample_users, cli_runner):
         """Test user search command."""
-        mock_get_client.return_value = mock_client
         mock_client.search_users.return_value = sample_users
 
         result = cli_runner.invoke(admin, ["user", "search", "john"])
@@ -1254,12 +1022,8 @@ class TestUserCLI:
         assert result.exit_code == 0
         assert "John Doe" in result.output
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_user_get_command(
-        self, mock_get_client, mock_client, sample_users, cli_runner
-    ):
+    def test_user_get_command(self, mock_client, sample_users, cli_runner):
         """Test user get command."""
-        mock_get_client.return_value = mock_client
         mock_client.get_user.return_value = sample_users[0]
 
         result = cli_runner.invoke(admin, ["user", "get", "user123"])
@@ -1273,15 +1037,12 @@ class TestUserCLI:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_client_from_context")
 class TestGroupCLI:
     """Tests for group CLI commands."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_group_list_command(
-        self, mock_get_client, mock_client, sample_groups, cli_runner
-    ):
+    def test_group_list_command(self, mock_client, sample_groups, cli_runner):
         """Test group list command."""
-        mock_get_client.return_value = mock_client
         mock_client.find_groups.return_value = {"groups": sample_groups}
 
         result = cli_runner.invoke(admin, ["group", "list"])
@@ -1289,10 +1050,8 @@ class TestGroupCLI:
         assert result.exit_code == 0
         assert "developers" in result.output
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_group_create_command(self, mock_get_client, mock_client, cli_runner):
+    def test_group_create_command(self, mock_client, cli_runner):
         """Test group create command."""
-        mock_get_client.return_value = mock_client
         mock_client.create_group.return_value = {"name": "new-team", "groupId": "123"}
 
         result = cli_runner.invoke(admin, ["group", "create", "new-team"])
@@ -1300,10 +1059,8 @@ class TestGroupCLI:
         assert result.exit_code == 0
         assert "new-team" in result.output
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_group_delete_dry_run(self, mock_get_client, mock_client, cli_runner):
+    def test_group_delete_dry_run(self, mock_client, cli_runner):
         """Test group delete with dry run."""
-        mock_get_client.return_value = mock_client
 
         result = cli_runner.invoke(
             admin, ["group", "delete", "developers", "--dry-run"]
@@ -1318,19 +1075,17 @@ class TestGroupCLI:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_automation_client")
 class TestAutomationCLI:
     """Tests for automation CLI commands."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_automation_client")
     def test_automation_list_command(
         self,
-        mock_get_client,
         mock_automation_client,
         sample_automation_rules,
         cli_runner,
     ):
         """Test automation list command."""
-        mock_get_client.return_value = mock_automation_client
         mock_automation_client.get_rules.return_value = {
             "values": sample_automation_rules,
             "hasMore": False,
@@ -1341,12 +1096,8 @@ class TestAutomationCLI:
         assert result.exit_code == 0
         assert "Auto-assign bugs" in result.output
 
-    @patch("jira_as.cli.commands.admin_cmds.get_automation_client")
-    def test_automation_enable_command(
-        self, mock_get_client, mock_automation_client, cli_runner
-    ):
+    def test_automation_enable_command(self, mock_automation_client, cli_runner):
         """Test automation enable command."""
-        mock_get_client.return_value = mock_automation_client
         mock_automation_client.enable_rule.return_value = {
             "id": "1",
             "state": "ENABLED",
@@ -1362,15 +1113,12 @@ class TestAutomationCLI:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_client_from_context")
 class TestIssueTypeCLI:
     """Tests for issue type CLI commands."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_issue_type_list_command(
-        self, mock_get_client, mock_client, sample_issue_types, cli_runner
-    ):
+    def test_issue_type_list_command(self, mock_client, sample_issue_types, cli_runner):
         """Test issue type list command."""
-        mock_get_client.return_value = mock_client
         mock_client.get_issue_types.return_value = sample_issue_types
 
         result = cli_runner.invoke(admin, ["issue-type", "list"])
@@ -1385,15 +1133,12 @@ class TestIssueTypeCLI:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_client_from_context")
 class TestWorkflowCLI:
     """Tests for workflow CLI commands."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_workflow_list_command(
-        self, mock_get_client, mock_client, sample_workflows, cli_runner
-    ):
+    def test_workflow_list_command(self, mock_client, sample_workflows, cli_runner):
         """Test workflow list command."""
-        mock_get_client.return_value = mock_client
         mock_client.get_workflows.return_value = sample_workflows
 
         result = cli_runner.invoke(admin, ["workflow", "list"])
@@ -1406,16 +1151,13 @@ class TestWorkflowCLI:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_client_from_context")
 class TestStatusCLI:
     """Tests for status CLI commands."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_status_list_command(
-        self, mock_get_client, mock_client, sample_statuses, cli_runner
-    ):
+    def test_status_list_command(self, mock_client, sample_statuses, cli_runner):
         """Test status list command."""
-        mock_get_client.return_value = mock_client
-        mock_client.get_statuses.return_value = sample_statuses
+        mock_client.get_all_statuses.return_value = sample_statuses
 
         result = cli_runner.invoke(admin, ["status", "list"])
 
@@ -1429,25 +1171,28 @@ class TestStatusCLI:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_client_from_context")
 class TestErrorHandling:
     """Tests for error handling in CLI commands."""
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_jira_error_handling(self, mock_get_client, mock_client, cli_runner):
-        """Test JiraError handling in CLI."""
-        mock_get_client.return_value = mock_client
+    def test_jira_error_handling(self, mock_client, cli_runner):
+        """Test a JiraError maps to a non-zero CLI exit code."""
         mock_client.search_projects.side_effect = JiraError("API error")
 
         result = cli_runner.invoke(admin, ["project", "list"])
 
         assert result.exit_code != 0
 
-    @patch("jira_as.cli.commands.admin_cmds.get_client_from_context")
-    def test_validation_error_handling(self, mock_get_client, mock_client, cli_runner):
-        """Test ValidationError handling in CLI."""
-        mock_get_client.return_value = mock_client
-        mock_client.get_project.side_effect = ValidationError("Invalid project key")
+    def test_jira_error_propagates(self, mock_client):
+        """Test JiraError from the client propagates out of the impl."""
+        mock_client.search_projects.side_effect = JiraError("API error")
 
-        result = cli_runner.invoke(admin, ["project", "get", "INVALID"])
+        with pytest.raises(JiraError, match="API error"):
+            _list_projects_impl(client=mock_client)
 
-        assert result.exit_code != 0
+    def test_validation_error_propagates(self, mock_client):
+        """Test ValidationError from the client propagates out of the impl."""
+        mock_client.get_project.side_effect = ValidationError("Invalid project key")
+
+        with pytest.raises(ValidationError, match="Invalid project key"):
+            _get_project_impl("INVALID", client=mock_client)
@@ -1,14 +1,13 @@
 """Tests for agile_cmds.py - Agile/Scrum commands."""
 
 import json
-from unittest.mock import MagicMock
-from unittest.mock import patch
+from unittest.mock import call
 
 import pytest
-from click.testing import CliRunner
 
 from jira_as import JiraError
 from jira_as import ValidationError
+from jira_as.cli.commands import agile_cmds
 from jira_as.cli.commands.agile_cmds import FIBONACCI_SEQUENCE
 from jira_as.cli.commands.agile_cmds import VALID_EPIC_COLORS
 from jira_as.cli.commands.agile_cmds import _add_to_epic_impl
@@ -39,121 +38,43 @@ from jira_as.cli.commands.agile_cmds import _rank_issue_impl
 from jira_as.cli.commands.agile_cmds import _start_sprint_impl
 from jira_as.cli.commands.agile_cmds import _update_sprint_impl
 from jira_as.cli.commands.agile_cmds import agile
+from jira_as.constants import DEFAULT_AGILE_FIELDS
+
+from ._samples import load_sample
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def mock_client():
-    """Create a mock JIRA client with context manager support."""
-    client = MagicMock()
-    client.close = MagicMock()
-    # Support context manager pattern: with get_jira_client() as client:
-    client.__enter__ = MagicMock(return_value=client)
-    client.__exit__ = MagicMock(return_value=None)
-    return client
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_epic():
     """Sample epic data."""
-    return {
-        "id": "10001",
-        "key": "PROJ-100",
-        "self": "https://test.atlassian.net/rest/api/3/issue/10001",
-        "fields": {
-            "summary": "Epic Summary",
-            "status": {"name": "To Do"},
-            "issuetype": {"name": "Epic"},
-            "project": {"key": "PROJ"},
-            "customfield_10011": "Epic Name Value",
-        },
-    }
+    return load_sample("agile/epic.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sprint():
     """Sample sprint data."""
-    return {
-        "id": 456,
-        "name": "Sprint 1",
-        "state": "active",
-        "startDate": "2024-01-01T00:00:00.000Z",
-        "endDate": "2024-01-14T00:00:00.000Z",
-        "goal": "Complete feature X",
-    }
+    return load_sample("agile/sprint.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_board():
     """Sample board data."""
-    return {
-        "id": 123,
-        "name": "PROJ board",
-        "type": "scrum",
-        "location": {"projectKey": "PROJ"},
-    }
+    return load_sample("agile/board.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_issues():
     """Sample issues for sprint/backlog."""
-    return [
-        {
-            "key": "PROJ-1",
-            "fields": {
-                "summary": "Issue 1",
-                "status": {"name": "To Do"},
-                "customfield_10016": 5,
-            },
-        },
-        {
-            "key": "PROJ-2",
-            "fields": {
-                "summary": "Issue 2",
-                "status": {"name": "Done"},
-                "customfield_10016": 3,
-            },
-        },
-        {
-            "key": "PROJ-3",
-            "fields": {
-                "summary": "Issue 3",
-                "status": {"name": "In Progress"},
-                "customfield_10016": 8,
-            },
-        },
-    ]
+    return load_sample("agile/issues.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_velocity_sprints():
     """Sample closed sprints for velocity calculation."""
-    return [
-        {
-            "id": 101,
-            "name": "Sprint 1",
-            "state": "closed",
-            "startDate": "2024-01-01T00:00:00.000Z",
-            "endDate": "2024-01-14T00:00:00.000Z",
-        },
-        {
-            "id": 102,
-            "name": "Sprint 2",
-            "state": "closed",
-            "startDate": "2024-01-15T00:00:00.000Z",
-            "endDate": "2024-01-28T00:00:00.000Z",
-        },
-        {
-            "id": 103,
-            "name": "Sprint 3",
-            "state": "closed",
-            "startDate": "2024-01-29T00:00:00.000Z",
-            "endDate": "2024-02-11T00:00:00.000Z",
-        },
-    ]
+    return load_sample("agile/velocity_sprints.json")
 
 
 # =============================================================================
@@ -166,10 +87,19 @@ class TestConstants:
 
     def test_valid_epic_colors(self):
         """Test valid epic colors."""
-        assert "blue" in VALID_EPIC_COLORS
-        assert "red" in VALID_EPIC_COLORS
-        assert "green" in VALID_EPIC_COLORS
-        assert len(VALID_EPIC_COLORS) == 11
+        assert VALID_EPIC_COLORS == [
+            "blue",
+            "cyan",
+            "green",
+            "yellow",
+            "orange",
+            "red",
+            "magenta",
+            "purple",
+            "lime",
+            "pink",
+            "teal",
+        ]
 
     def test_fibonacci_sequence(self):
         """Test Fibonacci sequence."""
@@ -181,99 +111,91 @@ class TestConstants:
 # =============================================================================
 
 
-class TestHelperFunctions:
-    """Tests for helper functions."""
+@pytest.fixture
+def patch_jira_client(monkeypatch, mock_client):
+    """Route agile_cmds.get_jira_client() to mock_client."""
+    monkeypatch.setattr(agile_cmds, "get_jira_client", lambda: mock_client)
 
-    def test_get_board_for_project_scrum_board(self, mock_client):
-        """Test finding scrum board for project."""
-        mock_client.get_all_boards.return_value = {
-            "values": [
-                {"id": 1, "name": "Board 1", "type": "scrum"},
-                {"id": 2, "name": "Board 2", "type": "kanban"},
-            ]
-        }
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _get_board_for_project("PROJ")
+@pytest.fixture
+def patch_client_from_context(monkeypatch, mock_client):
+    """Route agile_cmds.get_client_from_context() to mock_client."""
+    monkeypatch.setattr(agile_cmds, "get_client_from_context", lambda ctx: mock_client)
 
-        assert result["id"] == 1
-        assert result["type"] == "scrum"
-        mock_client.__exit__.assert_called_once()
 
-    def test_get_board_for_project_kanban_fallback(self, mock_client):
-        """Test falling back to any board when no scrum board."""
-        mock_client.get_all_boards.return_value = {
-            "values": [{"id": 2, "name": "Board 2", "type": "kanban"}]
-        }
+@pytest.fixture
+def agile_fields(monkeypatch):
+    """Pin agile field IDs to the defaults, ignoring env and config."""
+    monkeypatch.setattr(agile_cmds, "get_agile_fields", DEFAULT_AGILE_FIELDS.copy)
+    monkeypatch.setattr(agile_cmds, "get_agile_field", DEFAULT_AGILE_FIELDS.__getitem__)
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _get_board_for_project("PROJ")
 
-        assert result["id"] == 2
-        assert result["type"] == "kanban"
+@pytest.fixture
+def board_client(request, mock_client, monkeypatch):
+    """Mock client whose get_all_boards returns ``request.param`` boards."""
+    mock_client.get_all_boards.return_value = {"values": request.param}
+    monkeypatch.setattr(agile_cmds, "get_jira_client", lambda: mock_client)
 
-    def test_get_board_for_project_no_board(self, mock_client):
-        """Test no board found."""
-        mock_client.get_all_boards.return_value = {"values": []}
+    return mock_client
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _get_board_for_project("PROJ")
 
-        assert result is None
+SCRUM_BOARD = {"id": 1, "name": "Board 1", "type": "scrum"}
+KANBAN_BOARD = {"id": 2, "name": "Board 2", "type": "kanban"}
 
-    def test_get_board_for_project_with_client(self, mock_client):
-        """Test with provided client."""
-        mock_client.get_all_boards.return_value = {
-            "values": [{"id": 1, "name": "Board", "type": "scrum"}]
-        }
+# Opaque ADF stub returned by patched converters; compared by identity
+EMPTY_ADF = {"type": "doc", "content": []}
 
-        result = _get_board_for_project("PROJ", client=mock_client)
+
+class TestHelperFunctions:
+    """Tests for helper functions."""
+
+    @pytest.mark.parametrize(
+        ("board_client", "expected"),
+        [
+            ([SCRUM_BOARD, KANBAN_BOARD], SCRUM_BOARD),
+            ([KANBAN_BOARD], KANBAN_BOARD),
+            ([], None),
+        ],
+        ids=["scrum_board", "kanban_fallback", "no_board"],
+        indirect=["board_client"],
+    )
+    def test_get_board_for_project(self, board_client, expected):
+        """Test preferring a scrum board, falling back to any, or None."""
+        result = _get_board_for_project("PROJ")
+
+        assert result == expected
+        board_client.__exit__.assert_called_once()
+
+    @pytest.mark.parametrize("board_client", [[SCRUM_BOARD]], indirect=True)
+    def test_get_board_for_project_with_client(self, board_client):
+        """Test with provided client."""
+        result = _get_board_for_project("PROJ", client=board_client)
 
         assert result["id"] == 1
-        mock_client.close.assert_not_called()
+        board_client.close.assert_not_called()
+        board_client.__exit__.assert_not_called()
 
-    def test_get_board_id_for_project_success(self, mock_client):
+    @pytest.mark.parametrize("board_client", [[SCRUM_BOARD]], indirect=True)
+    def test_get_board_id_for_project_success(self, board_client):
         """Test getting board ID for project."""
-        mock_client.get_all_boards.return_value = {
-            "values": [{"id": 123, "name": "Board", "type": "scrum"}]
-        }
-
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _get_board_id_for_project("PROJ")
+        result = _get_board_id_for_project("PROJ")
 
-        assert result == 123
+        assert result == 1
 
-    def test_get_board_id_for_project_no_board(self, mock_client):
+    @pytest.mark.parametrize("board_client", [[]], indirect=True)
+    def test_get_board_id_for_project_no_board(self, board_client):
         """Test error when no board found."""
-        mock_client.get_all_boards.return_value = {"values": []}
-
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            with pytest.raises(ValidationError, match="No board found"):
-                _get_board_id_for_project("PROJ")
+        with pytest.raises(ValidationError, match="No board found"):
+            _get_board_id_for_project("PROJ")
 
-    def test_parse_date_safe_valid(self):
+    def test_parse_date_safe_valid(self, monkeypatch):
         """Test parsing valid date."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.parse_date_to_iso",
-            return_value="2024-01-15T00:00:00.000Z",
-        ):
-            result = _parse_date_safe("2024-01-15")
-            assert result == "2024-01-15T00:00:00.000Z"
+        monkeypatch.setattr(
+            agile_cmds, "parse_date_to_iso", lambda s: "2024-01-15T00:00:00.000Z"
+        )
+
+        result = _parse_date_safe("2024-01-15")
+        assert result == "2024-01-15T00:00:00.000Z"
 
     def test_parse_date_safe_none(self):
         """Test parsing None date."""
@@ -285,14 +207,16 @@ class TestHelperFunctions:
         result = _parse_date_safe("")
         assert result is None
 
-    def test_parse_date_safe_invalid(self):
+    def test_parse_date_safe_invalid(self, monkeypatch):
         """Test parsing invalid date."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.parse_date_to_iso",
-            side_effect=ValueError("Invalid date"),
-        ):
-            with pytest.raises(ValidationError, match="Invalid date"):
-                _parse_date_safe("invalid")
+
+        def _reject(date_str):
+            raise ValueError("Invalid date")
+
+        monkeypatch.setattr(agile_cmds, "parse_date_to_iso", _reject)
+
+        with pytest.raises(ValidationError, match="Invalid date"):
+            _parse_date_safe("invalid")
 
     def test_convert_description_to_adf_json(self):
         """Test converting JSON description to ADF."""
@@ -300,23 +224,19 @@ class TestHelperFunctions:
         result = _convert_description_to_adf(adf_json)
         assert result == {"type": "doc", "version": 1, "content": []}
 
-    def test_convert_description_to_adf_markdown(self):
+    def test_convert_description_to_adf_markdown(self, monkeypatch):
         """Test converting markdown description to ADF."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.markdown_to_adf",
-            return_value={"type": "doc", "content": []},
-        ):
-            result = _convert_description_to_adf("# Heading\n\nText")
-            assert result == {"type": "doc", "content": []}
-
-    def test_convert_description_to_adf_plain_text(self):
+        monkeypatch.setattr(agile_cmds, "markdown_to_adf", lambda s: EMPTY_ADF)
+
+        result = _convert_description_to_adf("# Heading\n\nText")
+        assert result is EMPTY_ADF
+
+    def test_convert_description_to_adf_plain_text(self, monkeypatch):
         """Test converting plain text description to ADF."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.text_to_adf",
-            return_value={"type": "doc", "content": []},
-        ):
-            result = _convert_description_to_adf("Plain text")
-            assert result == {"type": "doc", "content": []}
+        monkeypatch.setattr(agile_cmds, "text_to_adf", lambda s: EMPTY_ADF)
+
+        result = _convert_description_to_adf("Plain text")
+        assert result is EMPTY_ADF
 
 
 # =============================================================================
@@ -324,6 +244,7 @@ class TestHelperFunctions:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client", "agile_fields")
 class TestEpicImplementation:
     """Tests for epic implementation functions."""
 
@@ -331,69 +252,45 @@ class TestEpicImplementation:
         """Test creating an epic."""
         mock_client.create_issue.return_value = sample_epic
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={
-                    "epic_name": "customfield_10011",
-                    "epic_color": "customfield_10012",
-                },
-            ),
-        ):
-            result = _create_epic_impl(
-                project="PROJ",
-                summary="Epic Summary",
-                epic_name="Epic Name Value",
-                color="blue",
-            )
+        result = _create_epic_impl(
+            project="PROJ",
+            summary="Epic Summary",
+            epic_name="Epic Name Value",
+            color="blue",
+        )
 
         assert result["key"] == "PROJ-100"
         mock_client.create_issue.assert_called_once()
         mock_client.__enter__.assert_called_once()
         mock_client.__exit__.assert_called_once()
 
-    def test_create_epic_impl_missing_project(self):
-        """Test error when project missing."""
-        with pytest.raises(ValidationError, match="Project key is required"):
-            _create_epic_impl(project="", summary="Summary")
-
-    def test_create_epic_impl_missing_summary(self):
-        """Test error when summary missing."""
-        with pytest.raises(ValidationError, match="Summary is required"):
-            _create_epic_impl(project="PROJ", summary="")
-
-    def test_create_epic_impl_invalid_color(self):
-        """Test error when invalid color."""
-        with pytest.raises(ValidationError, match="Invalid epic color"):
-            _create_epic_impl(project="PROJ", summary="Summary", color="invalid")
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"project": "", "summary": "Summary"}, "Project key is required"),
+            ({"project": "PROJ", "summary": ""}, "Summary is required"),
+            (
+                {"project": "PROJ", "summary": "Summary", "color": "invalid"},
+                "Invalid epic color",
+            ),
+        ],
+        ids=["missing_project", "missing_summary", "invalid_color"],
+    )
+    def test_create_epic_impl_validation(self, kwargs, message):
+        """Test create epic rejects missing or invalid input."""
+        with pytest.raises(ValidationError, match=message):
+            _create_epic_impl(**kwargs)
 
     def test_create_epic_impl_with_assignee_self(self, mock_client, sample_epic):
         """Test creating epic with self assignee."""
         mock_client.create_issue.return_value = sample_epic
         mock_client.get_current_user_id.return_value = "account123"
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={
-                    "epic_name": "customfield_10011",
-                    "epic_color": "customfield_10012",
-                },
-            ),
-        ):
-            _create_epic_impl(
-                project="PROJ",
-                summary="Epic Summary",
-                assignee="self",
-            )
+        _create_epic_impl(
+            project="PROJ",
+            summary="Epic Summary",
+            assignee="self",
+        )
 
         mock_client.get_current_user_id.assert_called_once()
         call_args = mock_client.create_issue.call_args[0][0]
@@ -403,17 +300,7 @@ class TestEpicImplementation:
         """Test getting epic without children."""
         mock_client.get_issue.return_value = sample_epic
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={"story_points": "customfield_10016"},
-            ),
-        ):
-            result = _get_epic_impl("PROJ-100")
+        result = _get_epic_impl("PROJ-100")
 
         assert result["key"] == "PROJ-100"
         assert "children" not in result
@@ -425,17 +312,7 @@ class TestEpicImplementation:
         mock_client.get_issue.return_value = sample_epic
         mock_client.search_issues.return_value = {"issues": sample_issues}
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={"story_points": "customfield_10016"},
-            ),
-        ):
-            result = _get_epic_impl("PROJ-100", with_children=True)
+        result = _get_epic_impl("PROJ-100", with_children=True)
 
         assert result["key"] == "PROJ-100"
         assert "children" in result
@@ -451,17 +328,7 @@ class TestEpicImplementation:
         """Test adding issues to epic."""
         mock_client.get_issue.return_value = sample_epic
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_field",
-                return_value="customfield_10014",
-            ),
-        ):
-            result = _add_to_epic_impl("PROJ-100", ["PROJ-1", "PROJ-2"])
+        result = _add_to_epic_impl("PROJ-100", ["PROJ-1", "PROJ-2"])
 
         assert result["added"] == 2
         assert result["failed"] == 0
@@ -473,11 +340,7 @@ class TestEpicImplementation:
         """Test dry run for adding issues to epic."""
         mock_client.get_issue.return_value = sample_epic
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _add_to_epic_impl("PROJ-100", ["PROJ-1", "PROJ-2"], dry_run=True)
+        result = _add_to_epic_impl("PROJ-100", ["PROJ-1", "PROJ-2"], dry_run=True)
 
         assert result["would_add"] == 2
         mock_client.update_issue.assert_not_called()
@@ -489,21 +352,13 @@ class TestEpicImplementation:
             "fields": {"issuetype": {"name": "Story"}},
         }
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            with pytest.raises(ValidationError, match="not an Epic"):
-                _add_to_epic_impl("PROJ-100", ["PROJ-1"])
+        with pytest.raises(ValidationError, match="not an Epic"):
+            _add_to_epic_impl("PROJ-100", ["PROJ-1"])
 
     def test_add_to_epic_impl_missing_issues(self, mock_client):
         """Test error when no issues provided."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            with pytest.raises(ValidationError, match="At least one issue key"):
-                _add_to_epic_impl("PROJ-100", [])
+        with pytest.raises(ValidationError, match="At least one issue key"):
+            _add_to_epic_impl("PROJ-100", [])
 
 
 # =============================================================================
@@ -511,6 +366,7 @@ class TestEpicImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client", "agile_fields")
 class TestSprintImplementation:
     """Tests for sprint implementation functions."""
 
@@ -518,11 +374,7 @@ class TestSprintImplementation:
         """Test listing sprints by board."""
         mock_client.get_board_sprints.return_value = {"values": [sample_sprint]}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _list_sprints_impl(board_id=123)
+        result = _list_sprints_impl(board_id=123)
 
         assert len(result["sprints"]) == 1
         assert result["sprints"][0]["name"] == "Sprint 1"
@@ -536,92 +388,66 @@ class TestSprintImplementation:
         mock_client.get_all_boards.return_value = {"values": [sample_board]}
         mock_client.get_board_sprints.return_value = {"values": [sample_sprint]}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _list_sprints_impl(project_key="PROJ")
+        result = _list_sprints_impl(project_key="PROJ")
 
         assert len(result["sprints"]) == 1
         assert result["board"]["id"] == 123
 
     def test_list_sprints_impl_no_params(self, mock_client):
         """Test error when no params."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            with pytest.raises(ValidationError, match="Either board_id or project_key"):
-                _list_sprints_impl()
+        with pytest.raises(ValidationError, match="Either board_id or project_key"):
+            _list_sprints_impl()
 
     def test_create_sprint_impl_success(self, mock_client, sample_sprint):
         """Test creating sprint."""
         mock_client.create_sprint.return_value = sample_sprint
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.parse_date_to_iso",
-                side_effect=lambda x: f"{x}T00:00:00.000Z",
-            ),
-        ):
-            result = _create_sprint_impl(
-                board_id=123,
-                name="Sprint 1",
-                goal="Complete feature",
-                start_date="2024-01-01",
-                end_date="2024-01-14",
-            )
+        result = _create_sprint_impl(
+            board_id=123,
+            name="Sprint 1",
+            goal="Complete feature",
+            start_date="2024-01-01",
+            end_date="2024-01-14",
+        )
 
         assert result["name"] == "Sprint 1"
-        mock_client.create_sprint.assert_called_once()
+        mock_client.create_sprint.assert_called_once_with(
+            board_id=123,
+            name="Sprint 1",
+            goal="Complete feature",
+            start_date="2024-01-01T00:00:00.000Z",
+            end_date="2024-01-14T00:00:00.000Z",
+        )
         mock_client.__enter__.assert_called_once()
         mock_client.__exit__.assert_called_once()
 
-    def test_create_sprint_impl_missing_board(self):
-        """Test error when board missing."""
-        with pytest.raises(ValidationError, match="Board ID is required"):
-            _create_sprint_impl(board_id=None, name="Sprint 1")
-
-    def test_create_sprint_impl_missing_name(self):
-        """Test error when name missing."""
-        with pytest.raises(ValidationError, match="Sprint name is required"):
-            _create_sprint_impl(board_id=123, name="")
-
-    def test_create_sprint_impl_invalid_dates(self):
-        """Test error when end date before start date."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.parse_date_to_iso",
-            side_effect=lambda x: f"{x}T00:00:00.000Z",
-        ):
-            with pytest.raises(
-                ValidationError, match="End date must be after start date"
-            ):
-                _create_sprint_impl(
-                    board_id=123,
-                    name="Sprint 1",
-                    start_date="2024-01-14",
-                    end_date="2024-01-01",
-                )
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"board_id": None, "name": "Sprint 1"}, "Board ID is required"),
+            ({"board_id": 123, "name": ""}, "Sprint name is required"),
+            (
+                {
+                    "board_id": 123,
+                    "name": "Sprint 1",
+                    "start_date": "2024-01-14",
+                    "end_date": "2024-01-01",
+                },
+                "End date must be after start date",
+            ),
+        ],
+        ids=["missing_board", "missing_name", "invalid_dates"],
+    )
+    def test_create_sprint_impl_validation(self, kwargs, message):
+        """Test create sprint rejects missing or invalid input."""
+        with pytest.raises(ValidationError, match=message):
+            _create_sprint_impl(**kwargs)
 
     def test_get_sprint_impl_basic(self, mock_client, sample_sprint):
         """Test getting sprint without issues."""
         mock_client.get_sprint.return_value = sample_sprint
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_field",
-                return_value="customfield_10016",
-            ),
-        ):
-            result = _get_sprint_impl(456)
+        result = _get_sprint_impl(456)
 
         assert result["name"] == "Sprint 1"
         assert "issues" not in result
@@ -635,17 +461,7 @@ class TestSprintImplementation:
         mock_client.get_sprint.return_value = sample_sprint
         mock_client.get_sprint_issues.return_value = {"issues": sample_issues}
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_field",
-                return_value="customfield_10016",
-            ),
-        ):
-            result = _get_sprint_impl(456, with_issues=True)
+        result = _get_sprint_impl(456, with_issues=True)
 
         assert result["name"] == "Sprint 1"
         assert len(result["issues"]) == 3
@@ -656,22 +472,14 @@ class TestSprintImplementation:
 
     def test_get_sprint_impl_missing_id(self, mock_client):
         """Test error when sprint ID missing."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            with pytest.raises(ValidationError, match="Sprint ID is required"):
-                _get_sprint_impl(None)
+        with pytest.raises(ValidationError, match="Sprint ID is required"):
+            _get_sprint_impl(None)
 
     def test_get_active_sprint_impl_found(self, mock_client, sample_sprint):
         """Test getting active sprint."""
         mock_client.get_board_sprints.return_value = {"values": [sample_sprint]}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _get_active_sprint_impl(123)
+        result = _get_active_sprint_impl(123)
 
         assert result["name"] == "Sprint 1"
         assert result["state"] == "active"
@@ -680,11 +488,7 @@ class TestSprintImplementation:
         """Test no active sprint found."""
         mock_client.get_board_sprints.return_value = {"values": []}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _get_active_sprint_impl(123)
+        result = _get_active_sprint_impl(123)
 
         assert result is None
 
@@ -692,26 +496,16 @@ class TestSprintImplementation:
         """Test starting sprint."""
         mock_client.update_sprint.return_value = {**sample_sprint, "state": "active"}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _start_sprint_impl(456)
+        result = _start_sprint_impl(456)
 
         assert result["state"] == "active"
-        mock_client.update_sprint.assert_called_once()
-        call_kwargs = mock_client.update_sprint.call_args[1]
-        assert call_kwargs["state"] == "active"
+        mock_client.update_sprint.assert_called_once_with(456, state="active")
 
     def test_close_sprint_impl(self, mock_client, sample_sprint):
         """Test closing sprint."""
         mock_client.update_sprint.return_value = {**sample_sprint, "state": "closed"}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _close_sprint_impl(456)
+        result = _close_sprint_impl(456)
 
         assert result["state"] == "closed"
         mock_client.update_sprint.assert_called_once()
@@ -721,11 +515,7 @@ class TestSprintImplementation:
         mock_client.update_sprint.return_value = {**sample_sprint, "state": "closed"}
         mock_client.move_issues_to_sprint.return_value = {"movedIssues": 5}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _close_sprint_impl(456, move_incomplete_to=457)
+        result = _close_sprint_impl(456, move_incomplete_to=457)
 
         assert result["moved_issues"] == 5
         mock_client.move_issues_to_sprint.assert_called_once()
@@ -734,16 +524,12 @@ class TestSprintImplementation:
         """Test updating sprint."""
         mock_client.update_sprint.return_value = {**sample_sprint, "name": "New Name"}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _update_sprint_impl(456, name="New Name", goal="New goal")
+        result = _update_sprint_impl(456, name="New Name", goal="New goal")
 
         assert result["name"] == "New Name"
-        call_kwargs = mock_client.update_sprint.call_args[1]
-        assert call_kwargs["name"] == "New Name"
-        assert call_kwargs["goal"] == "New goal"
+        mock_client.update_sprint.assert_called_once_with(
+            456, name="New Name", goal="New goal"
+        )
 
     def test_update_sprint_impl_no_fields(self, mock_client):
         """Test error when no fields to update."""
@@ -752,11 +538,7 @@ class TestSprintImplementation:
 
     def test_move_to_sprint_impl_success(self, mock_client):
         """Test moving issues to sprint."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _move_to_sprint_impl(456, issue_keys=["PROJ-1", "PROJ-2"])
+        result = _move_to_sprint_impl(456, issue_keys=["PROJ-1", "PROJ-2"])
 
         assert result["moved"] == 2
         mock_client.move_issues_to_sprint.assert_called_once()
@@ -765,46 +547,36 @@ class TestSprintImplementation:
         """Test moving issues to sprint with JQL."""
         mock_client.search_issues.return_value = {"issues": sample_issues}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _move_to_sprint_impl(456, jql="project = PROJ")
+        result = _move_to_sprint_impl(456, jql="project = PROJ")
 
         assert result["moved"] == 3
 
-    def test_move_to_sprint_impl_dry_run(self, mock_client):
-        """Test dry run for moving issues."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _move_to_sprint_impl(456, issue_keys=["PROJ-1"], dry_run=True)
-
-        assert result["would_move"] == 1
-        mock_client.move_issues_to_sprint.assert_not_called()
-
     def test_move_to_backlog_impl_success(self, mock_client):
         """Test moving issues to backlog."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _move_to_backlog_impl(issue_keys=["PROJ-1", "PROJ-2"])
+        result = _move_to_backlog_impl(issue_keys=["PROJ-1", "PROJ-2"])
 
         assert result["moved_to_backlog"] == 2
         mock_client.move_issues_to_backlog.assert_called_once()
 
-    def test_move_to_backlog_impl_dry_run(self, mock_client):
-        """Test dry run for moving to backlog."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _move_to_backlog_impl(issue_keys=["PROJ-1"], dry_run=True)
+    @pytest.mark.parametrize(
+        ("impl", "args", "result_key", "method"),
+        [
+            (_move_to_sprint_impl, (456,), "would_move", "move_issues_to_sprint"),
+            (
+                _move_to_backlog_impl,
+                (),
+                "would_move_to_backlog",
+                "move_issues_to_backlog",
+            ),
+        ],
+        ids=["move_to_sprint", "move_to_backlog"],
+    )
+    def test_move_impl_dry_run(self, mock_client, impl, args, result_key, method):
+        """Test dry runs report the issues without moving them."""
+        result = impl(*args, issue_keys=["PROJ-1"], dry_run=True)
 
-        assert result["would_move_to_backlog"] == 1
-        mock_client.move_issues_to_backlog.assert_not_called()
+        assert result[result_key] == 1
+        getattr(mock_client, method).assert_not_called()
 
 
 # =============================================================================
@@ -812,6 +584,7 @@ class TestSprintImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client", "agile_fields")
 class TestBacklogRankImplementation:
     """Tests for backlog and rank implementation functions."""
 
@@ -822,20 +595,7 @@ class TestBacklogRankImplementation:
             "total": 3,
         }
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={
-                    "epic_link": "customfield_10014",
-                    "story_points": "customfield_10016",
-                },
-            ),
-        ):
-            result = _get_backlog_impl(board_id=123)
+        result = _get_backlog_impl(board_id=123)
 
         assert len(result["issues"]) == 3
         mock_client.__enter__.assert_called_once()
@@ -871,20 +631,7 @@ class TestBacklogRankImplementation:
         ]
         mock_client.get_board_backlog.return_value = {"issues": issues}
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={
-                    "epic_link": "customfield_10014",
-                    "story_points": "customfield_10016",
-                },
-            ),
-        ):
-            result = _get_backlog_impl(board_id=123, group_by_epic=True)
+        result = _get_backlog_impl(board_id=123, group_by_epic=True)
 
         assert "by_epic" in result
         assert "PROJ-100" in result["by_epic"]
@@ -893,11 +640,7 @@ class TestBacklogRankImplementation:
 
     def test_rank_issue_impl_before(self, mock_client):
         """Test ranking issue before another."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _rank_issue_impl(["PROJ-1"], before_key="PROJ-2")
+        result = _rank_issue_impl(["PROJ-1"], before_key="PROJ-2")
 
         assert result["ranked"] == 1
         mock_client.rank_issues.assert_called_once_with(
@@ -906,28 +649,23 @@ class TestBacklogRankImplementation:
 
     def test_rank_issue_impl_after(self, mock_client):
         """Test ranking issue after another."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _rank_issue_impl(["PROJ-1"], after_key="PROJ-2")
+        result = _rank_issue_impl(["PROJ-1"], after_key="PROJ-2")
 
         assert result["ranked"] == 1
         mock_client.rank_issues.assert_called_once_with(["PROJ-1"], rank_after="PROJ-2")
 
-    def test_rank_issue_impl_no_position(self, mock_client):
-        """Test error when no position specified."""
-        with pytest.raises(ValidationError, match="Must specify"):
-            _rank_issue_impl(["PROJ-1"])
-
-    def test_rank_issue_impl_top_bottom_not_implemented(self, mock_client):
-        """Test error for top/bottom (not implemented)."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            with pytest.raises(ValidationError, match="requires implementation"):
-                _rank_issue_impl(["PROJ-1"], position="top")
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({}, "Must specify"),
+            ({"position": "top"}, "requires implementation"),
+        ],
+        ids=["no_position", "top_not_implemented"],
+    )
+    def test_rank_issue_impl_validation(self, kwargs, message):
+        """Test rank rejects a missing or unsupported position."""
+        with pytest.raises(ValidationError, match=message):
+            _rank_issue_impl(["PROJ-1"], **kwargs)
 
 
 # =============================================================================
@@ -935,42 +673,41 @@ class TestBacklogRankImplementation:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_jira_client", "agile_fields")
 class TestEstimationImplementation:
     """Tests for estimation implementation functions."""
 
     def test_estimate_issue_impl_success(self, mock_client):
         """Test setting story points."""
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_field",
-                return_value="customfield_10016",
-            ),
-        ):
-            result = _estimate_issue_impl(issue_keys=["PROJ-1"], points=5)
+
+        result = _estimate_issue_impl(issue_keys=["PROJ-1"], points=5)
 
         assert result["updated"] == 1
         assert result["points"] == 5
         mock_client.update_issue.assert_called_once()
 
+    def test_estimate_issue_impl_jql_multiple(self, mock_client):
+        """Test every issue matched by JQL gets its points written."""
+        mock_client.search_issues.return_value = {
+            "issues": [{"key": f"PROJ-{n}"} for n in range(1, 8)]
+        }
+
+        result = _estimate_issue_impl(jql="sprint = 1", points=3)
+
+        assert result["updated"] == 7
+        assert result["issues"] == [f"PROJ-{n}" for n in range(1, 8)]
+        mock_client.search_issues.assert_called_once_with("sprint = 1", fields=["key"])
+        mock_client.update_issue.assert_has_calls(
+            [call(f"PROJ-{n}", {"customfield_10016": 3}) for n in range(1, 8)],
+            any_order=True,
+        )
+
     def test_estimate_issue_impl_fibonacci_valid(self, mock_client):
         """Test valid Fibonacci value."""
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_field",
-                return_value="customfield_10016",
-            ),
-        ):
-            result = _estimate_issue_impl(
-                issue_keys=["PROJ-1"], points=8, validate_fibonacci=True
-            )
+
+        result = _estimate_issue_impl(
+            issue_keys=["PROJ-1"], points=8, validate_fibonacci=True
+        )
 
         assert result["updated"] == 1
 
@@ -983,61 +720,78 @@ class TestEstimationImplementation:
 
     def test_estimate_issue_impl_clear(self, mock_client):
         """Test clearing story points."""
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_field",
-                return_value="customfield_10016",
-            ),
-        ):
-            _estimate_issue_impl(issue_keys=["PROJ-1"], points=0)
+
+        _estimate_issue_impl(issue_keys=["PROJ-1"], points=0)
 
         # Points 0 should set to None
-        call_args = mock_client.update_issue.call_args[0]
-        assert call_args[1]["customfield_10016"] is None
+        mock_client.update_issue.assert_called_once_with(
+            "PROJ-1", {"customfield_10016": None}
+        )
 
     def test_get_estimates_impl_by_sprint(self, mock_client, sample_issues):
         """Test getting estimates by sprint."""
         mock_client.get_sprint_issues.return_value = {"issues": sample_issues}
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={"story_points": "customfield_10016"},
-            ),
-        ):
-            result = _get_estimates_impl(sprint_id=456)
+        result = _get_estimates_impl(sprint_id=456)
 
         assert result["total_points"] == 16
         assert result["issue_count"] == 3
         assert "by_status" in result
         assert "by_assignee" in result
+        mock_client.get_sprint_issues.assert_called_once_with(
+            456,
+            fields=["status", "assignee", "customfield_10016"],
+            max_results=500,
+            start_at=0,
+        )
+
+    def test_get_estimates_impl_by_sprint_paginates(self, mock_client, sample_issues):
+        """Test sprint issues beyond the first page are included."""
+        mock_client.get_sprint_issues.side_effect = [
+            {"issues": sample_issues[:2], "startAt": 0, "total": 3},
+            {"issues": sample_issues[2:], "startAt": 2, "total": 3},
+        ]
+
+        result = _get_estimates_impl(sprint_id=456)
+
+        assert result["total_points"] == 16
+        assert result["issue_count"] == 3
+        starts = [
+            c.kwargs["start_at"] for c in mock_client.get_sprint_issues.call_args_list
+        ]
+        assert starts == [0, 2]
 
     def test_get_estimates_impl_by_epic(self, mock_client, sample_issues):
         """Test getting estimates by epic."""
         mock_client.search_issues.return_value = {"issues": sample_issues}
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={"story_points": "customfield_10016"},
-            ),
-        ):
-            result = _get_estimates_impl(epic_key="PROJ-100")
+        result = _get_estimates_impl(epic_key="PROJ-100")
 
         assert result["epic_key"] == "PROJ-100"
         assert result["total_points"] == 16
+        mock_client.search_issues.assert_called_once_with(
+            '"Epic Link" = PROJ-100',
+            fields=["status", "assignee", "customfield_10016"],
+            max_results=500,
+            next_page_token=None,
+        )
+
+    def test_get_estimates_impl_by_epic_paginates(self, mock_client, sample_issues):
+        """Test epic search follows nextPageToken until the last page."""
+        mock_client.search_issues.side_effect = [
+            {"issues": sample_issues[:2], "nextPageToken": "page-2", "isLast": False},
+            {"issues": sample_issues[2:], "isLast": True},
+        ]
+
+        result = _get_estimates_impl(epic_key="PROJ-100")
+
+        assert result["total_points"] == 16
+        assert result["issue_count"] == 3
+        tokens = [
+            c.kwargs["next_page_token"]
+            for c in mock_client.search_issues.call_args_list
+        ]
+        assert tokens == [None, "page-2"]
 
     def test_get_velocity_impl_success(
         self, mock_client, sample_board, sample_velocity_sprints
@@ -1057,33 +811,62 @@ class TestEstimationImplementation:
 
         mock_client.search_issues.side_effect = mock_search
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_jira_client",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={"story_points": "customfield_10016"},
-            ),
-        ):
-            result = _get_velocity_impl(project_key="PROJ", num_sprints=3)
+        result = _get_velocity_impl(project_key="PROJ", num_sprints=3)
 
         assert result["sprints_analyzed"] == 3
         assert result["total_points"] == 37  # 10 + 15 + 12
+        # Searches run concurrently, but results keep newest-first sprint order
+        assert [s["sprint_id"] for s in result["sprints"]] == [103, 102, 101]
+        assert [s["completed_points"] for s in result["sprints"]] == [12, 15, 10]
+        for search_call in mock_client.search_issues.call_args_list:
+            assert search_call.kwargs["fields"] == ["customfield_10016"]
+            assert search_call.kwargs["max_results"] == 500
         assert result["average_velocity"] == round((10 + 15 + 12) / 3, 1)
 
+    @pytest.mark.parametrize(
+        ("points", "expected"),
+        [
+            ((10, 20, 30), 20),
+            ((10, 15, 12), 12.3),
+            ((1.5, 2.5, 2.0), 2.0),
+        ],
+    )
+    def test_get_velocity_impl_average_type(
+        self, mock_client, sample_board, sample_velocity_sprints, points, expected
+    ):
+        """Test a whole average of integer points stays an int."""
+        mock_client.get_all_boards.return_value = {"values": [sample_board]}
+        mock_client.get_board_sprints.return_value = {"values": sample_velocity_sprints}
+        mock_client.search_issues.side_effect = [
+            {"issues": [{"fields": {"customfield_10016": p}}]} for p in points
+        ]
+
+        result = _get_velocity_impl(project_key="PROJ", num_sprints=3)
+
+        assert result["average_velocity"] == expected
+        assert type(result["average_velocity"]) is type(expected)
+
+    def test_get_velocity_impl_zero_sprints(
+        self, mock_client, sample_board, sample_velocity_sprints
+    ):
+        """Test --sprints 0 yields an empty summary without searching."""
+        mock_client.get_all_boards.return_value = {"values": [sample_board]}
+        mock_client.get_board_sprints.return_value = {"values": sample_velocity_sprints}
+
+        result = _get_velocity_impl(project_key="PROJ", num_sprints=0)
+
+        assert result["sprints_analyzed"] == 0
+        assert result["sprints"] == []
+        assert result["average_velocity"] == 0
+        mock_client.search_issues.assert_not_called()
+
     def test_get_velocity_impl_no_closed_sprints(self, mock_client, sample_board):
         """Test error when no closed sprints."""
         mock_client.get_all_boards.return_value = {"values": [sample_board]}
         mock_client.get_board_sprints.return_value = {"values": []}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            with pytest.raises(ValidationError, match="No closed sprints"):
-                _get_velocity_impl(project_key="PROJ")
+        with pytest.raises(ValidationError, match="No closed sprints"):
+            _get_velocity_impl(project_key="PROJ")
 
     def test_create_subtask_impl_success(self, mock_client):
         """Test creating subtask."""
@@ -1103,13 +886,12 @@ class TestEstimationImplementation:
             "self": "https://test.atlassian.net/rest/api/3/issue/10",
         }
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            result = _create_subtask_impl(parent_key="PROJ-1", summary="Subtask")
+        result = _create_subtask_impl(parent_key="PROJ-1", summary="Subtask")
 
         assert result["key"] == "PROJ-10"
+        mock_client.get_issue.assert_called_once_with(
+            "PROJ-1", fields=["issuetype", "project"]
+        )
         mock_client.create_issue.assert_called_once()
 
     def test_create_subtask_impl_parent_is_subtask(self, mock_client):
@@ -1122,12 +904,8 @@ class TestEstimationImplementation:
             },
         }
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_jira_client",
-            return_value=mock_client,
-        ):
-            with pytest.raises(ValidationError, match="cannot have subtasks"):
-                _create_subtask_impl(parent_key="PROJ-1", summary="Subtask")
+        with pytest.raises(ValidationError, match="cannot have subtasks"):
+            _create_subtask_impl(parent_key="PROJ-1", summary="Subtask")
 
 
 # =============================================================================
@@ -1274,356 +1052,228 @@ class TestFormattingFunctions:
 # =============================================================================
 
 
+@pytest.mark.usefixtures("patch_client_from_context", "agile_fields")
 class TestEpicCommands:
     """Tests for epic CLI commands."""
 
-    def test_epic_create_text(self, mock_client, sample_epic):
+    def test_epic_create_text(self, mock_client, sample_epic, cli_runner):
         """Test epic create with text output."""
         mock_client.create_issue.return_value = sample_epic
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_client_from_context",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={
-                    "epic_name": "customfield_10011",
-                    "epic_color": "customfield_10012",
-                },
-            ),
-        ):
-            runner = CliRunner()
-            result = runner.invoke(
-                agile,
-                [
-                    "epic",
-                    "create",
-                    "-p",
-                    "PROJ",
-                    "-s",
-                    "Epic Summary",
-                    "-n",
-                    "Epic Name",
-                ],
-            )
+        result = cli_runner.invoke(
+            agile,
+            [
+                "epic",
+                "create",
+                "-p",
+                "PROJ",
+                "-s",
+                "Epic Summary",
+                "-n",
+                "Epic Name",
+            ],
+        )
 
         assert result.exit_code == 0
         assert "PROJ-100" in result.output
 
-    def test_epic_create_json(self, mock_client, sample_epic):
+    def test_epic_create_json(self, mock_client, sample_epic, cli_runner):
         """Test epic create with JSON output."""
         mock_client.create_issue.return_value = sample_epic
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_client_from_context",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={
-                    "epic_name": "customfield_10011",
-                    "epic_color": "customfield_10012",
-                },
-            ),
-        ):
-            runner = CliRunner()
-            result = runner.invoke(
-                agile,
-                ["epic", "create", "-p", "PROJ", "-s", "Summary", "-o", "json"],
-            )
+        result = cli_runner.invoke(
+            agile,
+            ["epic", "create", "-p", "PROJ", "-s", "Summary", "-o", "json"],
+        )
 
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert data["key"] == "PROJ-100"
 
-    def test_epic_get_text(self, mock_client, sample_epic):
+    def test_epic_get_text(self, mock_client, sample_epic, cli_runner):
         """Test epic get with text output."""
         mock_client.get_issue.return_value = sample_epic
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_client_from_context",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={"story_points": "customfield_10016"},
-            ),
-        ):
-            runner = CliRunner()
-            result = runner.invoke(agile, ["epic", "get", "PROJ-100"])
+        result = cli_runner.invoke(agile, ["epic", "get", "PROJ-100"])
 
         assert result.exit_code == 0
         assert "PROJ-100" in result.output
         assert "Epic Summary" in result.output
 
-    def test_epic_add_issues_text(self, mock_client, sample_epic):
+    def test_epic_add_issues_text(self, mock_client, sample_epic, cli_runner):
         """Test adding issues to epic."""
         mock_client.get_issue.return_value = sample_epic
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_client_from_context",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_field",
-                return_value="customfield_10014",
-            ),
-        ):
-            runner = CliRunner()
-            result = runner.invoke(
-                agile,
-                ["epic", "add-issues", "-e", "PROJ-100", "-i", "PROJ-1,PROJ-2"],
-            )
+        result = cli_runner.invoke(
+            agile,
+            ["epic", "add-issues", "-e", "PROJ-100", "-i", "PROJ-1,PROJ-2"],
+        )
 
         assert result.exit_code == 0
         assert "Added 2 issues" in result.output
 
 
+@pytest.mark.usefixtures("patch_client_from_context", "agile_fields")
 class TestSprintCommands:
     """Tests for sprint CLI commands."""
 
-    def test_sprint_list_text(self, mock_client, sample_board, sample_sprint):
+    def test_sprint_list_text(
+        self, mock_client, sample_board, sample_sprint, cli_runner
+    ):
         """Test sprint list with text output."""
         mock_client.get_board_sprints.return_value = {"values": [sample_sprint]}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_client_from_context",
-            return_value=mock_client,
-        ):
-            runner = CliRunner()
-            result = runner.invoke(agile, ["sprint", "list", "-b", "123"])
+        result = cli_runner.invoke(agile, ["sprint", "list", "-b", "123"])
 
         assert result.exit_code == 0
         assert "Sprint 1" in result.output
 
-    def test_sprint_list_no_params(self):
+    def test_sprint_list_no_params(self, cli_runner):
         """Test sprint list without required params."""
-        runner = CliRunner()
-        result = runner.invoke(agile, ["sprint", "list"])
+        result = cli_runner.invoke(agile, ["sprint", "list"])
 
         assert result.exit_code != 0
         assert "Either --board or --project is required" in result.output
 
-    def test_sprint_create_text(self, mock_client, sample_sprint):
+    def test_sprint_create_text(self, mock_client, sample_sprint, cli_runner):
         """Test sprint create with text output."""
         mock_client.create_sprint.return_value = sample_sprint
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_client_from_context",
-            return_value=mock_client,
-        ):
-            runner = CliRunner()
-            result = runner.invoke(
-                agile,
-                ["sprint", "create", "-b", "123", "-n", "Sprint 1", "-g", "Goal"],
-            )
+        result = cli_runner.invoke(
+            agile,
+            ["sprint", "create", "-b", "123", "-n", "Sprint 1", "-g", "Goal"],
+        )
 
         assert result.exit_code == 0
         assert "Created sprint: Sprint 1" in result.output
 
-    def test_sprint_get_by_id(self, mock_client, sample_sprint):
+    def test_sprint_get_by_id(self, mock_client, sample_sprint, cli_runner):
         """Test sprint get by ID."""
         mock_client.get_sprint.return_value = sample_sprint
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_client_from_context",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_field",
-                return_value="customfield_10016",
-            ),
-        ):
-            runner = CliRunner()
-            result = runner.invoke(agile, ["sprint", "get", "456"])
+        result = cli_runner.invoke(agile, ["sprint", "get", "456"])
 
         assert result.exit_code == 0
         assert "Sprint 1" in result.output
 
-    def test_sprint_get_active(self, mock_client, sample_sprint):
+    def test_sprint_get_active(self, mock_client, sample_sprint, cli_runner):
         """Test getting active sprint."""
         mock_client.get_board_sprints.return_value = {"values": [sample_sprint]}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_client_from_context",
-            return_value=mock_client,
-        ):
-            runner = CliRunner()
-            result = runner.invoke(agile, ["sprint", "get", "-b", "123", "--active"])
+        result = cli_runner.invoke(agile, ["sprint", "get", "-b", "123", "--active"])
 
         assert result.exit_code == 0
         assert "Sprint 1" in result.output
 
-    def test_sprint_manage_start(self, mock_client, sample_sprint):
+    def test_sprint_manage_start(self, mock_client, sample_sprint, cli_runner):
         """Test starting sprint."""
         mock_client.update_sprint.return_value = {**sample_sprint, "state": "active"}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_client_from_context",
-            return_value=mock_client,
-        ):
-            runner = CliRunner()
-            result = runner.invoke(
-                agile,
-                ["sprint", "manage", "-s", "456", "--start"],
-            )
+        result = cli_runner.invoke(
+            agile,
+            ["sprint", "manage", "-s", "456", "--start"],
+        )
 
         assert result.exit_code == 0
         assert "Started sprint" in result.output
 
-    def test_sprint_manage_close(self, mock_client, sample_sprint):
+    def test_sprint_manage_close(self, mock_client, sample_sprint, cli_runner):
         """Test closing sprint."""
         mock_client.update_sprint.return_value = {**sample_sprint, "state": "closed"}
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_client_from_context",
-            return_value=mock_client,
-        ):
-            runner = CliRunner()
-            result = runner.invoke(
-                agile,
-                ["sprint", "manage", "-s", "456", "--close"],
-            )
+        result = cli_runner.invoke(
+            agile,
+            ["sprint", "manage", "-s", "456", "--close"],
+        )
 
         assert result.exit_code == 0
         assert "Closed sprint" in result.output
 
-    def test_sprint_move_issues_to_sprint(self, mock_client):
+    def test_sprint_move_issues_to_sprint(self, mock_client, cli_runner):
         """Test moving issues to sprint."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_client_from_context",
-            return_value=mock_client,
-        ):
-            runner = CliRunner()
-            result = runner.invoke(
-                agile,
-                ["sprint", "move-issues", "-s", "456", "-i", "PROJ-1,PROJ-2"],
-            )
+        result = cli_runner.invoke(
+            agile,
+            ["sprint", "move-issues", "-s", "456", "-i", "PROJ-1,PROJ-2"],
+        )
 
         assert result.exit_code == 0
         assert "Moved 2 issues" in result.output
 
-    def test_sprint_move_issues_to_backlog(self, mock_client):
+    def test_sprint_move_issues_to_backlog(self, mock_client, cli_runner):
         """Test moving issues to backlog."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_client_from_context",
-            return_value=mock_client,
-        ):
-            runner = CliRunner()
-            result = runner.invoke(
-                agile,
-                ["sprint", "move-issues", "-b", "-i", "PROJ-1"],
-            )
+        result = cli_runner.invoke(
+            agile,
+            ["sprint", "move-issues", "-b", "-i", "PROJ-1"],
+        )
 
         assert result.exit_code == 0
         assert "Moved 1 issues to backlog" in result.output
 
 
+@pytest.mark.usefixtures("patch_client_from_context", "agile_fields")
 class TestOtherAgileCommands:
     """Tests for other agile CLI commands."""
 
-    def test_backlog_text(self, mock_client, sample_issues):
+    def test_backlog_text(self, mock_client, sample_issues, cli_runner):
         """Test backlog command."""
         mock_client.get_board_backlog.return_value = {
             "issues": sample_issues,
             "total": 3,
         }
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_client_from_context",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={
-                    "epic_link": "customfield_10014",
-                    "story_points": "customfield_10016",
-                },
-            ),
-        ):
-            runner = CliRunner()
-            result = runner.invoke(agile, ["backlog", "-b", "123"])
+        result = cli_runner.invoke(agile, ["backlog", "-b", "123"])
 
         assert result.exit_code == 0
         assert "3/3 issues" in result.output
 
-    def test_rank_before(self, mock_client):
+    def test_rank_before(self, mock_client, cli_runner):
         """Test ranking issue before another."""
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_client_from_context",
-            return_value=mock_client,
-        ):
-            runner = CliRunner()
-            result = runner.invoke(agile, ["rank", "PROJ-1", "--before", "PROJ-2"])
+        result = cli_runner.invoke(agile, ["rank", "PROJ-1", "--before", "PROJ-2"])
 
         assert result.exit_code == 0
         assert "Ranked 1 issue" in result.output
         assert "before PROJ-2" in result.output
 
-    def test_rank_no_position(self):
+    def test_rank_no_position(self, cli_runner):
         """Test ranking without position."""
-        runner = CliRunner()
-        result = runner.invoke(agile, ["rank", "PROJ-1"])
+        result = cli_runner.invoke(agile, ["rank", "PROJ-1"])
 
         assert result.exit_code != 0
         assert "Must specify one of" in result.output
 
-    def test_estimate_text(self, mock_client):
+    def test_estimate_text(self, mock_client, cli_runner):
         """Test estimate command."""
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_client_from_context",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_field",
-                return_value="customfield_10016",
-            ),
-        ):
-            runner = CliRunner()
-            result = runner.invoke(agile, ["estimate", "PROJ-1", "-p", "5"])
+
+        result = cli_runner.invoke(agile, ["estimate", "PROJ-1", "-p", "5"])
 
         assert result.exit_code == 0
         assert "Updated 1 issue" in result.output
         assert "set to 5" in result.output
 
-    def test_estimates_by_sprint(self, mock_client, sample_issues):
+    def test_estimates_by_sprint(self, mock_client, sample_issues, cli_runner):
         """Test estimates by sprint."""
         mock_client.get_sprint_issues.return_value = {"issues": sample_issues}
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_client_from_context",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={"story_points": "customfield_10016"},
-            ),
-        ):
-            runner = CliRunner()
-            result = runner.invoke(agile, ["estimates", "-s", "456"])
+        result = cli_runner.invoke(agile, ["estimates", "-s", "456"])
 
         assert result.exit_code == 0
         assert "Sprint 456 Estimates" in result.output
         assert "16 points" in result.output
 
-    def test_estimates_no_params(self):
+    def test_estimates_no_params(self, cli_runner):
         """Test estimates without params."""
-        runner = CliRunner()
-        result = runner.invoke(agile, ["estimates"])
+        result = cli_runner.invoke(agile, ["estimates"])
 
         assert result.exit_code != 0
         assert "One of --sprint, --project, or --epic is required" in result.output
 
-    def test_velocity_text(self, mock_client, sample_board, sample_velocity_sprints):
+    def test_velocity_text(
+        self,
+        mock_client,
+        sample_board,
+        sample_velocity_sprints,
+        cli_runner,
+    ):
         """Test velocity command."""
         mock_client.get_all_boards.return_value = {"values": [sample_board]}
         mock_client.get_board_sprints.return_value = {"values": sample_velocity_sprints}
@@ -1631,23 +1281,12 @@ class TestOtherAgileCommands:
             "issues": [{"fields": {"customfield_10016": 10}}]
         }
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_client_from_context",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={"story_points": "customfield_10016"},
-            ),
-        ):
-            runner = CliRunner()
-            result = runner.invoke(agile, ["velocity", "-p", "PROJ"])
+        result = cli_runner.invoke(agile, ["velocity", "-p", "PROJ"])
 
         assert result.exit_code == 0
         assert "Velocity Report" in result.output
 
-    def test_subtask_text(self, mock_client):
+    def test_subtask_text(self, mock_client, cli_runner):
         """Test subtask create."""
         mock_client.get_issue.return_value = {
             "key": "PROJ-1",
@@ -1664,48 +1303,32 @@ class TestOtherAgileCommands:
             "self": "https://test.atlassian.net/rest/api/3/issue/10",
         }
 
-        with patch(
-            "jira_as.cli.commands.agile_cmds.get_client_from_context",
-            return_value=mock_client,
-        ):
-            runner = CliRunner()
-            result = runner.invoke(
-                agile,
-                ["subtask", "-p", "PROJ-1", "-s", "Subtask Summary"],
-            )
+        result = cli_runner.invoke(
+            agile,
+            ["subtask", "-p", "PROJ-1", "-s", "Subtask Summary"],
+        )
 
         assert result.exit_code == 0
         assert "Created subtask: PROJ-10" in result.output
         assert "Parent: PROJ-1" in result.output
 
 
+@pytest.mark.usefixtures("patch_client_from_context", "agile_fields")
 class TestErrorHandling:
     """Tests for error handling in CLI commands."""
 
-    def test_jira_error_handled(self, mock_client):
+    def test_jira_error_handled(self, mock_client, cli_runner):
         """Test JIRA error is handled gracefully."""
         mock_client.get_issue.side_effect = JiraError("API Error")
 
-        with (
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_client_from_context",
-                return_value=mock_client,
-            ),
-            patch(
-                "jira_as.cli.commands.agile_cmds.get_agile_fields",
-                return_value={"story_points": "customfield_10016"},
-            ),
-        ):
-            runner = CliRunner()
-            result = runner.invoke(agile, ["epic", "get", "PROJ-100"])
+        result = cli_runner.invoke(agile, ["epic", "get", "PROJ-100"])
 
         assert result.exit_code == 1
         assert "Error" in result.output or "error" in result.output.lower()
 
-    def test_validation_error_handled(self):
+    def test_validation_error_handled(self, cli_runner):
         """Test validation error is handled gracefully."""
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             agile,
             ["epic", "create", "-p", "PROJ", "-s", "Summary", "-c", "invalid_color"],
         )
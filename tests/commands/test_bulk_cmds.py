@@ -12,7 +12,6 @@ from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
-from click.testing import CliRunner
 
 from jira_as import JiraError
 from jira_as import ValidationError
@@ -30,78 +29,27 @@ from jira_as.cli.commands.bulk_cmds import _find_transition
 from jira_as.cli.commands.bulk_cmds import _format_bulk_result
 from jira_as.cli.commands.bulk_cmds import _get_issues_to_process
 from jira_as.cli.commands.bulk_cmds import _resolve_user_id
+from jira_as.cli.commands.bulk_cmds import _run_in_pool
 from jira_as.cli.commands.bulk_cmds import _validate_priority
 from jira_as.cli.commands.bulk_cmds import bulk
 
+from ._samples import load_sample
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def mock_client():
-    """Create mock JIRA client with context manager support."""
-    client = MagicMock()
-    client.close = MagicMock()
-    # Support context manager pattern: with get_jira_client() as client:
-    client.__enter__ = MagicMock(return_value=client)
-    client.__exit__ = MagicMock(return_value=None)
-    return client
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_issues():
     """Sample issues for bulk testing."""
-    return [
-        {
-            "key": "TEST-1",
-            "fields": {
-                "summary": "First issue",
-                "status": {"name": "Open"},
-                "priority": {"name": "High"},
-                "assignee": {"displayName": "John Doe", "accountId": "user123"},
-                "issuetype": {"name": "Bug"},
-                "subtasks": [],
-                "issuelinks": [],
-            },
-        },
-        {
-            "key": "TEST-2",
-            "fields": {
-                "summary": "Second issue",
-                "status": {"name": "In Progress"},
-                "priority": {"name": "Medium"},
-                "assignee": None,
-                "issuetype": {"name": "Task"},
-                "subtasks": [{"key": "TEST-3"}],
-                "issuelinks": [],
-            },
-        },
-        {
-            "key": "TEST-4",
-            "fields": {
-                "summary": "Fourth issue",
-                "status": {"name": "Open"},
-                "priority": {"name": "Low"},
-                "assignee": {"displayName": "Jane Smith"},
-                "issuetype": {"name": "Story"},
-                "subtasks": [],
-                "issuelinks": [
-                    {"type": {"name": "Blocks"}, "outwardIssue": {"key": "TEST-5"}}
-                ],
-            },
-        },
-    ]
+    return load_sample("bulk/issues.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transitions():
     """Sample transitions for testing."""
-    return [
-        {"id": "11", "name": "Start Progress", "to": {"name": "In Progress"}},
-        {"id": "21", "name": "Done", "to": {"name": "Done"}},
-        {"id": "31", "name": "Reopen", "to": {"name": "Open"}},
-    ]
+    return load_sample("bulk/transitions.json")
 
 
 # =============================================================================
@@ -236,6 +184,20 @@ class TestHelperFunctions:
         with pytest.raises(ValidationError, match="Invalid priority"):
             _validate_priority("Invalid")
 
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_run_in_pool_captures_errors_in_order(self, max_workers):
+        """Test failures are captured per issue and keys keep input order."""
+        issues = [{"key": f"TEST-{n}"} for n in range(1, 7)]
+
+        def op(key):
+            if key == "TEST-3":
+                raise JiraError("Rate limited")
+
+        processed, errors = _run_in_pool(issues, op, max_workers=max_workers, delay=0)
+
+        assert processed == ["TEST-1", "TEST-2", "TEST-4", "TEST-5", "TEST-6"]
+        assert errors == {"TEST-3": "Rate limited"}
+
 
 # =============================================================================
 # Test Implementation Functions
@@ -287,6 +249,80 @@ class TestBulkTransitionImplementation:
         assert result["failed"] == 0
         assert mock_client.transition_issue.call_count == 3
 
+    @patch("jira_as.cli.commands.bulk_cmds.validate_jql")
+    def test_bulk_transition_fetches_transitions_per_workflow_step(
+        self, mock_validate, mock_client, sample_transitions
+    ):
+        """Test transitions are looked up once per project/type/status."""
+        mock_validate.return_value = "project = TEST"
+
+        def issue(key, status_id):
+            return {
+                "key": key,
+                "fields": {
+                    "project": {"key": "TEST"},
+                    "issuetype": {"id": "10001"},
+                    "status": {"id": status_id},
+                },
+            }
+
+        mock_client.search_issues.return_value = {
+            "issues": [issue("TEST-1", "1"), issue("TEST-2", "1"), issue("TEST-3", "3")]
+        }
+        mock_client.get_transitions.return_value = sample_transitions
+
+        result = _bulk_transition_impl(
+            jql="project = TEST",
+            target_status="Done",
+            dry_run=False,
+            delay=0,
+            client=mock_client,
+        )
+
+        assert result["success"] == 3
+        assert [c.args[0] for c in mock_client.get_transitions.call_args_list] == [
+            "TEST-1",
+            "TEST-3",
+        ]
+        assert mock_client.transition_issue.call_count == 3
+
+    @patch("jira_as.cli.commands.bulk_cmds.validate_jql")
+    def test_bulk_transition_rechecks_issue_when_cached_step_lacks_target(
+        self, mock_validate, mock_client, sample_transitions
+    ):
+        """Test a per-issue condition failure does not block the whole step."""
+        mock_validate.return_value = "project = TEST"
+        step_fields = {
+            "project": {"key": "TEST"},
+            "issuetype": {"id": "10001"},
+            "status": {"id": "1"},
+        }
+        mock_client.search_issues.return_value = {
+            "issues": [
+                {"key": "TEST-1", "fields": step_fields},
+                {"key": "TEST-2", "fields": step_fields},
+            ]
+        }
+        # TEST-1 fails a transition condition, so Jira hides "Done" for it only
+        restricted = [t for t in sample_transitions if t["name"] != "Done"]
+        mock_client.get_transitions.side_effect = [restricted, sample_transitions]
+
+        result = _bulk_transition_impl(
+            jql="project = TEST",
+            target_status="Done",
+            dry_run=False,
+            delay=0,
+            client=mock_client,
+        )
+
+        assert result["success"] == 1
+        assert result["processed"] == ["TEST-2"]
+        assert "TEST-1" in result["errors"]
+        assert [c.args[0] for c in mock_client.get_transitions.call_args_list] == [
+            "TEST-1",
+            "TEST-2",
+        ]
+
     @patch("jira_as.cli.commands.bulk_cmds.validate_jql")
     def test_bulk_transition_with_comment(
         self,
@@ -715,22 +751,17 @@ class TestFormattingFunctions:
 class TestBulkTransitionCommand:
     """Tests for bulk transition command."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @patch("jira_as.cli.commands.bulk_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.bulk_cmds.validate_jql")
     def test_transition_command_dry_run(
-        self, mock_validate, mock_get_client, runner, mock_client, sample_issues
+        self, mock_validate, mock_get_client, cli_runner, mock_client, sample_issues
     ):
         """Test transition command dry run."""
         mock_get_client.return_value = mock_client
         mock_validate.return_value = "project = TEST"
         mock_client.search_issues.return_value = {"issues": sample_issues}
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             bulk,
             [
                 "transition",
@@ -750,7 +781,7 @@ class TestBulkTransitionCommand:
         self,
         mock_validate,
         mock_get_client,
-        runner,
+        cli_runner,
         mock_client,
         sample_issues,
         sample_transitions,
@@ -761,7 +792,7 @@ class TestBulkTransitionCommand:
         mock_client.search_issues.return_value = {"issues": sample_issues}
         mock_client.get_transitions.return_value = sample_transitions
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             bulk,
             [
                 "transition",
@@ -776,9 +807,9 @@ class TestBulkTransitionCommand:
         assert result.exit_code == 0
         assert "succeeded" in result.output
 
-    def test_transition_command_missing_input(self, runner):
+    def test_transition_command_missing_input(self, cli_runner):
         """Test transition command requires JQL or issues."""
-        result = runner.invoke(bulk, ["transition", "--to", "Done", "--yes"])
+        result = cli_runner.invoke(bulk, ["transition", "--to", "Done", "--yes"])
 
         assert result.exit_code != 0
         assert "required" in result.output.lower()
@@ -787,22 +818,17 @@ class TestBulkTransitionCommand:
 class TestBulkAssignCommand:
     """Tests for bulk assign command."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @patch("jira_as.cli.commands.bulk_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.bulk_cmds.validate_jql")
     def test_assign_command(
-        self, mock_validate, mock_get_client, runner, mock_client, sample_issues
+        self, mock_validate, mock_get_client, cli_runner, mock_client, sample_issues
     ):
         """Test assign command."""
         mock_get_client.return_value = mock_client
         mock_validate.return_value = "project = TEST"
         mock_client.search_issues.return_value = {"issues": sample_issues}
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             bulk,
             [
                 "assign",
@@ -819,14 +845,14 @@ class TestBulkAssignCommand:
     @patch("jira_as.cli.commands.bulk_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.bulk_cmds.validate_jql")
     def test_unassign_command(
-        self, mock_validate, mock_get_client, runner, mock_client, sample_issues
+        self, mock_validate, mock_get_client, cli_runner, mock_client, sample_issues
     ):
         """Test unassign command."""
         mock_get_client.return_value = mock_client
         mock_validate.return_value = "project = TEST"
         mock_client.search_issues.return_value = {"issues": sample_issues}
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             bulk,
             [
                 "assign",
@@ -839,9 +865,9 @@ class TestBulkAssignCommand:
 
         assert result.exit_code == 0
 
-    def test_assign_requires_action(self, runner):
+    def test_assign_requires_action(self, cli_runner):
         """Test assign requires assignee or unassign."""
-        result = runner.invoke(
+        result = cli_runner.invoke(
             bulk,
             [
                 "assign",
@@ -857,22 +883,17 @@ class TestBulkAssignCommand:
 class TestBulkSetPriorityCommand:
     """Tests for bulk set-priority command."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @patch("jira_as.cli.commands.bulk_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.bulk_cmds.validate_jql")
     def test_set_priority_command(
-        self, mock_validate, mock_get_client, runner, mock_client, sample_issues
+        self, mock_validate, mock_get_client, cli_runner, mock_client, sample_issues
     ):
         """Test set-priority command."""
         mock_get_client.return_value = mock_client
         mock_validate.return_value = "project = TEST"
         mock_client.search_issues.return_value = {"issues": sample_issues}
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             bulk,
             [
                 "set-priority",
@@ -886,19 +907,41 @@ class TestBulkSetPriorityCommand:
 
         assert result.exit_code == 0
 
+    @patch("jira_as.cli.commands.bulk_cmds.get_client_from_context")
+    def test_set_priority_command_concurrency(
+        self, mock_get_client, cli_runner, mock_client
+    ):
+        """Test --concurrency on the bulk group processes every issue."""
+        mock_get_client.return_value = mock_client
+
+        result = cli_runner.invoke(
+            bulk,
+            [
+                "--concurrency",
+                "3",
+                "set-priority",
+                "--issues",
+                "TEST-1,TEST-2,TEST-3,TEST-4",
+                "--priority",
+                "High",
+                "--yes",
+                "--output",
+                "json",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert mock_client.update_issue.call_count == 4
+        assert '"success": 4' in result.output
+
 
 class TestBulkCloneCommand:
     """Tests for bulk clone command."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @patch("jira_as.cli.commands.bulk_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.bulk_cmds.validate_jql")
     def test_clone_command(
-        self, mock_validate, mock_get_client, runner, mock_client, sample_issues
+        self, mock_validate, mock_get_client, cli_runner, mock_client, sample_issues
     ):
         """Test clone command."""
         mock_get_client.return_value = mock_client
@@ -906,7 +949,7 @@ class TestBulkCloneCommand:
         mock_client.search_issues.return_value = {"issues": sample_issues}
         mock_client.create_issue.return_value = {"key": "TEST-NEW", "id": "99"}
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             bulk,
             [
                 "clone",
@@ -922,22 +965,17 @@ class TestBulkCloneCommand:
 class TestBulkDeleteCommand:
     """Tests for bulk delete command."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @patch("jira_as.cli.commands.bulk_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.bulk_cmds.validate_jql")
     def test_delete_command_dry_run(
-        self, mock_validate, mock_get_client, runner, mock_client, sample_issues
+        self, mock_validate, mock_get_client, cli_runner, mock_client, sample_issues
     ):
         """Test delete command dry run."""
         mock_get_client.return_value = mock_client
         mock_validate.return_value = "project = TEST"
         mock_client.search_issues.return_value = {"issues": sample_issues}
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             bulk,
             [
                 "delete",
@@ -953,14 +991,14 @@ class TestBulkDeleteCommand:
     @patch("jira_as.cli.commands.bulk_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.bulk_cmds.validate_jql")
     def test_delete_command_execute(
-        self, mock_validate, mock_get_client, runner, mock_client, sample_issues
+        self, mock_validate, mock_get_client, cli_runner, mock_client, sample_issues
     ):
         """Test delete command execution."""
         mock_get_client.return_value = mock_client
         mock_validate.return_value = "project = TEST"
         mock_client.search_issues.return_value = {"issues": sample_issues}
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             bulk,
             [
                 "delete",
@@ -973,9 +1011,9 @@ class TestBulkDeleteCommand:
         assert result.exit_code == 0
         assert "succeeded" in result.output
 
-    def test_delete_shows_warning(self, runner):
+    def test_delete_shows_warning(self, cli_runner):
         """Test delete shows warning without yes."""
-        result = runner.invoke(
+        result = cli_runner.invoke(
             bulk,
             [
                 "delete",
@@ -995,13 +1033,8 @@ class TestBulkDeleteCommand:
 class TestErrorHandling:
     """Tests for error handling."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @patch("jira_as.cli.commands.bulk_cmds.get_client_from_context")
-    def test_jira_error_handling(self, mock_get_client, runner):
+    def test_jira_error_handling(self, mock_get_client, cli_runner):
         """Test JiraError is handled properly."""
         mock_client = MagicMock()
         mock_client.__enter__ = MagicMock(return_value=mock_client)
@@ -1009,7 +1042,7 @@ class TestErrorHandling:
         mock_get_client.return_value = mock_client
         mock_client.search_issues.side_effect = JiraError("API Error")
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             bulk,
             [
                 "transition",
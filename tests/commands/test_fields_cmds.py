@@ -29,6 +29,8 @@ from jira_as.cli.commands.fields_cmds import _format_project_fields
 from jira_as.cli.commands.fields_cmds import _list_fields_impl
 from jira_as.cli.commands.fields_cmds import fields
 
+from ._samples import load_sample
+
 # =============================================================================
 # Constants Tests
 # =============================================================================
@@ -320,50 +322,27 @@ class TestCreateFieldImpl:
 # =============================================================================
 
 
-@pytest.mark.unit
-class TestCheckProjectFieldsImpl:
-    """Tests for the _check_project_fields_impl implementation function."""
+@pytest.fixture(scope="session")
+def sample_issuetypes_meta():
+    """Sample response from get_create_issue_meta_issuetypes."""
+    return load_sample("fields/issuetypes_meta.json")
 
-    @pytest.fixture
-    def sample_issuetypes_meta(self):
-        """Sample response from get_create_issue_meta_issuetypes."""
-        return {
-            "values": [
-                {"id": "10001", "name": "Task", "description": "A task"},
-                {"id": "10002", "name": "Bug", "description": "A bug"},
-            ]
-        }
 
-    @pytest.fixture
-    def sample_fields_meta_task(self):
-        """Sample response from get_create_issue_meta_fields for Task."""
-        return {
-            "values": [
-                {"fieldId": "summary", "name": "Summary", "required": True},
-                {"fieldId": "description", "name": "Description", "required": False},
-                {
-                    "fieldId": "customfield_10001",
-                    "name": "Story Points",
-                    "required": False,
-                },
-                {
-                    "fieldId": "customfield_10002",
-                    "name": "Epic Link",
-                    "required": False,
-                },
-            ]
-        }
+@pytest.fixture(scope="session")
+def sample_fields_meta_task():
+    """Sample response from get_create_issue_meta_fields for Task."""
+    return load_sample("fields/fields_meta_task.json")
 
-    @pytest.fixture
-    def sample_fields_meta_bug(self):
-        """Sample response from get_create_issue_meta_fields for Bug."""
-        return {
-            "values": [
-                {"fieldId": "summary", "name": "Summary", "required": True},
-                {"fieldId": "description", "name": "Description", "required": False},
-                {"fieldId": "priority", "name": "Priority", "required": True},
-            ]
-        }
+
+@pytest.fixture(scope="session")
+def sample_fields_meta_bug():
+    """Sample response from get_create_issue_meta_fields for Bug."""
+    return load_sample("fields/fields_meta_bug.json")
+
+
+@pytest.mark.unit
+class TestCheckProjectFieldsImpl:
+    """Tests for the _check_project_fields_impl implementation function."""
 
     def test_check_project_fields_basic(
         self,
@@ -398,6 +398,24 @@ class TestGetIssueCommand:
         parsed = json.loads(result.output)
         assert parsed["key"] == "PROJ-123"
 
+    def test_get_issue_cli_json_output_non_ascii(
+        self, cli_runner, mock_jira_client, sample_issue
+    ):
+        """Test CLI JSON output keeps non-ASCII text unescaped."""
+        issue_data = deepcopy(sample_issue)
+        issue_data["fields"]["summary"] = "Café ✓"
+        mock_jira_client.get_issue.return_value = issue_data
+
+        with patch(
+            "jira_as.cli.commands.issue_cmds.get_client_from_context",
+            return_value=mock_jira_client,
+        ):
+            result = cli_runner.invoke(issue, ["get", "PROJ-123", "--output", "json"])
+
+        assert result.exit_code == 0
+        assert '"summary": "Café ✓"' in result.output
+        assert json.loads(result.output)["fields"]["summary"] == "Café ✓"
+
 
 @pytest.mark.unit
 class TestCreateIssueCommand:
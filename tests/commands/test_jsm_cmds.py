@@ -1,10 +1,8 @@
 """Tests for JSM CLI commands."""
 
-from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
-from click.testing import CliRunner
 
 from jira_as.cli.commands.jsm_cmds import (
     _format_approvals,  # Approval impl; Asset impl; Customer impl; KB impl; Organization impl; Participant impl; Queue impl; Request impl; SLA impl; Request Type impl; Helper functions; CLI commands
@@ -38,220 +36,71 @@ from jira_as.cli.commands.jsm_cmds import _parse_attributes
 from jira_as.cli.commands.jsm_cmds import _parse_comma_list
 from jira_as.cli.commands.jsm_cmds import jsm
 
+from ._samples import load_sample
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def runner():
-    """CLI test runner."""
-    return CliRunner()
-
-
-@pytest.fixture
-def mock_client():
-    """Mock JIRA client."""
-    client = MagicMock()
-    client.__enter__ = MagicMock(return_value=client)
-    client.__exit__ = MagicMock(return_value=None)
-    return client
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_service_desks():
     """Sample service desks data."""
-    return {
-        "values": [
-            {
-                "id": "1",
-                "projectId": "10001",
-                "projectKey": "SD",
-                "projectName": "Service Desk",
-            },
-            {
-                "id": "2",
-                "projectId": "10002",
-                "projectKey": "IT",
-                "projectName": "IT Support",
-            },
-        ],
-        "size": 2,
-    }
+    return load_sample("jsm/service_desks.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_request_types():
     """Sample request types data."""
-    return {
-        "values": [
-            {
-                "id": "1",
-                "name": "Hardware Request",
-                "description": "Request new hardware",
-                "serviceDeskId": "1",
-                "issueTypeId": "10001",
-            },
-            {
-                "id": "2",
-                "name": "Software Request",
-                "description": "Request software installation",
-                "serviceDeskId": "1",
-                "issueTypeId": "10002",
-            },
-        ],
-        "size": 2,
-    }
-
-
-@pytest.fixture
+    return load_sample("jsm/request_types.json")
+
+
+@pytest.fixture(scope="session")
 def sample_request():
     """Sample request data."""
-    return {
-        "issueKey": "SD-123",
-        "serviceDeskId": "1",
-        "requestType": {"name": "Hardware Request"},
-        "currentStatus": {"status": "Open", "statusCategory": "To Do"},
-        "requestFieldValues": [
-            {"fieldId": "summary", "value": "Need new laptop"},
-            {"fieldId": "description", "value": "My laptop is broken"},
-        ],
-        "reporter": {"emailAddress": "user@example.com"},
-        "createdDate": {"friendly": "2024-01-15"},
-        "_links": {
-            "web": "https://example.atlassian.net/servicedesk/customer/portal/1/SD-123",
-            "agent": "https://example.atlassian.net/browse/SD-123",
-        },
-    }
-
-
-@pytest.fixture
+    return load_sample("jsm/request.json")
+
+
+@pytest.fixture(scope="session")
 def sample_customers():
     """Sample customers data."""
-    return {
-        "values": [
-            {
-                "accountId": "abc123",
-                "displayName": "John Doe",
-                "emailAddress": "john@example.com",
-                "active": True,
-            },
-            {
-                "accountId": "def456",
-                "displayName": "Jane Smith",
-                "emailAddress": "jane@example.com",
-                "active": True,
-            },
-        ],
-        "size": 2,
-    }
+    return load_sample("jsm/customers.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_organizations():
     """Sample organizations data."""
-    return {
-        "values": [
-            {"id": "1", "name": "Acme Corp"},
-            {"id": "2", "name": "Beta Industries"},
-        ],
-        "size": 2,
-    }
+    return load_sample("jsm/organizations.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_queues():
     """Sample queues data."""
-    return {
-        "values": [
-            {"id": "1", "name": "Unassigned", "jql": "assignee is EMPTY"},
-            {"id": "2", "name": "My Queue", "jql": "assignee = currentUser()"},
-        ],
-        "size": 2,
-    }
+    return load_sample("jsm/queues.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sla_data():
     """Sample SLA data."""
-    return {
-        "values": [
-            {
-                "name": "Time to first response",
-                "ongoingCycle": {
-                    "breached": False,
-                    "remainingTime": {"millis": 7200000},  # 2 hours
-                },
-            },
-            {
-                "name": "Time to resolution",
-                "ongoingCycle": {
-                    "breached": True,
-                    "remainingTime": {"millis": -3600000},  # -1 hour (overdue)
-                },
-            },
-        ],
-    }
+    return load_sample("jsm/sla_data.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_approvals():
     """Sample approvals data."""
-    return [
-        {
-            "id": "10001",
-            "name": "Manager Approval",
-            "status": "pending",
-            "approvers": [{"displayName": "Manager User"}],
-            "createdDate": "2024-01-15T10:00:00Z",
-        },
-    ]
-
-
-@pytest.fixture
+    return load_sample("jsm/approvals.json")
+
+
+@pytest.fixture(scope="session")
 def sample_kb_articles():
     """Sample KB articles."""
-    return [
-        {
-            "title": "How to reset password",
-            "excerpt": "This article explains how to <em>reset</em> your password.",
-            "_links": {"self": "https://example.com/kb/1"},
-        },
-        {
-            "title": "VPN Setup Guide",
-            "excerpt": "Instructions for setting up <em>VPN</em> connection.",
-            "_links": {"self": "https://example.com/kb/2"},
-        },
-    ]
-
-
-@pytest.fixture
+    return load_sample("jsm/kb_articles.json")
+
+
+@pytest.fixture(scope="session")
 def sample_assets():
     """Sample assets data."""
-    return [
-        {
-            "objectKey": "SRV-001",
-            "label": "Web Server 1",
-            "objectType": {"name": "Server"},
-            "attributes": [
-                {
-                    "objectTypeAttribute": {"name": "IP Address"},
-                    "objectAttributeValues": [{"value": "192.168.1.100"}],
-                },
-            ],
-        },
-        {
-            "objectKey": "SRV-002",
-            "label": "Database Server",
-            "objectType": {"name": "Server"},
-            "attributes": [
-                {
-                    "objectTypeAttribute": {"name": "IP Address"},
-                    "objectAttributeValues": [{"value": "192.168.1.101"}],
-                },
-            ],
-        },
-    ]
+    return load_sample("jsm/assets.json")
 
 
 # =============================================================================
@@ -851,25 +700,25 @@ class TestServiceDeskListCommand:
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
     def test_list_service_desks(
-        self, mock_get_client, runner, mock_client, sample_service_desks
+        self, mock_get_client, cli_runner, mock_client, sample_service_desks
     ):
         """Test listing service desks."""
         mock_get_client.return_value = mock_client
         mock_client.get_service_desks.return_value = sample_service_desks
 
-        result = runner.invoke(jsm, ["service-desk", "list"])
+        result = cli_runner.invoke(jsm, ["service-desk", "list"])
         assert result.exit_code == 0
         assert "SD" in result.output
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
     def test_list_service_desks_json(
-        self, mock_get_client, runner, mock_client, sample_service_desks
+        self, mock_get_client, cli_runner, mock_client, sample_service_desks
     ):
         """Test listing service desks in JSON format."""
         mock_get_client.return_value = mock_client
         mock_client.get_service_desks.return_value = sample_service_desks
 
-        result = runner.invoke(jsm, ["service-desk", "list", "--output", "json"])
+        result = cli_runner.invoke(jsm, ["service-desk", "list", "--output", "json"])
         assert result.exit_code == 0
         assert '"projectKey"' in result.output
 
@@ -878,7 +727,7 @@ class TestServiceDeskGetCommand:
     """Tests for service-desk get command."""
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
-    def test_get_service_desk(self, mock_get_client, runner, mock_client):
+    def test_get_service_desk(self, mock_get_client, cli_runner, mock_client):
         """Test getting service desk details."""
         mock_get_client.return_value = mock_client
         mock_client.get_service_desk.return_value = {
@@ -888,7 +737,7 @@ class TestServiceDeskGetCommand:
             "projectName": "Service Desk",
         }
 
-        result = runner.invoke(jsm, ["service-desk", "get", "1"])
+        result = cli_runner.invoke(jsm, ["service-desk", "get", "1"])
         assert result.exit_code == 0
         assert "Service Desk Details:" in result.output
 
@@ -897,9 +746,9 @@ class TestServiceDeskCreateCommand:
     """Tests for service-desk create command."""
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
-    def test_create_service_desk_dry_run(self, mock_get_client, runner):
+    def test_create_service_desk_dry_run(self, mock_get_client, cli_runner):
         """Test creating service desk with dry run."""
-        result = runner.invoke(
+        result = cli_runner.invoke(
             jsm, ["service-desk", "create", "PROJ", "Test Desk", "--dry-run"]
         )
         assert result.exit_code == 0
@@ -912,13 +761,13 @@ class TestRequestTypeListCommand:
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
     def test_list_request_types(
-        self, mock_get_client, runner, mock_client, sample_request_types
+        self, mock_get_client, cli_runner, mock_client, sample_request_types
     ):
         """Test listing request types."""
         mock_get_client.return_value = mock_client
         mock_client.get_request_types.return_value = sample_request_types
 
-        result = runner.invoke(jsm, ["request-type", "list", "1"])
+        result = cli_runner.invoke(jsm, ["request-type", "list", "1"])
         assert result.exit_code == 0
         assert "Hardware Request" in result.output
 
@@ -927,7 +776,7 @@ class TestRequestListCommand:
     """Tests for request list command."""
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
-    def test_list_requests(self, mock_get_client, runner, mock_client):
+    def test_list_requests(self, mock_get_client, cli_runner, mock_client):
         """Test listing requests."""
         mock_get_client.return_value.__enter__.return_value = mock_client
         mock_get_client.return_value.__exit__.return_value = None
@@ -945,7 +794,7 @@ class TestRequestListCommand:
             "total": 1,
         }
 
-        result = runner.invoke(jsm, ["request", "list", "SD"])
+        result = cli_runner.invoke(jsm, ["request", "list", "SD"])
         assert result.exit_code == 0
         assert "SD-123" in result.output
 
@@ -953,9 +802,9 @@ class TestRequestListCommand:
 class TestRequestCreateCommand:
     """Tests for request create command."""
 
-    def test_create_request_dry_run(self, runner):
+    def test_create_request_dry_run(self, cli_runner):
         """Test creating request with dry run."""
-        result = runner.invoke(
+        result = cli_runner.invoke(
             jsm,
             ["request", "create", "1", "10", "--summary", "Test request", "--dry-run"],
         )
@@ -968,7 +817,7 @@ class TestRequestTransitionCommand:
     """Tests for request transition command."""
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
-    def test_show_transitions(self, mock_get_client, runner, mock_client):
+    def test_show_transitions(self, mock_get_client, cli_runner, mock_client):
         """Test showing available transitions."""
         mock_get_client.return_value.__enter__.return_value = mock_client
         mock_get_client.return_value.__exit__.return_value = None
@@ -976,15 +825,15 @@ class TestRequestTransitionCommand:
             {"id": "11", "name": "Start Progress", "to": {"name": "In Progress"}}
         ]
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             jsm, ["request", "transition", "SD-123", "--show-transitions"]
         )
         assert result.exit_code == 0
         assert "Start Progress" in result.output
 
-    def test_transition_dry_run(self, runner):
+    def test_transition_dry_run(self, cli_runner):
         """Test transition with dry run."""
-        result = runner.invoke(
+        result = cli_runner.invoke(
             jsm,
             ["request", "transition", "SD-123", "--to", "In Progress", "--dry-run"],
         )
@@ -997,14 +846,14 @@ class TestCustomerListCommand:
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
     def test_list_customers(
-        self, mock_get_client, runner, mock_client, sample_customers
+        self, mock_get_client, cli_runner, mock_client, sample_customers
     ):
         """Test listing customers."""
         mock_get_client.return_value.__enter__.return_value = mock_client
         mock_get_client.return_value.__exit__.return_value = None
         mock_client.get_service_desk_customers.return_value = sample_customers
 
-        result = runner.invoke(jsm, ["customer", "list", "1"])
+        result = cli_runner.invoke(jsm, ["customer", "list", "1"])
         assert result.exit_code == 0
         assert "john@example.com" in result.output
 
@@ -1014,14 +863,14 @@ class TestOrganizationListCommand:
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
     def test_list_organizations(
-        self, mock_get_client, runner, mock_client, sample_organizations
+        self, mock_get_client, cli_runner, mock_client, sample_organizations
     ):
         """Test listing organizations."""
         mock_get_client.return_value.__enter__.return_value = mock_client
         mock_get_client.return_value.__exit__.return_value = None
         mock_client.get_organizations.return_value = sample_organizations
 
-        result = runner.invoke(jsm, ["organization", "list"])
+        result = cli_runner.invoke(jsm, ["organization", "list"])
         assert result.exit_code == 0
         assert "Acme Corp" in result.output
 
@@ -1029,9 +878,9 @@ class TestOrganizationListCommand:
 class TestOrganizationCreateCommand:
     """Tests for organization create command."""
 
-    def test_create_organization_dry_run(self, runner):
+    def test_create_organization_dry_run(self, cli_runner):
         """Test creating organization with dry run."""
-        result = runner.invoke(
+        result = cli_runner.invoke(
             jsm, ["organization", "create", "--name", "Test Org", "--dry-run"]
         )
         assert result.exit_code == 0
@@ -1043,13 +892,13 @@ class TestQueueListCommand:
     """Tests for queue list command."""
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
-    def test_list_queues(self, mock_get_client, runner, mock_client, sample_queues):
+    def test_list_queues(self, mock_get_client, cli_runner, mock_client, sample_queues):
         """Test listing queues."""
         mock_get_client.return_value.__enter__.return_value = mock_client
         mock_get_client.return_value.__exit__.return_value = None
         mock_client.get_service_desk_queues.return_value = sample_queues
 
-        result = runner.invoke(jsm, ["queue", "list", "1"])
+        result = cli_runner.invoke(jsm, ["queue", "list", "1"])
         assert result.exit_code == 0
         assert "Unassigned" in result.output
 
@@ -1058,13 +907,13 @@ class TestSlaGetCommand:
     """Tests for sla get command."""
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
-    def test_get_sla(self, mock_get_client, runner, mock_client, sample_sla_data):
+    def test_get_sla(self, mock_get_client, cli_runner, mock_client, sample_sla_data):
         """Test getting SLA information."""
         mock_get_client.return_value.__enter__.return_value = mock_client
         mock_get_client.return_value.__exit__.return_value = None
         mock_client.get_request_slas.return_value = sample_sla_data
 
-        result = runner.invoke(jsm, ["sla", "get", "SD-123"])
+        result = cli_runner.invoke(jsm, ["sla", "get", "SD-123"])
         assert result.exit_code == 0
         assert "SLA Information:" in result.output
 
@@ -1072,9 +921,9 @@ class TestSlaGetCommand:
 class TestSlaReportCommand:
     """Tests for sla report command."""
 
-    def test_sla_report_missing_args(self, runner):
+    def test_sla_report_missing_args(self, cli_runner):
         """Test SLA report with missing arguments."""
-        result = runner.invoke(jsm, ["sla", "report"])
+        result = cli_runner.invoke(jsm, ["sla", "report"])
         assert result.exit_code == 1
         assert "Must specify" in result.output
 
@@ -1084,14 +933,14 @@ class TestApprovalListCommand:
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
     def test_list_approvals(
-        self, mock_get_client, runner, mock_client, sample_approvals
+        self, mock_get_client, cli_runner, mock_client, sample_approvals
     ):
         """Test listing approvals."""
         mock_get_client.return_value.__enter__.return_value = mock_client
         mock_get_client.return_value.__exit__.return_value = None
         mock_client.get_request_approvals.return_value = sample_approvals
 
-        result = runner.invoke(jsm, ["approval", "list", "SD-123"])
+        result = cli_runner.invoke(jsm, ["approval", "list", "SD-123"])
         assert result.exit_code == 0
         assert "Manager Approval" in result.output
 
@@ -1100,13 +949,15 @@ class TestKbSearchCommand:
     """Tests for kb search command."""
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
-    def test_search_kb(self, mock_get_client, runner, mock_client, sample_kb_articles):
+    def test_search_kb(
+        self, mock_get_client, cli_runner, mock_client, sample_kb_articles
+    ):
         """Test searching KB articles."""
         mock_get_client.return_value.__enter__.return_value = mock_client
         mock_get_client.return_value.__exit__.return_value = None
         mock_client.search_kb_articles.return_value = sample_kb_articles
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             jsm, ["kb", "search", "--service-desk", "1", "--query", "password"]
         )
         assert result.exit_code == 0
@@ -1117,14 +968,14 @@ class TestAssetListCommand:
     """Tests for asset list command."""
 
     @patch("jira_as.cli.commands.jsm_cmds.get_jira_client")
-    def test_list_assets(self, mock_get_client, runner, mock_client, sample_assets):
+    def test_list_assets(self, mock_get_client, cli_runner, mock_client, sample_assets):
         """Test listing assets."""
         mock_get_client.return_value.__enter__.return_value = mock_client
         mock_get_client.return_value.__exit__.return_value = None
         mock_client.has_assets_license.return_value = True
         mock_client.list_assets.return_value = sample_assets
 
-        result = runner.invoke(jsm, ["asset", "list"])
+        result = cli_runner.invoke(jsm, ["asset", "list"])
         assert result.exit_code == 0
         assert "SRV-001" in result.output
 
@@ -1132,9 +983,9 @@ class TestAssetListCommand:
 class TestAssetCreateCommand:
     """Tests for asset create command."""
 
-    def test_create_asset_dry_run(self, runner):
+    def test_create_asset_dry_run(self, cli_runner):
         """Test creating asset with dry run."""
-        result = runner.invoke(
+        result = cli_runner.invoke(
             jsm,
             [
                 "asset",
@@ -1152,9 +1003,9 @@ class TestAssetCreateCommand:
         assert "DRY RUN" in result.output
         assert "Server1" in result.output
 
-    def test_create_asset_invalid_type_id(self, runner):
+    def test_create_asset_invalid_type_id(self, cli_runner):
         """Test creating asset with invalid type ID."""
-        result = runner.invoke(
+        result = cli_runner.invoke(
             jsm,
             ["asset", "create", "--type-id", "0", "--attr", "Name=Test"],
         )
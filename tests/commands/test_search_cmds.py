@@ -15,7 +15,6 @@ from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
-from click.testing import CliRunner
 
 from jira_as import JiraError
 from jira_as import ValidationError
@@ -51,186 +50,47 @@ from jira_as.cli.commands.search_cmds import _update_filter_impl
 from jira_as.cli.commands.search_cmds import _validate_jql_impl
 from jira_as.cli.commands.search_cmds import search
 
+from ._samples import load_sample
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def mock_client():
-    """Create mock JIRA client with context manager support."""
-    client = MagicMock()
-    client.close = MagicMock()
-    # Support context manager pattern
-    client.__enter__ = MagicMock(return_value=client)
-    client.__exit__ = MagicMock(return_value=False)
-    return client
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_issues():
     """Sample issues for testing."""
-    return [
-        {
-            "key": "TEST-1",
-            "fields": {
-                "summary": "First issue",
-                "status": {"name": "Open"},
-                "priority": {"name": "High"},
-                "issuetype": {"name": "Bug"},
-                "assignee": {"displayName": "John Doe", "accountId": "123"},
-                "reporter": {"displayName": "Jane Smith", "accountId": "456"},
-                "labels": ["bug", "critical"],
-                "created": "2024-01-15T10:00:00.000+0000",
-                "updated": "2024-01-16T15:30:00.000+0000",
-            },
-        },
-        {
-            "key": "TEST-2",
-            "fields": {
-                "summary": "Second issue",
-                "status": {"name": "In Progress"},
-                "priority": {"name": "Medium"},
-                "issuetype": {"name": "Task"},
-                "assignee": None,
-                "reporter": {"displayName": "Jane Smith"},
-                "labels": [],
-            },
-        },
-        {
-            "key": "TEST-3",
-            "fields": {
-                "summary": "Third issue",
-                "status": {"name": "Done"},
-                "priority": {"name": "Low"},
-                "issuetype": {"name": "Story"},
-                "assignee": {"displayName": "Bob Wilson"},
-                "reporter": {"displayName": "John Doe"},
-                "labels": ["feature"],
-            },
-        },
-    ]
+    return load_sample("search/issues.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_filter():
     """Sample filter for testing."""
-    return {
-        "id": "10001",
-        "name": "My Open Issues",
-        "jql": "assignee = currentUser() AND status != Done",
-        "description": "All my open issues",
-        "favourite": True,
-        "owner": {
-            "accountId": "user123",
-            "displayName": "John Doe",
-        },
-        "sharePermissions": [
-            {"type": "project", "project": {"key": "TEST", "name": "Test Project"}},
-        ],
-        "viewUrl": "https://jira.example.com/issues/?filter=10001",
-    }
-
-
-@pytest.fixture
+    return load_sample("search/filter.json")
+
+
+@pytest.fixture(scope="session")
 def sample_filters():
     """Sample filter list for testing."""
-    return [
-        {
-            "id": "10001",
-            "name": "My Open Issues",
-            "jql": "assignee = currentUser() AND status != Done",
-            "favourite": True,
-            "owner": {"displayName": "John Doe"},
-        },
-        {
-            "id": "10002",
-            "name": "All Bugs",
-            "jql": "type = Bug AND status != Done",
-            "favourite": False,
-            "owner": {"displayName": "Jane Smith"},
-        },
-        {
-            "id": "10003",
-            "name": "Sprint Issues",
-            "jql": "sprint in openSprints()",
-            "favourite": True,
-            "owner": {"displayName": "John Doe"},
-        },
-    ]
+    return load_sample("search/filters.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_fields():
     """Sample JQL fields for testing."""
-    return [
-        {
-            "value": "project",
-            "displayName": "Project",
-            "cfid": None,
-            "operators": ["=", "!=", "in", "not in"],
-        },
-        {
-            "value": "status",
-            "displayName": "Status",
-            "cfid": None,
-            "operators": ["=", "!=", "in", "not in", "was", "was in", "changed"],
-        },
-        {
-            "value": "customfield_10001",
-            "displayName": "Story Points",
-            "cfid": "10001",
-            "operators": ["=", "!=", ">", "<", ">=", "<="],
-        },
-        {
-            "value": "customfield_10002",
-            "displayName": "Epic Link",
-            "cfid": "10002",
-            "operators": ["=", "!=", "in", "not in", "is empty", "is not empty"],
-        },
-    ]
-
-
-@pytest.fixture
+    return load_sample("search/fields.json")
+
+
+@pytest.fixture(scope="session")
 def sample_functions():
     """Sample JQL functions for testing."""
-    return [
-        {
-            "value": "currentUser()",
-            "displayName": "currentUser()",
-            "isList": "false",
-            "types": ["com.atlassian.jira.user.ApplicationUser"],
-        },
-        {
-            "value": "openSprints()",
-            "displayName": "openSprints()",
-            "isList": "true",
-            "types": ["com.atlassian.greenhopper.Sprint"],
-        },
-        {
-            "value": "startOfDay()",
-            "displayName": "startOfDay(increment)",
-            "isList": "false",
-            "types": ["java.util.Date"],
-        },
-        {
-            "value": "membersOf(group)",
-            "displayName": "membersOf(groupname)",
-            "isList": "true",
-            "types": ["com.atlassian.jira.user.ApplicationUser"],
-        },
-    ]
-
-
-@pytest.fixture
+    return load_sample("search/functions.json")
+
+
+@pytest.fixture(scope="session")
 def sample_suggestions():
     """Sample suggestions for testing."""
-    return [
-        {"value": "High", "displayName": "High"},
-        {"value": "Medium", "displayName": "Medium"},
-        {"value": "Low", "displayName": "Low"},
-        {"value": "Lowest", "displayName": "Lowest"},
-    ]
+    return load_sample("search/suggestions.json")
 
 
 # =============================================================================
@@ -1303,22 +1163,17 @@ class TestFormattingFunctions:
 class TestSearchCLICommands:
     """Tests for search CLI commands."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.search_cmds.validate_jql")
     def test_query_command(
-        self, mock_validate, mock_get_client, runner, mock_client, sample_issues
+        self, mock_validate, mock_get_client, cli_runner, mock_client, sample_issues
     ):
         """Test search query command."""
         mock_get_client.return_value = mock_client
         mock_validate.return_value = "project = TEST"
         mock_client.search_issues.return_value = {"issues": sample_issues, "total": 3}
 
-        result = runner.invoke(search, ["query", "project = TEST"])
+        result = cli_runner.invoke(search, ["query", "project = TEST"])
 
         assert result.exit_code == 0
         assert "Found 3" in result.output
@@ -1326,63 +1181,63 @@ class TestSearchCLICommands:
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.search_cmds.validate_jql")
     def test_query_command_json(
-        self, mock_validate, mock_get_client, runner, mock_client, sample_issues
+        self, mock_validate, mock_get_client, cli_runner, mock_client, sample_issues
     ):
         """Test search query with JSON output."""
         mock_get_client.return_value = mock_client
         mock_validate.return_value = "project = TEST"
         mock_client.search_issues.return_value = {"issues": sample_issues, "total": 3}
 
-        result = runner.invoke(search, ["query", "project = TEST", "-o", "json"])
+        result = cli_runner.invoke(search, ["query", "project = TEST", "-o", "json"])
 
         assert result.exit_code == 0
         data = json.loads(result.output)
         assert data["total"] == 3
 
-    def test_query_command_no_query(self, runner):
+    def test_query_command_no_query(self, cli_runner):
         """Test search query requires JQL or filter."""
-        result = runner.invoke(search, ["query"])
+        result = cli_runner.invoke(search, ["query"])
 
         assert result.exit_code != 0
         assert "required" in result.output.lower()
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
-    def test_validate_command_valid(self, mock_get_client, runner, mock_client):
+    def test_validate_command_valid(self, mock_get_client, cli_runner, mock_client):
         """Test validate command with valid JQL."""
         mock_get_client.return_value = mock_client
         mock_client.parse_jql.return_value = {
             "queries": [{"query": "project = TEST", "errors": []}]
         }
 
-        result = runner.invoke(search, ["validate", "project = TEST"])
+        result = cli_runner.invoke(search, ["validate", "project = TEST"])
 
         assert result.exit_code == 0
         assert "Valid JQL" in result.output
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
-    def test_validate_command_invalid(self, mock_get_client, runner, mock_client):
+    def test_validate_command_invalid(self, mock_get_client, cli_runner, mock_client):
         """Test validate command with invalid JQL."""
         mock_get_client.return_value = mock_client
         mock_client.parse_jql.return_value = {
             "queries": [{"query": "invalid", "errors": ["Parse error"]}]
         }
 
-        result = runner.invoke(search, ["validate", "invalid"])
+        result = cli_runner.invoke(search, ["validate", "invalid"])
 
         assert result.exit_code == 1
         assert "Invalid JQL" in result.output
 
-    def test_build_command_list_templates(self, runner):
+    def test_build_command_list_templates(self, cli_runner):
         """Test build command listing templates."""
-        result = runner.invoke(search, ["build", "--list-templates"])
+        result = cli_runner.invoke(search, ["build", "--list-templates"])
 
         assert result.exit_code == 0
         assert "Available Templates:" in result.output
         assert "my-open" in result.output
 
-    def test_build_command_with_clauses(self, runner):
+    def test_build_command_with_clauses(self, cli_runner):
         """Test build command with clauses."""
-        result = runner.invoke(
+        result = cli_runner.invoke(
             search,
             [
                 "build",
@@ -1396,9 +1251,9 @@ class TestSearchCLICommands:
         assert result.exit_code == 0
         assert "project = TEST AND status = Open" in result.output
 
-    def test_build_command_with_template(self, runner):
+    def test_build_command_with_template(self, cli_runner):
         """Test build command with template."""
-        result = runner.invoke(search, ["build", "-t", "my-open"])
+        result = cli_runner.invoke(search, ["build", "-t", "my-open"])
 
         assert result.exit_code == 0
         assert "assignee = currentUser()" in result.output
@@ -1406,7 +1261,7 @@ class TestSearchCLICommands:
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.search_cmds.get_autocomplete_cache")
     def test_suggest_command(
-        self, mock_cache, mock_get_client, runner, mock_client, sample_suggestions
+        self, mock_cache, mock_get_client, cli_runner, mock_client, sample_suggestions
     ):
         """Test suggest command."""
         mock_get_client.return_value = mock_client
@@ -1414,7 +1269,7 @@ class TestSearchCLICommands:
         cache.get_suggestions.return_value = sample_suggestions
         mock_cache.return_value = cache
 
-        result = runner.invoke(search, ["suggest", "-f", "priority"])
+        result = cli_runner.invoke(search, ["suggest", "-f", "priority"])
 
         assert result.exit_code == 0
         assert "High" in result.output
@@ -1422,7 +1277,7 @@ class TestSearchCLICommands:
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.search_cmds.get_autocomplete_cache")
     def test_fields_command(
-        self, mock_cache, mock_get_client, runner, mock_client, sample_fields
+        self, mock_cache, mock_get_client, cli_runner, mock_client, sample_fields
     ):
         """Test fields command."""
         mock_get_client.return_value = mock_client
@@ -1430,7 +1285,7 @@ class TestSearchCLICommands:
         cache.get_fields.return_value = sample_fields
         mock_cache.return_value = cache
 
-        result = runner.invoke(search, ["fields"])
+        result = cli_runner.invoke(search, ["fields"])
 
         assert result.exit_code == 0
         assert "project" in result.output
@@ -1438,7 +1293,7 @@ class TestSearchCLICommands:
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     def test_functions_command(
-        self, mock_get_client, runner, mock_client, sample_functions
+        self, mock_get_client, cli_runner, mock_client, sample_functions
     ):
         """Test functions command."""
         mock_get_client.return_value = mock_client
@@ -1446,7 +1301,7 @@ class TestSearchCLICommands:
             "visibleFunctionNames": sample_functions
         }
 
-        result = runner.invoke(search, ["functions"])
+        result = cli_runner.invoke(search, ["functions"])
 
         assert result.exit_code == 0
         assert "currentUser()" in result.output
@@ -1454,14 +1309,14 @@ class TestSearchCLICommands:
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     @patch("jira_as.cli.commands.search_cmds.validate_jql")
     def test_bulk_update_dry_run(
-        self, mock_validate, mock_get_client, runner, mock_client, sample_issues
+        self, mock_validate, mock_get_client, cli_runner, mock_client, sample_issues
     ):
         """Test bulk-update command dry run."""
         mock_get_client.return_value = mock_client
         mock_validate.return_value = "project = TEST"
         mock_client.search_issues.return_value = {"issues": sample_issues, "total": 3}
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             search,
             [
                 "bulk-update",
@@ -1479,25 +1334,22 @@ class TestSearchCLICommands:
 class TestFilterCLICommands:
     """Tests for filter CLI commands."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
-    def test_filter_list_my(self, mock_get_client, runner, mock_client, sample_filters):
+    def test_filter_list_my(
+        self, mock_get_client, cli_runner, mock_client, sample_filters
+    ):
         """Test filter list --my command."""
         mock_get_client.return_value = mock_client
         mock_client.get_my_filters.return_value = sample_filters
 
-        result = runner.invoke(search, ["filter", "list", "--my"])
+        result = cli_runner.invoke(search, ["filter", "list", "--my"])
 
         assert result.exit_code == 0
         assert "My Open Issues" in result.output
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     def test_filter_list_favourites(
-        self, mock_get_client, runner, mock_client, sample_filters
+        self, mock_get_client, cli_runner, mock_client, sample_filters
     ):
         """Test filter list --favourites command."""
         mock_get_client.return_value = mock_client
@@ -1505,27 +1357,27 @@ class TestFilterCLICommands:
             f for f in sample_filters if f["favourite"]
         ]
 
-        result = runner.invoke(search, ["filter", "list", "--favourites"])
+        result = cli_runner.invoke(search, ["filter", "list", "--favourites"])
 
         assert result.exit_code == 0
         assert "My Open Issues" in result.output
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     def test_filter_list_by_id(
-        self, mock_get_client, runner, mock_client, sample_filter
+        self, mock_get_client, cli_runner, mock_client, sample_filter
     ):
         """Test filter list --id command."""
         mock_get_client.return_value = mock_client
         mock_client.get_filter.return_value = sample_filter
 
-        result = runner.invoke(search, ["filter", "list", "--id", "10001"])
+        result = cli_runner.invoke(search, ["filter", "list", "--id", "10001"])
 
         assert result.exit_code == 0
         assert "My Open Issues" in result.output
         assert "Filter Details:" in result.output
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
-    def test_filter_create(self, mock_get_client, runner, mock_client):
+    def test_filter_create(self, mock_get_client, cli_runner, mock_client):
         """Test filter create command."""
         mock_get_client.return_value = mock_client
         mock_client.create_filter.return_value = {
@@ -1534,7 +1386,7 @@ class TestFilterCLICommands:
             "jql": "project = TEST",
         }
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             search,
             [
                 "filter",
@@ -1552,20 +1404,20 @@ class TestFilterCLICommands:
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     def test_filter_run(
-        self, mock_get_client, runner, mock_client, sample_issues, sample_filter
+        self, mock_get_client, cli_runner, mock_client, sample_issues, sample_filter
     ):
         """Test filter run command."""
         mock_get_client.return_value = mock_client
         mock_client.get_filter.return_value = sample_filter
         mock_client.search_issues.return_value = {"issues": sample_issues, "total": 3}
 
-        result = runner.invoke(search, ["filter", "run", "-i", "10001"])
+        result = cli_runner.invoke(search, ["filter", "run", "-i", "10001"])
 
         assert result.exit_code == 0
         assert "Found 3" in result.output
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
-    def test_filter_update(self, mock_get_client, runner, mock_client):
+    def test_filter_update(self, mock_get_client, cli_runner, mock_client):
         """Test filter update command."""
         mock_get_client.return_value = mock_client
         mock_client.update_filter.return_value = {
@@ -1574,7 +1426,7 @@ class TestFilterCLICommands:
             "jql": "project = TEST",
         }
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             search,
             [
                 "filter",
@@ -1589,22 +1441,22 @@ class TestFilterCLICommands:
         assert "Filter updated" in result.output
         assert "Updated Name" in result.output
 
-    def test_filter_update_no_changes(self, runner):
+    def test_filter_update_no_changes(self, cli_runner):
         """Test filter update requires at least one change."""
-        result = runner.invoke(search, ["filter", "update", "10001"])
+        result = cli_runner.invoke(search, ["filter", "update", "10001"])
 
         assert result.exit_code != 0
         assert "required" in result.output.lower()
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     def test_filter_delete_dry_run(
-        self, mock_get_client, runner, mock_client, sample_filter
+        self, mock_get_client, cli_runner, mock_client, sample_filter
     ):
         """Test filter delete dry run."""
         mock_get_client.return_value = mock_client
         mock_client.get_filter.return_value = sample_filter
 
-        result = runner.invoke(search, ["filter", "delete", "10001", "--dry-run"])
+        result = cli_runner.invoke(search, ["filter", "delete", "10001", "--dry-run"])
 
         assert result.exit_code == 0
         assert "Would delete" in result.output
@@ -1612,38 +1464,38 @@ class TestFilterCLICommands:
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     def test_filter_delete_confirmed(
-        self, mock_get_client, runner, mock_client, sample_filter
+        self, mock_get_client, cli_runner, mock_client, sample_filter
     ):
         """Test filter delete with confirmation."""
         mock_get_client.return_value = mock_client
         mock_client.get_filter.return_value = sample_filter
 
-        result = runner.invoke(search, ["filter", "delete", "10001", "--yes"])
+        result = cli_runner.invoke(search, ["filter", "delete", "10001", "--yes"])
 
         assert result.exit_code == 0
         assert "deleted" in result.output
         mock_client.delete_filter.assert_called_once()
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
-    def test_filter_share_list(self, mock_get_client, runner, mock_client):
+    def test_filter_share_list(self, mock_get_client, cli_runner, mock_client):
         """Test filter share --list command."""
         mock_get_client.return_value = mock_client
         mock_client.get_filter_permissions.return_value = [
             {"id": "1", "type": "project"},
         ]
 
-        result = runner.invoke(search, ["filter", "share", "10001", "--list"])
+        result = cli_runner.invoke(search, ["filter", "share", "10001", "--list"])
 
         assert result.exit_code == 0
         assert "permissions" in result.output.lower()
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
-    def test_filter_share_project(self, mock_get_client, runner, mock_client):
+    def test_filter_share_project(self, mock_get_client, cli_runner, mock_client):
         """Test filter share --project command."""
         mock_get_client.return_value = mock_client
         mock_client.add_filter_permission.return_value = {"id": "5", "type": "project"}
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             search, ["filter", "share", "10001", "--project", "TEST"]
         )
 
@@ -1652,26 +1504,26 @@ class TestFilterCLICommands:
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     def test_filter_favourite_add(
-        self, mock_get_client, runner, mock_client, sample_filter
+        self, mock_get_client, cli_runner, mock_client, sample_filter
     ):
         """Test filter favourite --add command."""
         mock_get_client.return_value = mock_client
         mock_client.add_filter_favourite.return_value = sample_filter
 
-        result = runner.invoke(search, ["filter", "favourite", "10001", "--add"])
+        result = cli_runner.invoke(search, ["filter", "favourite", "10001", "--add"])
 
         assert result.exit_code == 0
         assert "added" in result.output.lower()
 
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
     def test_filter_favourite_remove(
-        self, mock_get_client, runner, mock_client, sample_filter
+        self, mock_get_client, cli_runner, mock_client, sample_filter
     ):
         """Test filter favourite --remove command."""
         mock_get_client.return_value = mock_client
         mock_client.get_filter.return_value = sample_filter
 
-        result = runner.invoke(search, ["filter", "favourite", "10001", "--remove"])
+        result = cli_runner.invoke(search, ["filter", "favourite", "10001", "--remove"])
 
         assert result.exit_code == 0
         assert "removed" in result.output.lower()
@@ -1685,13 +1537,8 @@ class TestFilterCLICommands:
 class TestErrorHandling:
     """Tests for error handling."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
-
     @patch("jira_as.cli.commands.search_cmds.get_client_from_context")
-    def test_jira_error_handling(self, mock_get_client, runner):
+    def test_jira_error_handling(self, mock_get_client, cli_runner):
         """Test JiraError is handled properly."""
         mock_client = MagicMock()
         mock_client.__enter__ = MagicMock(return_value=mock_client)
@@ -1699,7 +1546,7 @@ class TestErrorHandling:
         mock_get_client.return_value = mock_client
         mock_client.get_my_filters.side_effect = JiraError("API Error")
 
-        result = runner.invoke(search, ["filter", "list", "--my"])
+        result = cli_runner.invoke(search, ["filter", "list", "--my"])
 
         assert result.exit_code == 1
         assert "API Error" in result.output or "error" in result.output.lower()
@@ -1,12 +1,11 @@
 """Tests for time tracking commands."""
 
+from copy import deepcopy
 from datetime import datetime
 from datetime import timedelta
-from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
-from click.testing import CliRunner
 
 from jira_as import ValidationError
 from jira_as.cli.commands.time_cmds import _add_worklog_impl
@@ -35,114 +34,57 @@ from jira_as.cli.commands.time_cmds import _set_estimate_impl
 from jira_as.cli.commands.time_cmds import _update_worklog_impl
 from jira_as.cli.commands.time_cmds import time
 
+from ._samples import load_sample
+from ._samples import shared
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_worklog():
     """Sample worklog response."""
-    return {
-        "id": "12345",
-        "author": {
-            "accountId": "abc123",
-            "displayName": "John Doe",
-            "emailAddress": "john@example.com",
-        },
-        "timeSpent": "2h",
-        "timeSpentSeconds": 7200,
-        "started": "2025-01-15T09:00:00.000+0000",
-        "comment": {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [{"type": "text", "text": "Working on bug fix"}],
-                }
-            ],
-        },
-        "updated": "2025-01-15T11:00:00.000+0000",
-    }
+    return load_sample("time/worklog.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_worklogs_response(sample_worklog):
     """Sample worklogs list response."""
-    return {
-        "worklogs": [
-            sample_worklog,
-            {
-                "id": "12346",
-                "author": {
-                    "accountId": "def456",
-                    "displayName": "Jane Smith",
-                    "emailAddress": "jane@example.com",
+    return shared(
+        {
+            "worklogs": [
+                sample_worklog,
+                {
+                    "id": "12346",
+                    "author": {
+                        "accountId": "def456",
+                        "displayName": "Jane Smith",
+                        "emailAddress": "jane@example.com",
+                    },
+                    "timeSpent": "4h",
+                    "timeSpentSeconds": 14400,
+                    "started": "2025-01-15T14:00:00.000+0000",
+                    "comment": {},
                 },
-                "timeSpent": "4h",
-                "timeSpentSeconds": 14400,
-                "started": "2025-01-15T14:00:00.000+0000",
-                "comment": {},
-            },
-        ],
-        "startAt": 0,
-        "maxResults": 50,
-        "total": 2,
-    }
+            ],
+            "startAt": 0,
+            "maxResults": 50,
+            "total": 2,
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_time_tracking():
     """Sample time tracking response."""
-    return {
-        "originalEstimate": "2d",
-        "originalEstimateSeconds": 57600,
-        "remainingEstimate": "1d 4h",
-        "remainingEstimateSeconds": 43200,
-        "timeSpent": "4h",
-        "timeSpentSeconds": 14400,
-    }
+    return load_sample("time/time_tracking.json")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_report_entries():
     """Sample report entries."""
-    return [
-        {
-            "issue_key": "PROJ-123",
-            "issue_summary": "Fix login bug",
-            "worklog_id": "12345",
-            "author": "John Doe",
-            "author_email": "john@example.com",
-            "started": "2025-01-15T09:00:00.000+0000",
-            "started_date": "2025-01-15",
-            "time_spent": "2h",
-            "time_seconds": 7200,
-        },
-        {
-            "issue_key": "PROJ-124",
-            "issue_summary": "Add new feature",
-            "worklog_id": "12346",
-            "author": "Jane Smith",
-            "author_email": "jane@example.com",
-            "started": "2025-01-15T14:00:00.000+0000",
-            "started_date": "2025-01-15",
-            "time_spent": "4h",
-            "time_seconds": 14400,
-        },
-    ]
-
-
-@pytest.fixture
-def mock_client():
-    """Create a mock JIRA client with context manager support."""
-    client = MagicMock()
-    client.close = MagicMock()
-    # Support context manager pattern: with get_jira_client() as client:
-    client.__enter__ = MagicMock(return_value=client)
-    client.__exit__ = MagicMock(return_value=None)
-    return client
+    return load_sample("time/report_entries.json")
 
 
 # =============================================================================
@@ -457,8 +399,8 @@ class TestFormatTimeTracking:
 
     def test_with_progress(self, sample_time_tracking):
         """Test formatting with progress."""
-        sample_time_tracking["progress"] = 25
-        result = _format_time_tracking(sample_time_tracking, "PROJ-123")
+        tracking = {**sample_time_tracking, "progress": 25}
+        result = _format_time_tracking(tracking, "PROJ-123")
         assert "Time Tracking for PROJ-123" in result
         assert "Original Estimate:" in result
         assert "Remaining Estimate:" in result
@@ -753,7 +695,7 @@ class TestGetTimeTrackingImpl:
 
     def test_get_time_tracking(self, mock_client, sample_time_tracking):
         """Test getting time tracking info."""
-        mock_client.get_time_tracking.return_value = sample_time_tracking
+        mock_client.get_time_tracking.return_value = deepcopy(sample_time_tracking)
 
         with patch(
             "jira_as.cli.commands.time_cmds.get_jira_client",
@@ -887,7 +829,7 @@ class TestBulkLogTimeImpl:
 class TestTimeLogCommand:
     """Tests for time log command."""
 
-    def test_log_time(self, mock_client, sample_worklog):
+    def test_log_time(self, mock_client, sample_worklog, cli_runner):
         """Test logging time."""
         mock_client.add_worklog.return_value = sample_worklog
 
@@ -895,13 +837,12 @@ class TestTimeLogCommand:
             "jira_as.cli.commands.time_cmds.get_client_from_context",
             return_value=mock_client,
         ):
-            runner = CliRunner()
-            result = runner.invoke(time, ["log", "PROJ-123", "--time", "2h"])
+            result = cli_runner.invoke(time, ["log", "PROJ-123", "--time", "2h"])
 
         assert result.exit_code == 0
         assert "Worklog added" in result.output
 
-    def test_log_time_json(self, mock_client, sample_worklog):
+    def test_log_time_json(self, mock_client, sample_worklog, cli_runner):
         """Test logging time with JSON output."""
         mock_client.add_worklog.return_value = sample_worklog
 
@@ -909,8 +850,7 @@ class TestTimeLogCommand:
             "jira_as.cli.commands.time_cmds.get_client_from_context",
             return_value=mock_client,
         ):
-            runner = CliRunner()
-            result = runner.invoke(
+            result = cli_runner.invoke(
                 time, ["log", "PROJ-123", "--time", "2h", "-o", "json"]
             )
 
@@ -921,7 +861,7 @@ class TestTimeLogCommand:
 class TestTimeWorklogsCommand:
     """Tests for time worklogs command."""
 
-    def test_get_worklogs(self, mock_client, sample_worklogs_response):
+    def test_get_worklogs(self, mock_client, sample_worklogs_response, cli_runner):
         """Test getting worklogs."""
         mock_client.get_worklogs.return_value = sample_worklogs_response
 
@@ -929,8 +869,7 @@ class TestTimeWorklogsCommand:
             "jira_as.cli.commands.time_cmds.get_client_from_context",
             return_value=mock_client,
         ):
-            runner = CliRunner()
-            result = runner.invoke(time, ["worklogs", "PROJ-123"])
+            result = cli_runner.invoke(time, ["worklogs", "PROJ-123"])
 
         assert result.exit_code == 0
         assert "Worklogs for PROJ-123" in result.output
@@ -939,7 +878,7 @@ class TestTimeWorklogsCommand:
 class TestTimeUpdateWorklogCommand:
     """Tests for time update-worklog command."""
 
-    def test_update_worklog(self, mock_client, sample_worklog):
+    def test_update_worklog(self, mock_client, sample_worklog, cli_runner):
         """Test updating worklog."""
         mock_client.update_worklog.return_value = sample_worklog
 
@@ -947,8 +886,7 @@ class TestTimeUpdateWorklogCommand:
             "jira_as.cli.commands.time_cmds.get_client_from_context",
             return_value=mock_client,
         ):
-            runner = CliRunner()
-            result = runner.invoke(
+            result = cli_runner.invoke(
                 time, ["update-worklog", "PROJ-123", "-w", "12345", "-t", "3h"]
             )
 
@@ -959,7 +897,7 @@ class TestTimeUpdateWorklogCommand:
 class TestTimeDeleteWorklogCommand:
     """Tests for time delete-worklog command."""
 
-    def test_delete_worklog_dry_run(self, mock_client, sample_worklog):
+    def test_delete_worklog_dry_run(self, mock_client, sample_worklog, cli_runner):
         """Test dry-run deletion."""
         mock_client.get_worklog.return_value = sample_worklog
 
@@ -967,8 +905,7 @@ class TestTimeDeleteWorklogCommand:
             "jira_as.cli.commands.time_cmds.get_client_from_context",
             return_value=mock_client,
         ):
-            runner = CliRunner()
-            result = runner.invoke(
+            result = cli_runner.invoke(
                 time, ["delete-worklog", "PROJ-123", "-w", "12345", "--dry-run"]
             )
 
@@ -979,7 +916,7 @@ class TestTimeDeleteWorklogCommand:
 class TestTimeEstimateCommand:
     """Tests for time estimate command."""
 
-    def test_set_estimate(self, mock_client, sample_time_tracking):
+    def test_set_estimate(self, mock_client, sample_time_tracking, cli_runner):
         """Test setting estimate."""
         mock_client.get_time_tracking.return_value = sample_time_tracking
 
@@ -987,16 +924,16 @@ class TestTimeEstimateCommand:
             "jira_as.cli.commands.time_cmds.get_client_from_context",
             return_value=mock_client,
         ):
-            runner = CliRunner()
-            result = runner.invoke(time, ["estimate", "PROJ-123", "--original", "2d"])
+            result = cli_runner.invoke(
+                time, ["estimate", "PROJ-123", "--original", "2d"]
+            )
 
         assert result.exit_code == 0
         assert "estimates updated" in result.output
 
-    def test_estimate_requires_option(self):
+    def test_estimate_requires_option(self, cli_runner):
         """Test estimate requires at least one option."""
-        runner = CliRunner()
-        result = runner.invoke(time, ["estimate", "PROJ-123"])
+        result = cli_runner.invoke(time, ["estimate", "PROJ-123"])
         assert result.exit_code != 0
         assert "At least one of" in result.output
 
@@ -1004,16 +941,15 @@ class TestTimeEstimateCommand:
 class TestTimeTrackingCommand:
     """Tests for time tracking command."""
 
-    def test_get_tracking(self, mock_client, sample_time_tracking):
+    def test_get_tracking(self, mock_client, sample_time_tracking, cli_runner):
         """Test getting time tracking."""
-        mock_client.get_time_tracking.return_value = sample_time_tracking
+        mock_client.get_time_tracking.return_value = deepcopy(sample_time_tracking)
 
         with patch(
             "jira_as.cli.commands.time_cmds.get_client_from_context",
             return_value=mock_client,
         ):
-            runner = CliRunner()
-            result = runner.invoke(time, ["tracking", "PROJ-123"])
+            result = cli_runner.invoke(time, ["tracking", "PROJ-123"])
 
         assert result.exit_code == 0
         assert "Time Tracking for PROJ-123" in result.output
@@ -1022,7 +958,7 @@ class TestTimeTrackingCommand:
 class TestTimeReportCommand:
     """Tests for time report command."""
 
-    def test_generate_report(self, mock_client):
+    def test_generate_report(self, mock_client, cli_runner):
         """Test generating report."""
         mock_client.search_issues.return_value = {"issues": []}
 
@@ -1030,8 +966,7 @@ class TestTimeReportCommand:
             "jira_as.cli.commands.time_cmds.get_client_from_context",
             return_value=mock_client,
         ):
-            runner = CliRunner()
-            result = runner.invoke(time, ["report", "--project", "PROJ"])
+            result = cli_runner.invoke(time, ["report", "--project", "PROJ"])
 
         assert result.exit_code == 0
         assert "Time Report" in result.output
@@ -1040,7 +975,7 @@ class TestTimeReportCommand:
 class TestTimeExportCommand:
     """Tests for time export command."""
 
-    def test_export_csv(self, mock_client):
+    def test_export_csv(self, mock_client, cli_runner):
         """Test exporting CSV."""
         mock_client.search_issues.return_value = {"issues": []}
 
@@ -1048,8 +983,7 @@ class TestTimeExportCommand:
             "jira_as.cli.commands.time_cmds.get_client_from_context",
             return_value=mock_client,
         ):
-            runner = CliRunner()
-            result = runner.invoke(time, ["export", "--project", "PROJ"])
+            result = cli_runner.invoke(time, ["export", "--project", "PROJ"])
 
         assert result.exit_code == 0
         assert "Issue Key" in result.output
@@ -1058,7 +992,7 @@ class TestTimeExportCommand:
 class TestTimeBulkLogCommand:
     """Tests for time bulk-log command."""
 
-    def test_bulk_log_dry_run(self, mock_client):
+    def test_bulk_log_dry_run(self, mock_client, cli_runner):
         """Test dry-run bulk logging."""
         mock_client.get_issue.return_value = {
             "key": "PROJ-1",
@@ -1069,25 +1003,22 @@ class TestTimeBulkLogCommand:
             "jira_as.cli.commands.time_cmds.get_client_from_context",
             return_value=mock_client,
         ):
-            runner = CliRunner()
-            result = runner.invoke(
+            result = cli_runner.invoke(
                 time, ["bulk-log", "-i", "PROJ-1,PROJ-2", "-t", "30m", "--dry-run"]
             )
 
         assert result.exit_code == 0
         assert "Preview" in result.output
 
-    def test_bulk_log_requires_issues_or_jql(self):
+    def test_bulk_log_requires_issues_or_jql(self, cli_runner):
         """Test bulk-log requires issues or JQL."""
-        runner = CliRunner()
-        result = runner.invoke(time, ["bulk-log", "-t", "30m"])
+        result = cli_runner.invoke(time, ["bulk-log", "-t", "30m"])
         assert result.exit_code != 0
         assert "Either --jql or --issues" in result.output
 
-    def test_bulk_log_mutually_exclusive(self):
+    def test_bulk_log_mutually_exclusive(self, cli_runner):
         """Test issues and JQL are mutually exclusive."""
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             time, ["bulk-log", "-i", "PROJ-1", "-j", "project=PROJ", "-t", "30m"]
         )
         assert result.exit_code != 0
@@ -0,0 +1,167 @@
+"""
+Tests for mock base client helpers.
+"""
+
+import pytest
+
+from jira_as.mock.base import is_mock_mode
+
+
+@pytest.fixture
+def clear_mock_mode_cache():
+    """Clear the cached mock mode flag before and after each test."""
+    is_mock_mode.cache_clear()
+    yield
+    is_mock_mode.cache_clear()
+
+
+@pytest.mark.usefixtures("clear_mock_mode_cache")
+class TestIsMockMode:
+    """Test is_mock_mode environment detection."""
+
+    def test_enabled(self, monkeypatch):
+        """Test mock mode is enabled when env var is 'true'."""
+        monkeypatch.setenv("JIRA_MOCK_MODE", "TRUE")
+
+        assert is_mock_mode() is True
+
+    def test_disabled_when_unset(self, monkeypatch):
+        """Test mock mode is disabled when env var is not set."""
+        monkeypatch.delenv("JIRA_MOCK_MODE", raising=False)
+
+        assert is_mock_mode() is False
+
+    def test_result_is_cached(self, monkeypatch):
+        """Test env var changes are ignored until the cache is cleared."""
+        monkeypatch.setenv("JIRA_MOCK_MODE", "true")
+        assert is_mock_mode() is True
+
+        monkeypatch.setenv("JIRA_MOCK_MODE", "false")
+        assert is_mock_mode() is True
+
+        is_mock_mode.cache_clear()
+        assert is_mock_mode() is False
+
+
+class TestMockClientSlots:
+    """Test mock clients are slotted."""
+
+    def test_no_instance_dict(self):
+        """Test composed clients do not allocate a per-instance __dict__."""
+        from jira_as.mock import MockJiraClient
+
+        assert not hasattr(MockJiraClient(), "__dict__")
+
+    def test_lazy_mixin_state(self):
+        """Test mixins can lazily create their state attributes."""
+        from jira_as.mock import MockJiraClient
+
+        client = MockJiraClient()
+        client.add_watcher("DEMO-84", "def456")
+
+        watchers = client.get_watchers("DEMO-84")["watchers"]
+        assert [w["accountId"] for w in watchers] == ["def456"]
+
+
+class TestQueueBuckets:
+    """Test DEMOSD queue buckets stay in sync with issue mutations."""
+
+    def test_seed_issues_are_unassigned(self):
+        """Test seed DEMOSD issues land in the unassigned queue."""
+        from jira_as.mock import MockJiraClient
+
+        client = MockJiraClient()
+
+        result = client.get_queue_issues(1, 3)
+        assert result["size"] == 5
+        assert result["isLastPage"] is True
+
+    def test_assign_moves_issue_between_queues(self):
+        """Test assigning an issue moves it to the assigned-to-me queue."""
+        from jira_as.mock import MockJiraClient
+
+        client = MockJiraClient()
+        client.assign_issue("DEMOSD-1", "abc123")
+
+        assigned = client.get_queue_issues(1, 2)
+        unassigned = client.get_queue_issues(1, 3)
+        assert [i["key"] for i in assigned["values"]] == ["DEMOSD-1"]
+        assert "DEMOSD-1" not in [i["key"] for i in unassigned["values"]]
+
+    def test_reassignment_keeps_issue_order(self):
+        """Test queues list issues in key order, not reassignment order."""
+        from jira_as.mock import MockJiraClient
+
+        client = MockJiraClient()
+        client.assign_issue("DEMOSD-4", "abc123")
+        client.assign_issue("DEMOSD-2", "abc123")
+        client.update_issue("DEMOSD-1", fields={"assignee": {"accountId": "abc123"}})
+        client.update_issue("DEMOSD-1", fields={"assignee": None})
+
+        assigned = client.get_queue_issues(1, 2)
+        unassigned = client.get_queue_issues(1, 3)
+        assert [i["key"] for i in assigned["values"]] == ["DEMOSD-2", "DEMOSD-4"]
+        assert [i["key"] for i in unassigned["values"]] == [
+            "DEMOSD-1",
+            "DEMOSD-3",
+            "DEMOSD-5",
+        ]
+
+    def test_non_demosd_changes_leave_buckets_alone(self):
+        """Test mutations outside DEMOSD do not touch the queues."""
+        from jira_as.mock import MockJiraClient
+
+        client = MockJiraClient()
+        client.assign_issue("DEMO-84", "abc123")
+
+        assert client.get_queue_issues(1, 2)["size"] == 0
+        assert client.get_queue_issues(1, 1)["size"] == 5
+
+    def test_created_and_deleted_requests(self):
+        """Test new requests join the queues and deleted ones leave them."""
+        from jira_as.mock import MockJiraClient
+
+        client = MockJiraClient()
+        created = client.create_request("1", "1", {"summary": "Printer on fire"})
+        assert client.get_queue_issues(1, 1)["size"] == 6
+
+        client.delete_issue(created["issueKey"])
+        assert client.get_queue_issues(1, 1)["size"] == 5
+
+
+class TestWatchers:
+    """Test watcher storage in the collaborate mixin."""
+
+    def test_watchers_deduplicated_and_removable(self):
+        """Test watchers are unique per account and can be removed."""
+        from jira_as.mock import MockJiraClient
+
+        client = MockJiraClient()
+        client.add_watcher("DEMO-84", "def456")
+        client.add_watcher("DEMO-84", "def456")
+        client.add_watcher("DEMO-84", "xyz789")
+        client.remove_watcher("DEMO-84", "def456")
+
+        watchers = client.get_watchers("DEMO-84")
+        assert watchers["watchCount"] == 1
+        assert watchers["watchers"][0]["displayName"] == "Unknown User"
+
+
+class TestFieldsRouting:
+    """Test low-level GET routing in the fields mixin."""
+
+    def test_field_by_id(self):
+        """Test /field/{id} routes to get_field."""
+        from jira_as.mock import MockJiraClient
+        from jira_as.mock.mixins import FieldsMixin
+
+        client = MockJiraClient()
+        field = FieldsMixin.get(client, "/rest/api/3/field/summary")
+        assert field["name"] == "Summary"
+
+    def test_screen_paths_not_routed(self):
+        """Test screen paths still return the generic empty response."""
+        from jira_as.mock import MockJiraClient
+
+        client = MockJiraClient()
+        assert client.get("/rest/api/2/screens/1/tabs") == {}
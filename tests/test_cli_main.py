@@ -11,6 +11,12 @@ from jira_as.cli.main import cli
 from jira_as.cli.main import get_version
 
 
+@pytest.fixture(scope="module")
+def runner():
+    """CLI runner shared by the module; each invoke() is isolated."""
+    return CliRunner()
+
+
 class TestGetVersion:
     """Test version retrieval function."""
 
@@ -33,11 +39,6 @@ class TestGetVersion:
 class TestCliGroup:
     """Test the main CLI group."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI runner."""
-        return CliRunner()
-
     @pytest.fixture
     def clean_env(self):
         """Clean up JIRA environment variables after test."""
@@ -106,11 +107,6 @@ class TestCliGroup:
 class TestSubcommands:
     """Test that subcommands are registered."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI runner."""
-        return CliRunner()
-
     def test_issue_command_registered(self, runner):
         """Test issue subcommand is available."""
         result = runner.invoke(cli, ["issue", "--help"])
@@ -710,6 +710,19 @@ class TestSprintOperations:
         body = json.loads(responses.calls[0].request.body)
         assert body["issues"] == ["TEST-1", "TEST-2"]
 
+    @responses.activate
+    def test_move_issues_to_backlog(self, client, base_url):
+        """Test moving issues to backlog."""
+        responses.add(
+            responses.POST,
+            f"{base_url}/rest/agile/1.0/backlog/issue",
+            status=204,
+        )
+
+        client.move_issues_to_backlog(["TEST-1", "TEST-2"])
+        body = json.loads(responses.calls[0].request.body)
+        assert body["issues"] == ["TEST-1", "TEST-2"]
+
 
 class TestBoardOperations:
     """Tests for board operations."""
@@ -910,6 +923,10 @@ class TestFileOperations:
                 "/rest/api/3/issue/TEST-1/attachments", temp_path
             )
             assert result[0]["filename"] == "test.txt"
+            request = responses.calls[0].request
+            assert request.headers["Content-Type"].startswith("multipart/form-data")
+            assert request.headers["X-Atlassian-Token"] == "no-check"
+            assert "Authorization" in request.headers
         finally:
             os.unlink(temp_path)
 
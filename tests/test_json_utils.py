@@ -0,0 +1,108 @@
+"""
+Tests for json_utils module.
+"""
+
+import json
+from datetime import date
+from datetime import datetime
+from enum import Enum
+
+import pytest
+
+from jira_as import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test against both JSON backends."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", False)
+    return request.param
+
+
+@pytest.mark.usefixtures("backend")
+class TestJsonUtils:
+    """Tests for dumps/loads across backends."""
+
+    def test_indent_matches_stdlib(self):
+        """Test pretty-printed output matches json.dumps(indent=2)."""
+        data = {"key": "TEST-1", "fields": {"labels": ["a", "b"], "points": 3.5}}
+
+        assert json_utils.dumps(data, indent=True) == json.dumps(data, indent=2)
+
+    def test_non_serializable_values_use_str(self):
+        """Test unknown values and non-string keys are still serialized."""
+        result = json.loads(json_utils.dumps({1: date(2024, 1, 15)}))
+
+        assert result == {"1": "2024-01-15"}
+
+    def test_datetime_matches_stdlib(self):
+        """Test datetimes use str(), not orjson's ISO "T" format."""
+        data = {"created": datetime(2024, 1, 15, 10, 30)}
+
+        result = json_utils.dumps(data, indent=True)
+
+        assert result == json.dumps(data, indent=2, default=str)
+        assert "2024-01-15 10:30:00" in result
+
+    def test_non_ascii_kept_as_utf8(self):
+        """Test non-ASCII text is written as UTF-8, like jira_as.format_json."""
+        data = {"summary": "Café ✓"}
+
+        result = json_utils.dumps(data, indent=True)
+
+        assert result == json.dumps(data, indent=2, ensure_ascii=False)
+        assert '"Café ✓"' in result
+
+    def test_ensure_ascii_escapes(self):
+        """Test ensure_ascii escapes non-ASCII text."""
+        result = json_utils.dumps({"summary": "Café ✓"}, ensure_ascii=True)
+
+        assert result == '{"summary":"Caf\\u00e9 \\u2713"}'
+
+    def test_compact_has_no_spaces(self):
+        """Test compact output omits spaces after separators."""
+        result = json_utils.dumps({"key": "TEST-1", "labels": ["a", "b"], "n": None})
+
+        assert result == '{"key":"TEST-1","labels":["a","b"],"n":null}'
+
+    def test_floats_round_trip(self):
+        """Test small and fractional floats decode to the same values."""
+        data = {"n": 1e-7, "f": 0.1, "big": 1.5e300}
+
+        assert json.loads(json_utils.dumps(data)) == data
+
+    def test_nan(self, backend):
+        """Test NaN is NaN with the stdlib and null with orjson."""
+        expected = "null" if backend == "orjson" else "NaN"
+
+        assert json_utils.dumps({"x": float("nan")}) == f'{{"x":{expected}}}'
+
+    def test_enum(self, backend):
+        """Test Enum members use str() with the stdlib and the value with orjson."""
+
+        class Color(Enum):
+            RED = "red"
+
+        expected = '"red"' if backend == "orjson" else '"Color.RED"'
+
+        assert json_utils.dumps({"c": Color.RED}) == f'{{"c":{expected}}}'
+
+    def test_loads_bytes(self):
+        """Test decoding UTF-8 response bodies."""
+        assert json_utils.loads(b'{"total": 2}') == {"total": 2}
+
+    def test_loads_invalid(self):
+        """Test invalid documents raise JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads(b"")
+
+
+def test_ensure_ascii_skips_orjson(monkeypatch):
+    """Test ensure_ascii goes straight to the stdlib without trying orjson."""
+    monkeypatch.setattr(json_utils, "ORJSON_AVAILABLE", True)
+    monkeypatch.setattr(json_utils, "orjson", None, raising=False)
+
+    assert json_utils.dumps({"s": "é"}, ensure_ascii=True) == '{"s":"\\u00e9"}'